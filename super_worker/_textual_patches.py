@@ -13,23 +13,50 @@ from textual._xterm_parser import XTermParser as _XTermParser
 # processing legacy ESC+<key> sequences.  _sequence_to_key_events only
 # applies "alt+" to single-character key names (len(name)==1).
 #
+# The patch is only installed when a probe shows the installed Textual still
+# has the bug, so upgraded Textual keeps its unwrapped parser path.
+#
 # TODO: File upstream issue with Textual and replace this patch when fixed.
 # ---------------------------------------------------------------------------
+_ALT = "alt+"
 _original_seq_to_key = getattr(_XTermParser, "_sequence_to_key_events", None)
 
 if callable(_original_seq_to_key) and not getattr(_original_seq_to_key, "_sw_patched", False):
     _accepts_alt = "alt" in inspect.signature(_original_seq_to_key).parameters
 
-    def _patched_seq_to_key(self, sequence, alt=False):
+    def _upstream_drops_alt() -> bool:
+        """Return True if Textual still emits a bare "enter" for ESC+Enter."""
+        if not _accepts_alt:
+            return True
+        try:
+            events_iter = _original_seq_to_key(_XTermParser(), "\r", alt=True)
+            return not any(ev.key.startswith(_ALT) for ev in events_iter)
+        except Exception:
+            return True
+
+    # alt=False is by far the common case, so it gets a pass-through with no
+    # per-event rewriting; only the alt path wraps the original generator.
+    # Globals are bound as default arguments so per-event lookups are locals.
+    def _seq_to_key_noalt(self, sequence, _orig=_original_seq_to_key):
+        return _orig(self, sequence)
+
+    # Textual sorts modifier tokens, so "alt+" is always a prefix when present.
+    def _seq_to_key_alt(self, sequence, _Key=_events.Key, _alt=_ALT, _orig=_original_seq_to_key):
         if _accepts_alt:
-            events_iter = _original_seq_to_key(self, sequence, alt=alt)
+            events_iter = _orig(self, sequence, alt=True)
         else:
-            events_iter = _original_seq_to_key(self, sequence)
+            events_iter = _orig(self, sequence)
         for ev in events_iter:
-            if alt and "alt+" not in ev.key:
-                yield _events.Key(f"alt+{ev.key}", ev.character)
+            if not ev.key.startswith(_alt):
+                # Key is a Message, not a dataclass/NamedTuple: there is no
+                # cheaper field-replace path than constructing a new event.
+                yield _Key(_alt + ev.key, ev.character)
             else:
                 yield ev
 
+    def _patched_seq_to_key(self, sequence, alt=False, _with_alt=_seq_to_key_alt, _without_alt=_seq_to_key_noalt):
+        return _with_alt(self, sequence) if alt else _without_alt(self, sequence)
+
     _patched_seq_to_key._sw_patched = True
-    _XTermParser._sequence_to_key_events = _patched_seq_to_key
+    if _upstream_drops_alt():
+        _XTermParser._sequence_to_key_events = _patched_seq_to_key
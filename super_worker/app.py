@@ -1,22 +1,37 @@
 import asyncio
+import functools
 import logging
 import platform
 import shlex
 import shutil
 import subprocess
+import sys
+import time
 import webbrowser
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
+from typing import TypeVar
 
 import git as gitpython
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal
+from textual.message import Message
+from textual.css.query import NoMatches
+from textual.timer import Timer
 from textual.widgets import Footer, Header, Static, TabPane, TabbedContent
 
-from super_worker.config import ResolvedConfig, SWConfig, load_config, save_project_config
-from super_worker.constants import DEFAULT_WORKTREE_NAME, SIDEBAR_REFRESH_S
-from super_worker.models import Worktree
+from super_worker.config import ResolvedConfig, SWConfig, load_config, load_toml, save_project_config
+from super_worker.constants import (
+    BACKGROUND_REFRESH_EVERY,
+    DEFAULT_WORKTREE_NAME,
+    REFRESH_MAX_FAILURES,
+    SIDEBAR_REFRESH_MAX_S,
+    SIDEBAR_REFRESH_S,
+)
+from super_worker.models import Session, Worktree
 from super_worker.screens import (
     BranchExistsScreen,
     CommitMessageScreen,
@@ -43,6 +58,7 @@ from super_worker.services.worktree import (
     create_worktree,
     get_branch_status,
     get_current_branch,
+    get_git_status,
     get_worktree_dirty,
     invalidate_git_cache,
     remove_worktree,
@@ -52,6 +68,40 @@ from super_worker.widgets.terminal_pane import TerminalPane
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _to_thread_fast(func: Callable[..., T], *args: object, executor: Executor | None = None) -> asyncio.Future[T]:
+    """Run func in an executor (default: the loop's) without to_thread's context copy.
+
+    For hot refresh paths whose thread work never reads contextvars.
+    """
+    return asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+
+def _is_gh_auth_error(stderr: str) -> bool:
+    """Whether gh failed because no usable GitHub credentials are configured."""
+    text = stderr.lower()
+    return "gh auth login" in text or "not logged" in text or "authentication" in text
+
+
+_ATTENTION_STATES = (SessionState.WAITING_INPUT, SessionState.WAITING_APPROVAL)
+
+
+@functools.lru_cache(maxsize=8)
+def _which(name: str) -> str | None:
+    """shutil.which, cached: the terminals on PATH don't change while the app runs."""
+    return shutil.which(name)
+
+
+class SessionCreated(Message):
+    """Fired when a worktree tab creates its default session."""
+
+    def __init__(self, worktree: Worktree, session: Session) -> None:
+        self.worktree = worktree
+        self.session = session
+        super().__init__()
+
 
 class WorktreeTabContent(Horizontal):
     """Content for a single worktree tab: sidebar + terminal."""
@@ -63,14 +113,17 @@ class WorktreeTabContent(Horizontal):
     }
     """
 
-    def __init__(self, worktree: Worktree, remote: str = "origin", main_branch: str = "main") -> None:
+    def __init__(
+        self, worktree: Worktree, remote: str = "origin", main_branch: str = "main", show_dirty: bool = True,
+    ) -> None:
         super().__init__(id=f"wtc-{worktree.name}")
         self.worktree = worktree
         self._remote = remote
         self._main_branch = main_branch
+        self._show_dirty = show_dirty
 
     def compose(self) -> ComposeResult:
-        yield SessionSidebar(remote=self._remote, main_branch=self._main_branch)
+        yield SessionSidebar(remote=self._remote, main_branch=self._main_branch, show_dirty=self._show_dirty)
         yield TerminalPane()
 
     def on_mount(self) -> None:
@@ -79,19 +132,33 @@ class WorktreeTabContent(Horizontal):
             if not self.worktree.sessions:
                 session = await asyncio.to_thread(create_session, self.worktree)
                 self.worktree.sessions.append(session)
+                self.post_message(SessionCreated(self.worktree, session))
 
             session_names = [s.tmux_session_name for s in self.worktree.sessions]
-            states = await asyncio.to_thread(batch_detect_session_states, session_names) if session_names else {}
-            status = await asyncio.to_thread(get_branch_status, self.worktree.path, self._remote, self._main_branch)
-            dirty = await asyncio.to_thread(get_worktree_dirty, self.worktree.path)
-            sidebar = self.query_one(SessionSidebar)
-            sidebar.show_worktree(self.worktree, states=states, git_status=status, git_dirty=dirty)
-
-            # Activate the first session in the terminal
-            if self.worktree.sessions:
-                first = self.worktree.sessions[0]
-                terminal = self.query_one(TerminalPane)
-                terminal.active_session = first.tmux_session_name
+            # Reuse the app's last periodic detection when it covers every session
+            cached = self.app.get_cached_session_states()
+            if all(name in cached for name in session_names):
+                states_fetch = asyncio.sleep(0, result={name: cached[name] for name in session_names})
+            else:
+                states_fetch = asyncio.to_thread(batch_detect_session_states, session_names)
+            states, status, dirty = await asyncio.gather(
+                states_fetch,
+                asyncio.to_thread(get_branch_status, self.worktree.path, self._remote, self._main_branch),
+                asyncio.to_thread(get_worktree_dirty, self.worktree.path)
+                if self._show_dirty else asyncio.sleep(0, result=False),
+            )
+            try:
+                sidebar = self.query_one(SessionSidebar)
+                sidebar.show_worktree(self.worktree, states=states, git_status=status, git_dirty=dirty)
+
+                # Activate the first session in the terminal
+                if self.worktree.sessions:
+                    first = self.worktree.sessions[0]
+                    terminal = self.query_one(TerminalPane)
+                    terminal.active_session = first.tmux_session_name
+            except NoMatches:
+                # Tab was torn down (app exit, project switch) while fetching
+                logger.debug("Worktree tab removed before sidebar init", extra={"worktree": self.worktree.name})
 
         self.app.run_worker(_init_sidebar, exclusive=False)
 
@@ -139,76 +206,187 @@ class SuperWorkerApp(App):
         self._active_worktree: Worktree | None = None
         self._active_session_name: str | None = None
         self._cached_session_states: dict[str, SessionState] = {}
+        # Worktree name -> whether any of its sessions is waiting on the user
+        self._attention: dict[str, bool] = {}
+        self._git_data: dict[str, tuple[dict, bool]] = {}
+        # Last inputs pushed to each sidebar / label shown on each tab, to skip no-op re-renders
+        self._sidebar_fp: dict[str, int] = {}
+        self._tab_labels: dict[str, str] = {}
+        self._refresh_tick = 0
+        self._refresh_timer: Timer | None = None
+        self._refresh_failures = 0
+        self._repo_cache: dict[str, gitpython.Repo] = {}
+        self._focused = True
+        # Whichever of the tab strip / empty-state placeholder is mounted, kept in sync on swap
+        self._tabs: TabbedContent | None = None
+        self._empty: Static | None = None
+        # Git status runs on its own pool so slow repos can't starve tmux detection
+        self._git_pool = ThreadPoolExecutor(
+            max_workers=max(4, 2 * len(self._state.worktrees)), thread_name_prefix="git",
+        )
 
     def _ensure_default_worktree(self) -> None:
-        """Ensure a default worktree entry exists for the main repo checkout."""
+        """Ensure a default worktree entry exists for the main repo checkout.
+
+        Its first session is created by the worktree tab once mounted, so tmux
+        startup doesn't delay the first frame.
+        """
         existing = self._state.get_worktree(DEFAULT_WORKTREE_NAME)
         if existing:
             existing.branch = get_current_branch(str(self._config.repo_root))
-            if not existing.sessions:
-                session = create_session(existing)
-                existing.sessions.append(session)
-                save_state(self._state, self._config)
             return
 
         branch = get_current_branch(str(self._config.repo_root))
         wt = Worktree(name=DEFAULT_WORKTREE_NAME, path=str(self._config.repo_root), branch=branch)
-        session = create_session(wt)
-        wt.sessions.append(session)
         self._state.worktrees.insert(0, wt)
         save_state(self._state, self._config)
 
     def compose(self) -> ComposeResult:
         yield Header()
         if self._state.worktrees:
-            with TabbedContent(id="tabs"):
+            self._tabs = TabbedContent(id="tabs")
+            with self._tabs:
                 for wt in self._state.worktrees:
                     with TabPane(self._tab_label(wt), id=f"wt-{wt.name}"):
-                        yield WorktreeTabContent(wt, self._config.remote, self._config.main_branch)
+                        yield WorktreeTabContent(wt, self._config.remote, self._config.main_branch, self._config.show_dirty)
         else:
-            yield Static("No worktrees. Press Ctrl+N to create one.", id="empty-state")
+            self._empty = Static("No worktrees. Press Ctrl+N to create one.", id="empty-state")
+            yield self._empty
         yield Footer()
 
     def on_mount(self) -> None:
         if self._state.worktrees:
             self._set_active_worktree(self._state.worktrees[0])
-        self.set_interval(SIDEBAR_REFRESH_S, self._periodic_refresh)
+        self._schedule_refresh(SIDEBAR_REFRESH_S)
+
+    def on_unmount(self) -> None:
+        self._git_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule_refresh(self, delay: float) -> None:
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(delay, self._periodic_refresh)
 
     def _periodic_refresh(self) -> None:
         """Kick off async refresh to avoid blocking the UI thread."""
+        if not self._focused and not self._config.refresh_if_hidden:
+            # Nobody is looking; keep the timer alive but skip the git/tmux work
+            self._schedule_refresh(SIDEBAR_REFRESH_S)
+            return
         self.run_worker(self._do_periodic_refresh, exclusive=True, name="periodic-refresh")
 
     async def _do_periodic_refresh(self) -> None:
-        """Fetch all blocking data in threads, then update UI."""
-        all_session_names = [s.tmux_session_name for wt in self._state.worktrees for s in wt.sessions]
-        if all_session_names:
-            self._cached_session_states = await asyncio.to_thread(batch_detect_session_states, all_session_names)
-        else:
-            self._cached_session_states = {}
+        """Fetch all blocking data in threads, update UI, then schedule the next run.
 
-        git_data: dict[str, tuple[dict, bool]] = {}
-        if self._state.worktrees:
-            tasks = []
-            for wt in self._state.worktrees:
-                tasks.append(asyncio.to_thread(get_branch_status, wt.path, self._config.remote, self._config.main_branch))
-                tasks.append(asyncio.to_thread(get_worktree_dirty, wt.path))
-            results = await asyncio.gather(*tasks)
-            for i, wt in enumerate(self._state.worktrees):
-                git_data[wt.name] = (results[i * 2], results[i * 2 + 1])
+        Slow runs push the next one out to 1.5x their duration (capped at
+        SIDEBAR_REFRESH_MAX_S); after REFRESH_MAX_FAILURES failures in a row
+        polling pauses until the next tab switch.
+        """
+        start = time.monotonic()
+        try:
+            await self._fetch_refresh_data()
+        except Exception:
+            self._refresh_failures += 1
+            logger.warning("Periodic refresh failed", exc_info=True, extra={"failures": self._refresh_failures})
+            if self._refresh_failures >= REFRESH_MAX_FAILURES:
+                logger.warning("Pausing periodic refresh after repeated failures")
+                if self._refresh_timer is not None:
+                    self._refresh_timer.stop()
+                    self._refresh_timer = None
+                return
+        else:
+            self._refresh_failures = 0
+            self._update_refreshed_ui()
+        elapsed = time.monotonic() - start
+        self._schedule_refresh(min(max(SIDEBAR_REFRESH_S, 1.5 * elapsed), SIDEBAR_REFRESH_MAX_S))
+
+    def on_app_blur(self) -> None:
+        self._focused = False
+
+    def on_app_focus(self) -> None:
+        was_focused, self._focused = self._focused, True
+        # A tripped circuit breaker stays tripped until a tab switch resets it
+        if (
+            not was_focused
+            and not self._config.refresh_if_hidden
+            and self._refresh_failures < REFRESH_MAX_FAILURES
+        ):
+            self._periodic_refresh()
+
+    def get_cached_session_states(self) -> dict[str, SessionState]:
+        """Session states from the last periodic refresh, keyed by tmux session name."""
+        return self._cached_session_states
+
+    def _reset_circuit_breaker(self) -> None:
+        """Resume periodic refresh if it was paused by repeated failures."""
+        if self._refresh_failures >= REFRESH_MAX_FAILURES:
+            self._refresh_failures = 0
+            self._periodic_refresh()
+
+    async def _fetch_refresh_data(self) -> None:
+        """Fetch session states and git status in threads."""
+        all_session_names = [s.tmux_session_name for wt in self._state.worktrees for s in wt.sessions]
 
-        if self._active_worktree:
-            try:
-                wtc = self.query_one(f"#wtc-{self._active_worktree.name}", WorktreeTabContent)
-                sidebar = wtc.query_one(SessionSidebar)
-                gd = git_data.get(self._active_worktree.name)
-                sidebar.show_worktree(
-                    self._active_worktree,
-                    states=self._cached_session_states,
-                    git_status=gd[0] if gd else None,
-                    git_dirty=gd[1] if gd else None,
+        # Only the active worktree is polled every tick; background ones every Nth tick
+        refresh_all = self._refresh_tick % BACKGROUND_REFRESH_EVERY == 0
+        self._refresh_tick += 1
+        to_refresh = [
+            wt for wt in self._state.worktrees
+            if refresh_all or wt is self._active_worktree or wt.name not in self._git_data
+        ]
+        # tmux state detection overlaps the git jobs; one job per worktree so their
+        # git subprocesses overlap too, bounded by the pool size
+        states, results = await asyncio.gather(
+            _to_thread_fast(batch_detect_session_states, all_session_names)
+            if all_session_names else asyncio.sleep(0, result={}),
+            asyncio.gather(*(
+                _to_thread_fast(
+                    get_git_status,
+                    wt.path,
+                    self._config.remote,
+                    self._config.main_branch,
+                    self._config.show_dirty,
+                    executor=self._git_pool,
                 )
-            except Exception:
-                logger.debug("Failed to refresh active worktree sidebar", exc_info=True)
+                for wt in to_refresh
+            )),
+        )
+        self._cached_session_states = states
+        self._attention = {
+            wt.name: any(
+                states.get(s.tmux_session_name, SessionState.RUNNING) in _ATTENTION_STATES for s in wt.sessions
+            )
+            for wt in self._state.worktrees
+        }
+        for wt, git_data in zip(to_refresh, results):
+            self._git_data[wt.name] = git_data
+
+    def _update_refreshed_ui(self) -> None:
+        """Push the last fetched session states and git status into the UI."""
+        git_data = self._git_data
+        wt = self._active_worktree
+        if wt:
+            gd = git_data.get(wt.name)
+            fp = hash((
+                wt.branch,
+                tuple((s.id, s.label) for s in wt.sessions),
+                tuple(sorted(self._cached_session_states.items())),
+                gd and tuple(sorted(gd[0].items())),
+                gd and gd[1],
+            ))
+            if fp != self._sidebar_fp.get(wt.name):
+                try:
+                    wtc = self.query_one(f"#wtc-{wt.name}", WorktreeTabContent)
+                    sidebar = wtc.query_one(SessionSidebar)
+                    sidebar.show_worktree(
+                        wt,
+                        states=self._cached_session_states,
+                        git_status=gd[0] if gd else None,
+                        git_dirty=gd[1] if gd else None,
+                    )
+                    self._sidebar_fp[wt.name] = fp
+                except Exception:
+                    logger.debug("Failed to refresh active worktree sidebar", exc_info=True)
         for wt in self._state.worktrees:
             self._refresh_tab_label(wt, git_data=git_data.get(wt.name))
 
@@ -218,14 +396,8 @@ class SuperWorkerApp(App):
         else:
             # Return simple label — periodic refresh will update with git data
             return wt.name
-        dirty_marker = " *" if dirty else ""
-        attention = ""
-        cached = self._cached_session_states
-        for s in wt.sessions:
-            state = cached.get(s.tmux_session_name, SessionState.RUNNING)
-            if state in (SessionState.WAITING_INPUT, SessionState.WAITING_APPROVAL):
-                attention = " 🔔"
-                break
+        dirty_marker = " *" if dirty and self._config.show_dirty else ""
+        attention = " 🔔" if self._attention.get(wt.name) else ""
         return f"{wt.name} (↑{status['ahead']} ↓{status['behind']}){dirty_marker}{attention}"
 
     def _set_active_worktree(self, wt: Worktree) -> None:
@@ -240,6 +412,7 @@ class SuperWorkerApp(App):
             wt = self._state.get_worktree(name)
             if wt:
                 self._set_active_worktree(wt)
+        self._reset_circuit_breaker()
 
     def on_session_selected(self, event: SessionSelected) -> None:
         self._active_worktree = event.worktree
@@ -252,6 +425,12 @@ class SuperWorkerApp(App):
         except Exception:
             logger.debug("Failed to activate session in terminal pane", exc_info=True)
 
+    def on_session_created(self, event: SessionCreated) -> None:
+        if event.worktree is self._active_worktree and not self._active_session_name:
+            self._active_session_name = event.session.tmux_session_name
+        # Save in a worker so startup messages (tab activation) aren't queued behind disk I/O
+        self.run_worker(asyncio.to_thread(save_state, self._state, self._config), exclusive=False)
+
     async def on_session_deleted(self, event: SessionDeleted) -> None:
         wt = event.worktree
         session = event.session
@@ -270,6 +449,7 @@ class SuperWorkerApp(App):
 
         # Remove from state and refresh sidebar immediately (no blocking calls)
         self._state = remove_session_from_state(self._state, wt.name, session.id)
+        self._sidebar_fp.pop(wt.name, None)
         try:
             wtc = self.query_one(f"#wtc-{wt.name}", WorktreeTabContent)
             sidebar = wtc.query_one(SessionSidebar)
@@ -309,6 +489,8 @@ class SuperWorkerApp(App):
                     create_worktree, self._config, name,
                     branch=branch, use_existing_branch=use_existing_branch, detach=detach,
                     worktree_index=len(self._state.worktrees),
+                    # The TUI outlives the hook, so open the tab now and let the hook finish alongside
+                    background_hook=True,
                 )
             except BranchExistsError as e:
                 def handle_branch(choice: str) -> None:
@@ -332,17 +514,13 @@ class SuperWorkerApp(App):
 
     async def _add_worktree_tab(self, wt: Worktree) -> None:
         """Add a single tab for a new worktree."""
-        try:
-            empty = self.query_one("#empty-state", Static)
-            await empty.remove()
-            tabs = TabbedContent(id="tabs")
-            footer = self.query_one(Footer)
-            await self.mount(tabs, before=footer)
-        except Exception:
-            tabs = self.query_one("#tabs", TabbedContent)
+        if self._tabs is None:
+            await self._swap_main_widget(TabbedContent(id="tabs"))
+        tabs = self._tabs
 
+        self._forget_tab(wt.name)
         pane = TabPane(self._tab_label(wt), id=f"wt-{wt.name}")
-        pane.compose_add_child(WorktreeTabContent(wt, self._config.remote, self._config.main_branch))
+        pane.compose_add_child(WorktreeTabContent(wt, self._config.remote, self._config.main_branch, self._config.show_dirty))
         await tabs.add_pane(pane)
         tabs.active = f"wt-{wt.name}"
         self._set_active_worktree(wt)
@@ -386,7 +564,7 @@ class SuperWorkerApp(App):
             self.notify("No active session to rename", severity="warning")
             return
         wt = self._active_worktree
-        session = next((s for s in wt.sessions if s.tmux_session_name == self._active_session_name), None)
+        session = wt.get_session(self._active_session_name)
         if not session:
             return
 
@@ -416,13 +594,16 @@ class SuperWorkerApp(App):
         except Exception:
             logger.debug("Failed to pause terminal before attach", exc_info=True)
         enable_mouse(session_name)
-        with self.suspend():
-            q = shlex.quote(session_name)
-            subprocess.run([
-                "bash", "-c",
-                "printf '\\e[?1000l\\e[?1003l\\e[?1015l\\e[?1006l' && "
-                f"tmux attach-session -t {q}",
-            ])
+        # The UI is hidden while attached; no background refresh churn meanwhile
+        self._focused = False
+        try:
+            with self.suspend():
+                # Turn off mouse reporting modes before handing the terminal to tmux
+                sys.__stdout__.write("\x1b[?1000l\x1b[?1003l\x1b[?1015l\x1b[?1006l")
+                sys.__stdout__.flush()
+                subprocess.run(["tmux", "attach-session", "-t", session_name])
+        finally:
+            self.on_app_focus()
         try:
             wtc = self.query_one(f"#wtc-{self._active_worktree.name}", WorktreeTabContent)
             terminal = wtc.query_one(TerminalPane)
@@ -437,8 +618,9 @@ class SuperWorkerApp(App):
         session_name = self._active_session_name
 
         async def _open() -> None:
-            await asyncio.to_thread(enable_mouse, session_name)
-            attach_cmd = f"tmux attach-session -t {shlex.quote(session_name)}"
+            # One tmux invocation: enable mouse, then attach (';' chains tmux commands)
+            q = shlex.quote(session_name)
+            attach_cmd = f"tmux set-option -t {q} mouse on ';' attach-session -t {q}"
             system = platform.system()
             if system == "Darwin":
                 subprocess.Popen([
@@ -447,7 +629,7 @@ class SuperWorkerApp(App):
                 ])
             else:
                 for term in ("x-terminal-emulator", "gnome-terminal", "xterm"):
-                    if shutil.which(term):
+                    if _which(term):
                         subprocess.Popen([term, "-e", "bash", "-c", attach_cmd])
                         return
                 self.notify("No terminal emulator found. Use Ctrl+A to attach.", severity="warning")
@@ -455,14 +637,25 @@ class SuperWorkerApp(App):
         self.run_worker(_open, exclusive=False)
 
     def action_edit_settings(self) -> None:
+        repo_root = self._config.repo_root
+
         def handle_config(result: SWConfig | None) -> None:
             if result is None:
                 return
-            save_project_config(self._config.repo_root, result)
-            self._config = load_config(self._config.repo_root)
-            self.notify("Settings saved. Some changes take effect on next worktree creation.")
 
-        self.push_screen(ConfigScreen(self._config), callback=handle_config)
+            async def _save() -> None:
+                await asyncio.to_thread(save_project_config, repo_root, result)
+                self._config = await asyncio.to_thread(load_config, repo_root)
+                self.notify("Settings saved. Some changes take effect on next worktree creation.")
+
+            self.run_worker(_save, exclusive=False)
+
+        async def _open() -> None:
+            # Read the file before pushing, so the form is never shown (or saved) half-filled
+            project_cfg = await asyncio.to_thread(load_toml, repo_root / ".sw.toml")
+            self.push_screen(ConfigScreen(self._config, project_cfg), callback=handle_config)
+
+        self.run_worker(_open, exclusive=False)
 
     def on_git_action(self, event: GitAction) -> None:
         wt = event.worktree
@@ -475,10 +668,24 @@ class SuperWorkerApp(App):
         elif event.action == "pr":
             self._git_create_pr(wt)
 
+    def _repo(self, wt: Worktree) -> gitpython.Repo:
+        """Return a cached Repo handle for a worktree."""
+        repo = self._repo_cache.get(wt.path)
+        if repo is None:
+            repo = self._repo_cache[wt.path] = gitpython.Repo(wt.path)
+        return repo
+
+    def _close_repos(self, paths: list[str] | None = None) -> None:
+        """Drop cached Repo handles (all of them if paths is None)."""
+        for path in list(self._repo_cache) if paths is None else paths:
+            repo = self._repo_cache.pop(path, None)
+            if repo is not None:
+                repo.close()
+
     def _git_push(self, wt: Worktree) -> None:
         async def _push() -> None:
             try:
-                repo = gitpython.Repo(wt.path)
+                repo = self._repo(wt)
                 await asyncio.to_thread(repo.git.push, "-u", self._config.remote, wt.branch)
                 self.notify(f"Pushed to {self._config.remote}")
             except gitpython.GitCommandError as e:
@@ -490,7 +697,7 @@ class SuperWorkerApp(App):
     def _git_pull(self, wt: Worktree) -> None:
         async def _pull() -> None:
             try:
-                repo = gitpython.Repo(wt.path)
+                repo = self._repo(wt)
                 await asyncio.to_thread(repo.git.pull, self._config.remote, self._config.main_branch)
                 self.notify(f"Pulled latest from {self._config.main_branch}")
             except gitpython.GitCommandError as e:
@@ -501,21 +708,21 @@ class SuperWorkerApp(App):
 
     def _git_create_pr(self, wt: Worktree) -> None:
         async def _pr() -> None:
-            result = await asyncio.to_thread(
-                subprocess.run, ["gh", "auth", "status"],
-                capture_output=True, text=True, timeout=10,
-            )
-            if result.returncode != 0:
-                self.notify("gh CLI not installed or not authenticated. Run: gh auth login", severity="error")
+            # No separate `gh auth status` preflight: gh reports auth problems itself
+            try:
+                result = await asyncio.to_thread(
+                    subprocess.run, ["gh", "pr", "create", "--fill", "--head", wt.branch],
+                    cwd=wt.path, capture_output=True, text=True, timeout=60,
+                )
+            except FileNotFoundError:
+                self.notify("gh CLI not installed. See https://cli.github.com", severity="error")
                 return
-            result = await asyncio.to_thread(
-                subprocess.run, ["gh", "pr", "create", "--fill", "--head", wt.branch],
-                cwd=wt.path, capture_output=True, text=True, timeout=60,
-            )
             if result.returncode == 0:
                 url = result.stdout.strip()
                 webbrowser.open(url)
                 self.notify(f"PR created: {url}")
+            elif _is_gh_auth_error(result.stderr or ""):
+                self.notify("gh CLI not authenticated. Run: gh auth login", severity="error")
             else:
                 self.notify(f"PR failed: {(result.stderr or '')[:100]}", severity="error")
 
@@ -529,7 +736,7 @@ class SuperWorkerApp(App):
 
             async def _commit() -> None:
                 try:
-                    repo = gitpython.Repo(wt.path)
+                    repo = self._repo(wt)
                     await asyncio.to_thread(repo.git.add, "-u")
                     await asyncio.to_thread(repo.git.commit, "-m", msg)
                     self.notify("Committed")
@@ -545,10 +752,14 @@ class SuperWorkerApp(App):
         """Fetch session states and git data in threads, then update the sidebar."""
         session_names = [s.tmux_session_name for s in wt.sessions]
         states, status, dirty = await asyncio.gather(
-            asyncio.to_thread(batch_detect_session_states, session_names) if session_names else asyncio.sleep(0, result={}),
-            asyncio.to_thread(get_branch_status, wt.path, self._config.remote, self._config.main_branch),
-            asyncio.to_thread(get_worktree_dirty, wt.path),
+            _to_thread_fast(batch_detect_session_states, session_names) if session_names else asyncio.sleep(0, result={}),
+            _to_thread_fast(
+                get_branch_status, wt.path, self._config.remote, self._config.main_branch, executor=self._git_pool,
+            ),
+            _to_thread_fast(get_worktree_dirty, wt.path, executor=self._git_pool)
+            if self._config.show_dirty else asyncio.sleep(0, result=False),
         )
+        self._sidebar_fp.pop(wt.name, None)
         try:
             wtc = self.query_one(f"#wtc-{wt.name}", WorktreeTabContent)
             wtc.query_one(SessionSidebar).show_worktree(wt, states=states, git_status=status, git_dirty=dirty)
@@ -558,21 +769,30 @@ class SuperWorkerApp(App):
     async def _refresh_git_ui(self, wt: Worktree) -> None:
         """Invalidate cache, fetch fresh git data in thread, update UI."""
         invalidate_git_cache(wt.path)
-        status = await asyncio.to_thread(get_branch_status, wt.path, self._config.remote, self._config.main_branch)
-        dirty = await asyncio.to_thread(get_worktree_dirty, wt.path)
+        status, dirty = await asyncio.gather(
+            asyncio.to_thread(get_branch_status, wt.path, self._config.remote, self._config.main_branch),
+            asyncio.to_thread(get_worktree_dirty, wt.path) if self._config.show_dirty else asyncio.sleep(0, result=False),
+        )
+        self._sidebar_fp.pop(wt.name, None)
         try:
             wtc = self.query_one(f"#wtc-{wt.name}", WorktreeTabContent)
             wtc.query_one(SessionSidebar)._refresh_git_status(wt, status=status, dirty=dirty)
         except Exception:
             logger.debug("Failed to refresh sidebar git status", exc_info=True, extra={"worktree": wt.name})
+        self._git_data[wt.name] = (status, dirty)
         self._refresh_tab_label(wt, git_data=(status, dirty))
 
     def _refresh_tab_label(self, wt: Worktree, git_data: tuple[dict, bool] | None = None) -> None:
         """Update a worktree's tab label with current git status."""
+        label = self._tab_label(wt, git_data=git_data)
+        if self._tab_labels.get(wt.name) == label:
+            return
+        if self._tabs is None:
+            return
         try:
-            tabs = self.query_one("#tabs", TabbedContent)
-            tab = tabs.get_tab(f"wt-{wt.name}")
-            tab.label = self._tab_label(wt, git_data=git_data)
+            tab = self._tabs.get_tab(f"wt-{wt.name}")
+            tab.label = label
+            self._tab_labels[wt.name] = label
         except Exception:
             logger.debug("Failed to refresh tab label", exc_info=True, extra={"worktree": wt.name})
 
@@ -595,6 +815,7 @@ class SuperWorkerApp(App):
                 target = self._state.get_worktree(wt_name)
                 if not target:
                     return
+                self._close_repos([target.path])
                 try:
                     await asyncio.to_thread(kill_all_sessions, target)
                     await asyncio.to_thread(remove_worktree, self._state, wt_name, force=True)
@@ -613,18 +834,21 @@ class SuperWorkerApp(App):
 
         self.push_screen(ConfirmDeleteScreen(wt.name), callback=handle_confirm)
 
+    def _forget_tab(self, name: str) -> None:
+        """Drop cached refresh data for a worktree tab that is being (re)built or removed."""
+        self._git_data.pop(name, None)
+        self._sidebar_fp.pop(name, None)
+        self._tab_labels.pop(name, None)
+
     async def _remove_worktree_tab(self, name: str) -> None:
         """Remove a single worktree tab."""
+        self._forget_tab(name)
+        if self._tabs is None:
+            return
         try:
-            tabs = self.query_one("#tabs", TabbedContent)
-            await tabs.remove_pane(f"wt-{name}")
+            await self._tabs.remove_pane(f"wt-{name}")
             if not self._state.worktrees:
-                await tabs.remove()
-                footer = self.query_one(Footer)
-                await self.mount(
-                    Static("No worktrees. Press Ctrl+N to create one.", id="empty-state"),
-                    before=footer,
-                )
+                await self._swap_main_widget(Static("No worktrees. Press Ctrl+N to create one.", id="empty-state"))
             else:
                 first = self._state.worktrees[0]
                 self._set_active_worktree(first)
@@ -651,13 +875,20 @@ class SuperWorkerApp(App):
                     self.notify(str(e), severity="error")
                     return
                 self._config = new_config
-                self._state = await asyncio.to_thread(load_state, self._config)
-                await asyncio.to_thread(update_projects_registry, self._config)
+                # Independent files and locks, so load state while the registry updates
+                self._state, _ = await asyncio.gather(
+                    asyncio.to_thread(load_state, self._config),
+                    asyncio.to_thread(update_projects_registry, self._config),
+                )
                 changed = await asyncio.to_thread(reconcile_state, self._state, self._config)
                 changed = await asyncio.to_thread(recover_dead_sessions, self._state) or changed
                 if changed:
                     await asyncio.to_thread(save_state, self._state, self._config)
                 await asyncio.to_thread(self._ensure_default_worktree)
+                self._git_data.clear()
+                self._sidebar_fp.clear()
+                self._tab_labels.clear()
+                self._close_repos()
                 self._active_worktree = None
                 self._active_session_name = None
                 self.sub_title = str(self._config.repo_root)
@@ -667,32 +898,25 @@ class SuperWorkerApp(App):
 
         self.push_screen(ProjectSelectorScreen(projects, current), callback=handle_selection)
 
+    async def _swap_main_widget(self, widget: TabbedContent | Static) -> None:
+        """Replace the mounted tab strip or empty-state placeholder with `widget`."""
+        for old in (self._tabs, self._empty):
+            if old is not None:
+                await old.remove()
+        self._tabs = widget if isinstance(widget, TabbedContent) else None
+        self._empty = widget if isinstance(widget, Static) else None
+        await self.mount(widget, before=self.query_one(Footer))
+
     async def _rebuild_ui(self) -> None:
         """Tear down and rebuild the main UI after a project switch."""
-        # Remove existing content (tabs or empty state)
-        try:
-            tabs = self.query_one("#tabs", TabbedContent)
-            await tabs.remove()
-        except Exception:
-            logger.debug("No tabs widget to remove during UI rebuild", exc_info=True)
-        try:
-            empty = self.query_one("#empty-state", Static)
-            await empty.remove()
-        except Exception:
-            logger.debug("No empty-state widget to remove during UI rebuild", exc_info=True)
-
-        footer = self.query_one(Footer)
         if self._state.worktrees:
             tabs = TabbedContent(id="tabs")
-            await self.mount(tabs, before=footer)
+            await self._swap_main_widget(tabs)
             for wt in self._state.worktrees:
                 pane = TabPane(self._tab_label(wt), id=f"wt-{wt.name}")
-                pane.compose_add_child(WorktreeTabContent(wt, self._config.remote, self._config.main_branch))
+                pane.compose_add_child(WorktreeTabContent(wt, self._config.remote, self._config.main_branch, self._config.show_dirty))
                 await tabs.add_pane(pane)
             self._set_active_worktree(self._state.worktrees[0])
         else:
-            await self.mount(
-                Static("No worktrees. Press Ctrl+N to create one.", id="empty-state"),
-                before=footer,
-            )
+            await self._swap_main_widget(Static("No worktrees. Press Ctrl+N to create one.", id="empty-state"))
         self.notify(f"Switched to {self._config.repo_root.name}")
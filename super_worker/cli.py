@@ -1,40 +1,50 @@
+import functools
+import os
 import shutil
 import sys
+import typing
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 
-from super_worker.config import load_config, load_toml, save_project_config
-from super_worker.services.state import load_state, remove_worktree_from_state, save_state, update_projects_registry
-from super_worker.services.tmux import create_session, is_session_alive, kill_all_sessions
-from super_worker.services.worktree import (
-    BranchExistsError,
-    create_worktree,
-    get_branch_status,
-    get_worktree_dirty,
-    remove_worktree,
-)
+# Service and config imports are deferred into each command: they pull in
+# pydantic and GitPython, which `sw --help` and prerequisite failures never need.
 
 
-def _check_prerequisites() -> None:
-    """Verify tmux and claude CLI are available, exit with helpful message if not."""
+# Read-only commands that work (or degrade gracefully) without tmux and claude
+_NO_PREREQ_COMMANDS = {"list", "config"}
+
+
+@functools.lru_cache(maxsize=8)
+def _missing_tools(path: str | None) -> tuple[str, ...]:
+    """Install hints for required tools not on PATH, cached per PATH value."""
     missing = []
-    if not shutil.which("tmux"):
+    if not shutil.which("tmux", path=path):
         missing.append("tmux — install via: brew install tmux (macOS) or apt install tmux (Linux)")
-    if not shutil.which("claude"):
+    if not shutil.which("claude", path=path):
         missing.append("claude — install via: npm install -g @anthropic-ai/claude-code")
-    if missing:
-        click.echo("Missing required tools:\n", err=True)
-        for m in missing:
-            click.echo(f"  • {m}", err=True)
-        click.echo("\nSee: https://github.com/okeidar/super-worker#prerequisites", err=True)
-        sys.exit(1)
+    return tuple(missing)
+
+
+def _check_prerequisites() -> None:
+    """Verify tmux and claude CLI are available, exit with helpful message if not."""
+    missing = _missing_tools(os.environ.get("PATH"))
+    if not missing:
+        return
+    click.echo("Missing required tools:\n", err=True)
+    for m in missing:
+        click.echo(f"  • {m}", err=True)
+    click.echo("\nSee: https://github.com/okeidar/super-worker#prerequisites", err=True)
+    sys.exit(1)
 
 
 @click.group(invoke_without_command=True)
 @click.pass_context
 def cli(ctx: click.Context) -> None:
     """Super Worker — Claude Code Instance Manager for Git Worktrees."""
-    _check_prerequisites()
+    # --help never reaches here: click handles it eagerly
+    if ctx.invoked_subcommand not in _NO_PREREQ_COMMANDS:
+        _check_prerequisites()
     if ctx.invoked_subcommand is None:
         # Lazy import: SuperWorkerApp pulls in Textual, which is slow to load.
         # CLI-only commands (new, list, cleanup, config) skip this cost.
@@ -51,6 +61,11 @@ def cli(ctx: click.Context) -> None:
 @click.option("--skip-permissions", "-s", is_flag=True, help="Launch Claude Code with --dangerously-skip-permissions")
 def new(name: str, branch: str | None, prompt: str | None, skip_permissions: bool) -> None:
     """Create a new worktree and optionally launch a Claude Code session."""
+    from super_worker.config import load_config
+    from super_worker.services.state import load_state, save_state, update_projects_registry
+    from super_worker.services.tmux import create_session
+    from super_worker.services.worktree import BranchExistsError, create_worktree
+
     config = load_config()
     state = load_state(config)
     update_projects_registry(config)
@@ -89,6 +104,10 @@ def new(name: str, branch: str | None, prompt: str | None, skip_permissions: boo
 @click.option("--skip-permissions", "-s", is_flag=True, help="Launch Claude Code with --dangerously-skip-permissions")
 def add_session(worktree_name: str, prompt: str | None, label: str | None, skip_permissions: bool) -> None:
     """Add a new CC session to an existing worktree."""
+    from super_worker.config import load_config
+    from super_worker.services.state import load_state, save_state
+    from super_worker.services.tmux import create_session
+
     config = load_config()
     state = load_state(config)
     wt = state.get_worktree(worktree_name)
@@ -105,24 +124,40 @@ def add_session(worktree_name: str, prompt: str | None, label: str | None, skip_
 @cli.command("list")
 def list_cmd() -> None:
     """List all worktrees and their sessions."""
+    from super_worker.config import load_config
+    from super_worker.services.state import load_state
+    from super_worker.services.tmux import get_live_session_names
+    from super_worker.services.worktree import get_branch_status, get_worktree_dirty
+
     config = load_config()
     state = load_state(config)
     if not state.worktrees:
         click.echo("No worktrees.")
         return
 
-    for wt in state.worktrees:
+    live = get_live_session_names()
+
+    def probe(wt):
         status = get_branch_status(wt.path, config.remote, config.main_branch)
-        dirty = get_worktree_dirty(wt.path)
+        return status, get_worktree_dirty(wt.path), [s.tmux_session_name in live for s in wt.sessions]
+
+    # Each probe is git/tmux subprocess waits, so threads overlap them across worktrees
+    with ThreadPoolExecutor(max_workers=min(8, len(state.worktrees))) as pool:
+        results = list(pool.map(probe, state.worktrees))
+
+    # Buffered so a long listing costs one write instead of one per line
+    out: list[str] = []
+    for wt, (status, dirty, alive_flags) in zip(state.worktrees, results):
         dirty_marker = " *" if dirty else ""
         status_str = f"↑{status['ahead']} ↓{status['behind']}"
-        click.echo(f"\n{wt.name} ({wt.branch}) [{status_str}]{dirty_marker}")
-        click.echo(f"  path: {wt.path}")
+        out.append(f"\n{wt.name} ({wt.branch}) [{status_str}]{dirty_marker}")
+        out.append(f"  path: {wt.path}")
         if not wt.sessions:
-            click.echo("  (no sessions)")
-        for s in wt.sessions:
-            alive = "alive" if is_session_alive(s.tmux_session_name) else "exited"
-            click.echo(f"  {s.label} [{alive}] — {s.tmux_session_name}")
+            out.append("  (no sessions)")
+        for s, is_alive in zip(wt.sessions, alive_flags):
+            alive = "alive" if is_alive else "exited"
+            out.append(f"  {s.label} [{alive}] — {s.tmux_session_name}")
+    click.echo("\n".join(out))
 
 
 @cli.command()
@@ -130,6 +165,11 @@ def list_cmd() -> None:
 @click.option("--force", "-f", is_flag=True, help="Force remove even with uncommitted changes")
 def cleanup(name: str, force: bool) -> None:
     """Kill all sessions and remove a worktree."""
+    from super_worker.config import load_config
+    from super_worker.services.state import load_state, remove_worktree_from_state, save_state
+    from super_worker.services.tmux import kill_all_sessions
+    from super_worker.services.worktree import remove_worktree
+
     config = load_config()
     state = load_state(config)
     wt = state.get_worktree(name)
@@ -161,28 +201,34 @@ def config(key: str | None, value: str | None) -> None:
     With KEY: show a specific value.
     With KEY VALUE: set a value (e.g. `sw config worktree.branch_prefix sc-`).
     """
+    from super_worker.config import load_config, load_toml, save_project_config, split_csv
+
     resolved = load_config()
     project_cfg = load_toml(resolved.repo_root / ".sw.toml")
 
     if key is None:
         # Show all resolved config
-        click.echo(f"Project: {resolved.repo_root}")
-        click.echo(f"Config:  {resolved.repo_root / '.sw.toml'}\n")
-        click.echo(f"[worktree]")
-        click.echo(f"  prefix        = {resolved.worktree_prefix}")
-        click.echo(f"  branch_prefix = {resolved.branch_prefix}")
-        click.echo(f"  base_dir      = {resolved.base_dir}")
-        click.echo(f"\n[env]")
-        click.echo(f"  symlinks         = {resolved.symlinks}")
-        click.echo(f"  copies           = {resolved.copies}")
-        click.echo(f"  post_create_hook = {resolved.post_create_hook or '(none)'}")
-        click.echo(f"\n[git]")
-        click.echo(f"  main_branch = {resolved.main_branch}")
-        click.echo(f"  remote      = {resolved.remote}")
-        click.echo(f"\n[ui]")
-        click.echo(f"  commit_placeholder = {resolved.commit_placeholder}")
-        click.echo(f"  name_placeholder   = {resolved.name_placeholder}")
-        click.echo(f"  branch_placeholder = {resolved.branch_placeholder}")
+        click.echo(
+            f"Project: {resolved.repo_root}\n"
+            f"Config:  {resolved.repo_root / '.sw.toml'}\n\n"
+            f"[worktree]\n"
+            f"  prefix        = {resolved.worktree_prefix}\n"
+            f"  branch_prefix = {resolved.branch_prefix}\n"
+            f"  base_dir      = {resolved.base_dir}\n"
+            f"\n[env]\n"
+            f"  symlinks         = {resolved.symlinks}\n"
+            f"  copies           = {resolved.copies}\n"
+            f"  post_create_hook = {resolved.post_create_hook or '(none)'}\n"
+            f"\n[git]\n"
+            f"  main_branch = {resolved.main_branch}\n"
+            f"  remote      = {resolved.remote}\n"
+            f"\n[ui]\n"
+            f"  commit_placeholder = {resolved.commit_placeholder}\n"
+            f"  name_placeholder   = {resolved.name_placeholder}\n"
+            f"  branch_placeholder = {resolved.branch_placeholder}\n"
+            f"  show_dirty         = {resolved.show_dirty}\n"
+            f"  refresh_if_hidden  = {resolved.refresh_if_hidden}"
+        )
         return
 
     if "." not in key:
@@ -191,7 +237,8 @@ def config(key: str | None, value: str | None) -> None:
 
     section_name, field_name = key.split(".", 1)
     section = getattr(project_cfg, section_name, None)
-    if section is None or field_name not in section.model_fields:
+    field_info = type(section).model_fields.get(field_name) if section is not None else None
+    if field_info is None:
         click.echo(f"Unknown config key: {key}", err=True)
         raise SystemExit(1)
 
@@ -200,12 +247,19 @@ def config(key: str | None, value: str | None) -> None:
         click.echo(getattr(section, field_name))
         return
 
-    # Set value
-    field_type = type(getattr(section, field_name))
-    if field_type is list:
-        parsed_value = [s.strip() for s in value.split(",") if s.strip()]
-    else:
-        parsed_value = value
+    # Set value, coercing by the declared field type rather than the current value's
+    from pydantic import TypeAdapter, ValidationError
+
+    annotation = field_info.annotation
+    raw = split_csv(value) if annotation is list or typing.get_origin(annotation) is list else value
+    try:
+        parsed_value = TypeAdapter(annotation).validate_python(raw)
+    except ValidationError:
+        click.echo(f"Invalid value for {key}: {value!r}", err=True)
+        raise SystemExit(1)
+    if getattr(section, field_name) == parsed_value:
+        click.echo(f"{key} is already {parsed_value}")
+        return
     setattr(section, field_name, parsed_value)
     path = save_project_config(resolved.repo_root, project_cfg)
     click.echo(f"Set {key} = {parsed_value}")
@@ -4,13 +4,17 @@ Reads `.sw.toml` (project-level) and `~/.config/sw/config.toml` (global),
 merges them, and fills missing values via git auto-detection.
 """
 
+import functools
 import hashlib
+import os
+import re
 import tomllib
 from pathlib import Path
 
-import git as gitpython
 from pydantic import BaseModel
 
+from super_worker.gitdir import read_head_ref, resolve_common_dir, resolve_git_dir
+
 
 class WorktreeConfig(BaseModel):
     prefix: str = ""
@@ -33,6 +37,9 @@ class UIConfig(BaseModel):
     commit_placeholder: str = ""
     name_placeholder: str = ""
     branch_placeholder: str = ""
+    # None means unset, so a project can override a global value in either direction
+    show_dirty: bool | None = None
+    refresh_if_hidden: bool | None = None
 
 
 class SWConfig(BaseModel):
@@ -42,6 +49,19 @@ class SWConfig(BaseModel):
     ui: UIConfig = UIConfig()
 
 
+# (section, field, default) for every SWConfig field, computed once instead of per merge
+_FIELD_LAYOUT: list[tuple[str, str, object]] = [
+    (section, field_name, field_info.default)
+    for section, section_info in SWConfig.model_fields.items()
+    for field_name, field_info in section_info.annotation.model_fields.items()
+]
+
+# Parsed config files (path -> (mtime_ns, size, config))
+_toml_cache: dict[Path, tuple[int, int, SWConfig]] = {}
+
+_REMOTE_SECTION_RE = re.compile(r'^\s*\[remote\s+"([^"]+)"\s*\]')
+
+
 class ResolvedConfig(BaseModel):
     """Flat config with all values guaranteed filled."""
 
@@ -57,50 +77,72 @@ class ResolvedConfig(BaseModel):
     commit_placeholder: str
     name_placeholder: str
     branch_placeholder: str
+    show_dirty: bool = True
+    refresh_if_hidden: bool = False
 
     @property
     def state_hash(self) -> str:
         """Short hash of repo_root for per-repo state file naming."""
-        return hashlib.sha256(str(self.repo_root).encode()).hexdigest()[:12]
+        return _path_hash(str(self.repo_root))
+
+
+@functools.lru_cache(maxsize=32)
+def _path_hash(path: str) -> str:
+    # Must stay sha256: existing state files are named after this digest
+    return hashlib.sha256(path.encode()).hexdigest()[:12]
 
 
 def detect_repo_root(cwd: Path | str | None = None) -> Path:
+    # Same path normalization git uses: absolute but symlinks kept, so state_hash stays stable
+    start = Path(os.path.normpath(os.path.abspath(cwd or ".")))
+    for candidate in (start, *start.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    raise RuntimeError("Not inside a git repository")
+
+
+def _common_git_dir(cwd: Path | str | None) -> Path | None:
     try:
-        repo = gitpython.Repo(cwd or ".", search_parent_directories=True)
-        return Path(repo.working_dir)
-    except gitpython.InvalidGitRepositoryError:
-        raise RuntimeError("Not inside a git repository")
+        git_dir = resolve_git_dir(detect_repo_root(cwd))
+    except RuntimeError:
+        return None
+    return resolve_common_dir(git_dir) if git_dir else None
 
 
 def detect_remote(cwd: Path | str | None = None) -> str:
+    common = _common_git_dir(cwd)
+    if common is None:
+        return "origin"
     try:
-        repo = gitpython.Repo(cwd or ".", search_parent_directories=True)
-        remotes = [r.name for r in repo.remotes]
-        if not remotes:
-            return "origin"
-        return "origin" if "origin" in remotes else remotes[0]
-    except Exception:
+        lines = (common / "config").read_text().splitlines()
+    except OSError:
         return "origin"
+    remotes = [m.group(1) for line in lines if (m := _REMOTE_SECTION_RE.match(line))]
+    if not remotes:
+        return "origin"
+    return "origin" if "origin" in remotes else remotes[0]
 
 
 def detect_main_branch(remote: str, cwd: Path | str | None = None) -> str:
+    common = _common_git_dir(cwd)
+    if common is None:
+        return "main"
+    remote_refs = common / "refs" / "remotes" / remote
+    target = read_head_ref(remote_refs)
+    if target:
+        return target.split("/")[-1]
+    # Fallback: check common branch names, loose or packed
     try:
-        repo = gitpython.Repo(cwd or ".", search_parent_directories=True)
-        ref = repo.git.symbolic_ref(f"refs/remotes/{remote}/HEAD")
-        return ref.split("/")[-1]
-    except gitpython.GitCommandError:
-        pass
-    # Fallback: check common branch names
-    try:
-        repo = gitpython.Repo(cwd or ".", search_parent_directories=True)
-        for candidate in ("main", "master"):
-            try:
-                repo.git.rev_parse("--verify", f"refs/remotes/{remote}/{candidate}")
-                return candidate
-            except gitpython.GitCommandError:
-                continue
-    except Exception:
-        pass
+        packed = {
+            line.split(" ", 1)[1]
+            for line in (common / "packed-refs").read_text().splitlines()
+            if line and line[0] not in "#^" and " " in line
+        }
+    except OSError:
+        packed = set()
+    for candidate in ("main", "master"):
+        if (remote_refs / candidate).is_file() or f"refs/remotes/{remote}/{candidate}" in packed:
+            return candidate
     return "main"
 
 
@@ -108,22 +150,23 @@ def save_project_config(repo_root: Path, config: SWConfig) -> Path:
     """Save project-level .sw.toml. Returns the path written."""
     path = repo_root / ".sw.toml"
     lines: list[str] = []
-    for section_name in ("worktree", "env", "git", "ui"):
-        section = getattr(config, section_name)
-        section_lines: list[str] = []
-        for field_name, field_info in type(section).model_fields.items():
-            value = getattr(section, field_name)
-            default = field_info.default
-            if value != default:
-                section_lines.append(f"{field_name} = {_toml_value(value)}")
-        if section_lines:
-            lines.append(f"[{section_name}]")
-            lines.extend(section_lines)
-            lines.append("")
-    path.write_text("\n".join(lines) + "\n" if lines else "")
+    # exclude_defaults recurses into sections, so untouched sections drop out entirely
+    for section_name, values in config.model_dump(exclude_defaults=True).items():
+        if values:
+            lines.append(f"[{section_name}]\n")
+            lines.extend(f"{field_name} = {_toml_value(value)}\n" for field_name, value in values.items())
+            lines.append("\n")
+    path.write_text("".join(lines))
+    # Same-size rewrites can land within the filesystem's mtime granularity
+    _toml_cache.pop(path, None)
     return path
 
 
+def split_csv(raw: str) -> list[str]:
+    """Parse a comma-separated list field, dropping blanks and surrounding whitespace."""
+    return [item for part in raw.split(",") if (item := part.strip())]
+
+
 def _toml_value(value: object) -> str:
     """Format a Python value as TOML."""
     if isinstance(value, bool):
@@ -136,33 +179,49 @@ def _toml_value(value: object) -> str:
     return str(value)
 
 
+# One-pass escaping for TOML basic strings; raw newlines/tabs would otherwise break the file
+_TOML_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+
 def _escape_toml_str(s: str) -> str:
-    return s.replace("\\", "\\\\").replace('"', '\\"')
+    return s.translate(_TOML_ESCAPES)
 
 
 def load_toml(path: Path) -> SWConfig:
-    if not path.exists():
+    """Parse a config file, reusing the last parse while its mtime and size are unchanged.
+
+    Returns a copy, so callers may mutate the result without touching the cache.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return SWConfig()
+    cached = _toml_cache.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2].model_copy(deep=True)
     with open(path, "rb") as f:
         data = tomllib.load(f)
-    return SWConfig.model_validate(data)
+    config = SWConfig.model_validate(data)
+    _toml_cache[path] = (st.st_mtime_ns, st.st_size, config)
+    return config.model_copy(deep=True)
 
 
 def _merge_configs(project: SWConfig, global_: SWConfig) -> SWConfig:
     """Merge project over global. Non-empty project values win."""
     merged = SWConfig()
-    for section in ("worktree", "env", "git", "ui"):
-        proj_section = getattr(project, section)
-        glob_section = getattr(global_, section)
-        merged_section = getattr(merged, section)
-        for field_name in type(proj_section).model_fields:
-            proj_val = getattr(proj_section, field_name)
+    sections = {
+        section: (getattr(project, section), getattr(global_, section), getattr(merged, section))
+        for section in SWConfig.model_fields
+    }
+    for section, field_name, default_val in _FIELD_LAYOUT:
+        proj_section, glob_section, merged_section = sections[section]
+        proj_val = getattr(proj_section, field_name)
+        # Use project value if set (non-default), else global, else default
+        if proj_val != default_val:
+            setattr(merged_section, field_name, proj_val)
+        else:
             glob_val = getattr(glob_section, field_name)
-            default_val = type(merged_section).model_fields[field_name].default
-            # Use project value if set (non-default), else global, else default
-            if proj_val != default_val:
-                setattr(merged_section, field_name, proj_val)
-            elif glob_val != default_val:
+            if glob_val != default_val:
                 setattr(merged_section, field_name, glob_val)
     return merged
 
@@ -200,4 +259,6 @@ def load_config(repo_path: Path | str | None = None) -> ResolvedConfig:
         commit_placeholder=merged.ui.commit_placeholder or "Brief description of changes",
         name_placeholder=merged.ui.name_placeholder or "feature-name",
         branch_placeholder=merged.ui.branch_placeholder or f"{branch_prefix}<name>",
+        show_dirty=True if merged.ui.show_dirty is None else merged.ui.show_dirty,
+        refresh_if_hidden=bool(merged.ui.refresh_if_hidden),
     )
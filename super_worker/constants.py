@@ -5,7 +5,14 @@ STATE_DIR = Path.home() / ".config" / "sw"
 TMUX_SESSION_PREFIX = "sw"
 POLL_INTERVAL_MS = 200
 SIDEBAR_REFRESH_S = 5
+SIDEBAR_REFRESH_MAX_S = 30
+# Consecutive failed refreshes before periodic polling pauses
+REFRESH_MAX_FAILURES = 3
+# Background (non-active) worktrees refresh git status every Nth sidebar tick
+BACKGROUND_REFRESH_EVERY = 5
+# An unfocused terminal pane captures every Nth poll tick; a hidden one not at all
+UNFOCUSED_POLL_EVERY = 4
 
 DEFAULT_WORKTREE_NAME = "main"
 
-RESERVED_KEYS = {"ctrl+n", "ctrl+s", "ctrl+a", "ctrl+t", "ctrl+r", "ctrl+d", "ctrl+e", "ctrl+q", "ctrl+o", "tab"}
+RESERVED_KEYS = frozenset({"ctrl+n", "ctrl+s", "ctrl+a", "ctrl+t", "ctrl+r", "ctrl+d", "ctrl+e", "ctrl+q", "ctrl+o", "tab"})
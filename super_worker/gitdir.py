@@ -0,0 +1,42 @@
+"""Direct reads of on-disk git metadata, for hot paths that can't afford a git subprocess."""
+
+from pathlib import Path
+
+
+def resolve_git_dir(path: Path | str) -> Path | None:
+    """Return the git dir of a checkout, following the `gitdir:` file of linked worktrees."""
+    dot_git = Path(path) / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        content = dot_git.read_text().strip()
+    except OSError:
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    git_dir = Path(content[len("gitdir:"):].strip())
+    if not git_dir.is_absolute():
+        git_dir = (Path(path) / git_dir).resolve()
+    return git_dir
+
+
+def resolve_common_dir(git_dir: Path) -> Path:
+    """Return the git dir shared by all worktrees (refs, config, info/exclude)."""
+    try:
+        common = Path((git_dir / "commondir").read_text().strip())
+    except OSError:
+        return git_dir
+    if not common.is_absolute():
+        common = (git_dir / common).resolve()
+    return common
+
+
+def read_head_ref(git_dir: Path) -> str | None:
+    """Return the ref HEAD points at (e.g. `refs/heads/main`), or None if detached or unreadable."""
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+    if not head.startswith("ref:"):
+        return None
+    return head[len("ref:"):].strip()
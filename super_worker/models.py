@@ -1,18 +1,26 @@
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _short_id() -> str:
+    return uuid4().hex[:8]
 
 
 class Session(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
-    id: str = Field(default_factory=lambda: uuid4().hex[:8])
+    id: str = Field(default_factory=_short_id)
     tmux_session_name: str
     label: str
     initial_prompt: str | None = None
     skip_permissions: bool = False
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = Field(default_factory=_now_iso)
 
 
 class Worktree(BaseModel):
@@ -22,7 +30,19 @@ class Worktree(BaseModel):
     path: str
     branch: str
     sessions: list[Session] = Field(default_factory=list)
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = Field(default_factory=_now_iso)
+
+    # tmux_session_name -> Session, rebuilt whenever `sessions` is reassigned or resized
+    _session_index: dict[str, Session] = PrivateAttr(default_factory=dict)
+    _session_index_key: tuple[list[Session] | None, int] = PrivateAttr(default=(None, 0))
+
+    def get_session(self, tmux_session_name: str) -> Session | None:
+        sessions = self.sessions
+        indexed, size = self._session_index_key
+        if indexed is not sessions or size != len(sessions):
+            self._session_index = {s.tmux_session_name: s for s in sessions}
+            self._session_index_key = (sessions, len(sessions))
+        return self._session_index.get(tmux_session_name)
 
 
 class AppState(BaseModel):
@@ -32,8 +52,15 @@ class AppState(BaseModel):
     worktree_base: str
     worktrees: list[Worktree] = Field(default_factory=list)
 
+    # name -> Worktree, rebuilt whenever `worktrees` is reassigned or resized
+    _worktree_index: dict[str, Worktree] = PrivateAttr(default_factory=dict)
+    _worktree_index_key: tuple[list[Worktree] | None, int] = PrivateAttr(default=(None, 0))
+
     def get_worktree(self, name: str) -> Worktree | None:
-        for wt in self.worktrees:
-            if wt.name == name:
-                return wt
-        return None
+        worktrees = self.worktrees
+        indexed, size = self._worktree_index_key
+        if indexed is not worktrees or size != len(worktrees):
+            # Reversed so the first worktree wins on duplicate names, as a linear scan would
+            self._worktree_index = {wt.name: wt for wt in reversed(worktrees)}
+            self._worktree_index_key = (worktrees, len(worktrees))
+        return self._worktree_index.get(name)
@@ -1,7 +1,6 @@
 """Modal screen dialogs for Super Worker TUI."""
 
-import hashlib
-import re
+import string
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -9,13 +8,29 @@ from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Checkbox, Input, Label
 
-from super_worker.config import ResolvedConfig, SWConfig, WorktreeConfig, EnvConfig, GitConfig, UIConfig, load_toml
+from super_worker.config import ResolvedConfig, SWConfig, WorktreeConfig, EnvConfig, GitConfig, UIConfig, load_toml, split_csv
+
+# Deletes every allowed character, so a valid name translates to ""
+_WT_NAME_STRIP = str.maketrans("", "", string.ascii_letters + string.digits + "_-")
+
+# Every dialog closes on escape; one shared immutable binding set
+_CANCEL_BINDINGS = (Binding("escape", "cancel", "Cancel"),)
+
+
+def _form_values(screen: ModalScreen) -> dict[str, str | bool]:
+    """Values of a dialog's inputs and checkboxes by id, gathered in one DOM walk."""
+    return {w.id: w.value for w in screen.query("Input, Checkbox") if w.id}
+
+
+def _strip_or_none(value: str) -> str | None:
+    """Optional text field: surrounding whitespace dropped, blank means None."""
+    return value.strip() or None
 
 
 class NewWorktreeScreen(ModalScreen[tuple[str, str | None, str | None, bool, bool] | None]):
     """Modal dialog for creating a new worktree."""
 
-    BINDINGS = [Binding("escape", "cancel", "Cancel")]
+    BINDINGS = _CANCEL_BINDINGS
 
     DEFAULT_CSS = """
     NewWorktreeScreen {
@@ -48,20 +63,16 @@ class NewWorktreeScreen(ModalScreen[tuple[str, str | None, str | None, bool, boo
             yield Label("Press Enter to create, Escape to cancel")
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
-        name_input = self.query_one("#wt-name", Input)
-        branch_input = self.query_one("#wt-branch", Input)
-        prompt_input = self.query_one("#wt-prompt", Input)
-        detach_cb = self.query_one("#wt-detach", Checkbox)
-        skip_perms_cb = self.query_one("#wt-skip-perms", Checkbox)
-        name = name_input.value.strip()
+        values = _form_values(self)
+        name = values["wt-name"].strip()
         if not name:
             return
-        if not re.fullmatch(r"[a-zA-Z0-9_-]+", name):
+        if name.translate(_WT_NAME_STRIP):
             self.notify("Name must contain only letters, digits, hyphens, and underscores", severity="error")
             return
-        branch = branch_input.value.strip() or None
-        prompt = prompt_input.value.strip() or None
-        self.dismiss((name, branch, prompt, detach_cb.value, skip_perms_cb.value))
+        branch = _strip_or_none(values["wt-branch"])
+        prompt = _strip_or_none(values["wt-prompt"])
+        self.dismiss((name, branch, prompt, values["wt-detach"], values["wt-skip-perms"]))
 
     def action_cancel(self) -> None:
         self.dismiss(None)
@@ -70,7 +81,7 @@ class NewWorktreeScreen(ModalScreen[tuple[str, str | None, str | None, bool, boo
 class NewSessionScreen(ModalScreen[tuple[str | None, str | None, bool] | None]):
     """Modal dialog for adding a session to the current worktree."""
 
-    BINDINGS = [Binding("escape", "cancel", "Cancel")]
+    BINDINGS = _CANCEL_BINDINGS
 
     DEFAULT_CSS = """
     NewSessionScreen {
@@ -96,10 +107,10 @@ class NewSessionScreen(ModalScreen[tuple[str | None, str | None, bool] | None]):
             yield Label("Press Enter to create, Escape to cancel")
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
-        prompt = self.query_one("#sess-prompt", Input).value.strip() or None
-        label = self.query_one("#sess-label", Input).value.strip() or None
-        skip_perms = self.query_one("#sess-skip-perms", Checkbox).value
-        self.dismiss((prompt, label, skip_perms))
+        values = _form_values(self)
+        prompt = _strip_or_none(values["sess-prompt"])
+        label = _strip_or_none(values["sess-label"])
+        self.dismiss((prompt, label, values["sess-skip-perms"]))
 
     def action_cancel(self) -> None:
         self.dismiss(None)
@@ -108,7 +119,7 @@ class NewSessionScreen(ModalScreen[tuple[str | None, str | None, bool] | None]):
 class RenameSessionScreen(ModalScreen[str | None]):
     """Modal dialog for renaming a session."""
 
-    BINDINGS = [Binding("escape", "cancel", "Cancel")]
+    BINDINGS = _CANCEL_BINDINGS
 
     DEFAULT_CSS = """
     RenameSessionScreen {
@@ -134,7 +145,7 @@ class RenameSessionScreen(ModalScreen[str | None]):
             yield Label("Press Enter to rename, Escape to cancel")
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
-        new_label = self.query_one("#rename-input", Input).value.strip()
+        new_label = event.value.strip()
         self.dismiss(new_label if new_label else None)
 
     def action_cancel(self) -> None:
@@ -144,7 +155,7 @@ class RenameSessionScreen(ModalScreen[str | None]):
 class ConfirmDeleteScreen(ModalScreen[bool]):
     """Confirmation dialog for deleting a worktree."""
 
-    BINDINGS = [Binding("escape", "cancel", "Cancel")]
+    BINDINGS = _CANCEL_BINDINGS
 
     DEFAULT_CSS = """
     ConfirmDeleteScreen {
@@ -188,7 +199,7 @@ class ConfirmDeleteScreen(ModalScreen[bool]):
 class CommitMessageScreen(ModalScreen[str | None]):
     """Modal dialog for entering a commit message."""
 
-    BINDINGS = [Binding("escape", "cancel", "Cancel")]
+    BINDINGS = _CANCEL_BINDINGS
 
     DEFAULT_CSS = """
     CommitMessageScreen {
@@ -214,7 +225,7 @@ class CommitMessageScreen(ModalScreen[str | None]):
             yield Label("Press Enter to commit all changes, Escape to cancel")
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
-        msg = self.query_one("#commit-msg", Input).value.strip()
+        msg = event.value.strip()
         if msg:
             self.dismiss(msg)
 
@@ -225,7 +236,7 @@ class CommitMessageScreen(ModalScreen[str | None]):
 class BranchExistsScreen(ModalScreen[str]):
     """Ask user what to do when branch already exists."""
 
-    BINDINGS = [Binding("escape", "cancel", "Cancel")]
+    BINDINGS = _CANCEL_BINDINGS
 
     DEFAULT_CSS = """
     BranchExistsScreen {
@@ -272,7 +283,7 @@ class BranchExistsScreen(ModalScreen[str]):
 class ProjectSelectorScreen(ModalScreen[str | None]):
     """Modal to select a project from known repos or browse for a new one."""
 
-    BINDINGS = [Binding("escape", "cancel", "Cancel")]
+    BINDINGS = _CANCEL_BINDINGS
 
     DEFAULT_CSS = """
     ProjectSelectorScreen {
@@ -299,29 +310,25 @@ class ProjectSelectorScreen(ModalScreen[str | None]):
         super().__init__()
         self._projects = projects
         self._current = current
-
-    @staticmethod
-    def _proj_id(path: str) -> str:
-        return f"proj-{hashlib.sha256(path.encode()).hexdigest()[:8]}"
+        # Positional ids: unique and DOM-safe without hashing each path
+        self._id_to_path = {f"proj-{i}": p for i, p in enumerate(projects)}
 
     def compose(self) -> ComposeResult:
         with Vertical(id="project-dialog"):
             yield Label("Open Project")
-            for p in self._projects:
+            for btn_id, p in self._id_to_path.items():
                 marker = " (current)" if p == self._current else ""
-                yield Button(f"{p}{marker}", id=self._proj_id(p), variant="primary" if p == self._current else "default")
+                yield Button(f"{p}{marker}", id=btn_id, variant="primary" if p == self._current else "default")
             yield Label("Or enter a path to a git repo:")
             yield Input(placeholder="/path/to/repo", id="browse-input")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        btn_id = event.button.id or ""
-        for p in self._projects:
-            if btn_id == self._proj_id(p):
-                self.dismiss(p)
-                return
+        path = self._id_to_path.get(event.button.id or "")
+        if path is not None:
+            self.dismiss(path)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
-        path = self.query_one("#browse-input", Input).value.strip()
+        path = event.value.strip()
         if path:
             self.dismiss(path)
 
@@ -332,7 +339,7 @@ class ProjectSelectorScreen(ModalScreen[str | None]):
 class ConfigScreen(ModalScreen[SWConfig | None]):
     """Modal to edit project .sw.toml settings."""
 
-    BINDINGS = [Binding("escape", "cancel", "Cancel")]
+    BINDINGS = _CANCEL_BINDINGS
 
     DEFAULT_CSS = """
     ConfigScreen {
@@ -367,10 +374,11 @@ class ConfigScreen(ModalScreen[SWConfig | None]):
     }
     """
 
-    def __init__(self, config: ResolvedConfig) -> None:
+    def __init__(self, config: ResolvedConfig, project_cfg: SWConfig | None = None) -> None:
         super().__init__()
         self._config = config
-        self._project_cfg = load_toml(config.repo_root / ".sw.toml")
+        # Callers on the UI thread pass an already-loaded project config
+        self._project_cfg = project_cfg if project_cfg is not None else load_toml(config.repo_root / ".sw.toml")
 
     def compose(self) -> ComposeResult:
         cfg = self._project_cfg
@@ -406,24 +414,37 @@ class ConfigScreen(ModalScreen[SWConfig | None]):
             yield Input(value=cfg.ui.name_placeholder, placeholder="feature-name", id="cfg-name")
             yield Label("Branch placeholder:", classes="config-label")
             yield Input(value=cfg.ui.branch_placeholder, placeholder=f"{self._config.branch_prefix}<name>", id="cfg-branch-ph")
+            yield Checkbox("Show uncommitted-changes marker", value=self._config.show_dirty, id="cfg-show-dirty")
+            yield Checkbox("Refresh while unfocused", value=self._config.refresh_if_hidden, id="cfg-refresh-hidden")
 
             with Horizontal(id="config-buttons"):
                 yield Button("Save", variant="primary", id="btn-save")
                 yield Button("Cancel", variant="default", id="btn-cfg-cancel")
 
+    @staticmethod
+    def _toggle(checked: bool, project_value: bool | None, effective: bool) -> bool | None:
+        """Keep a toggle unset in the project file unless it was set there or changed here."""
+        return checked if project_value is not None or checked != effective else None
+
     def _collect(self) -> SWConfig:
-        def val(id: str) -> str:
-            return self.query_one(f"#{id}", Input).value.strip()
+        values = _form_values(self)
 
-        def csv(id: str) -> list[str]:
-            raw = val(id)
-            return [s.strip() for s in raw.split(",") if s.strip()] if raw else []
+        def val(id: str) -> str:
+            return values[id].strip()
 
         return SWConfig(
             worktree=WorktreeConfig(prefix=val("cfg-prefix"), branch_prefix=val("cfg-branch-prefix"), base_dir=val("cfg-base-dir")),
-            env=EnvConfig(symlinks=csv("cfg-symlinks"), copies=csv("cfg-copies"), post_create_hook=val("cfg-hook")),
+            env=EnvConfig(symlinks=split_csv(values["cfg-symlinks"]), copies=split_csv(values["cfg-copies"]), post_create_hook=val("cfg-hook")),
             git=GitConfig(main_branch=val("cfg-main-branch"), remote=val("cfg-remote")),
-            ui=UIConfig(commit_placeholder=val("cfg-commit"), name_placeholder=val("cfg-name"), branch_placeholder=val("cfg-branch-ph")),
+            ui=UIConfig(
+                commit_placeholder=val("cfg-commit"),
+                name_placeholder=val("cfg-name"),
+                branch_placeholder=val("cfg-branch-ph"),
+                show_dirty=self._toggle(values["cfg-show-dirty"], self._project_cfg.ui.show_dirty, self._config.show_dirty),
+                refresh_if_hidden=self._toggle(
+                    values["cfg-refresh-hidden"], self._project_cfg.ui.refresh_if_hidden, self._config.refresh_if_hidden,
+                ),
+            ),
         )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -1,19 +1,62 @@
+import contextlib
 import fcntl
+import hashlib
 import json
 import logging
+import os
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 
+from pydantic import ValidationError
+
 from super_worker.config import ResolvedConfig
 from super_worker.constants import STATE_DIR
 from super_worker.models import AppState
-from super_worker.services.tmux import create_session, is_session_alive
+from super_worker.services.tmux import create_session, get_live_session_names
 from super_worker.services.worktree import discover_worktrees, prune_git_cache
 
 logger = logging.getLogger(__name__)
 
 
+# STATE_DIR as of the last successful mkdir, so the syscall is paid once per process
+_ensured_state_dir: Path | None = None
+
+
 def _ensure_state_dir() -> None:
-    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    global _ensured_state_dir
+    if _ensured_state_dir != STATE_DIR:
+        STATE_DIR.mkdir(parents=True, exist_ok=True)
+        _ensured_state_dir = STATE_DIR
+
+
+@contextlib.contextmanager
+def _file_lock(lock_file: Path, operation: int) -> Iterator[None]:
+    """Hold `operation` (LOCK_SH/LOCK_EX) on a `.lock` sidecar.
+
+    The sidecar, not the data file, carries the flock: data files are replaced
+    by rename, which would leave a lock on the data file pinned to a stale inode.
+    """
+    with open(lock_file, "a") as lf:
+        fcntl.flock(lf, operation)
+        try:
+            yield
+        finally:
+            fcntl.flock(lf, fcntl.LOCK_UN)
+
+
+# Last write per state file: (content digest, (st_ino, st_size, st_mtime_ns)).
+# The stat signature lets a write by another process invalidate the entry.
+_written_guard = threading.Lock()
+_written: dict[Path, tuple[bytes, tuple[int, int, int]]] = {}
+
+
+def _stat_signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
 
 
 def _state_file_for(config: ResolvedConfig) -> Path:
@@ -49,30 +92,35 @@ def load_state(config: ResolvedConfig) -> AppState:
             repo_root=str(config.repo_root),
             worktree_base=str(config.base_dir),
         )
-    lock_file = state_file.with_suffix(".lock")
-    with open(lock_file, "a") as lf:
-        fcntl.flock(lf, fcntl.LOCK_SH)
-        try:
-            data = json.loads(state_file.read_text())
-        finally:
-            fcntl.flock(lf, fcntl.LOCK_UN)
+    with _file_lock(state_file.with_suffix(".lock"), fcntl.LOCK_SH):
+        raw = state_file.read_bytes()
 
-    data = _migrate_data(data)
-    return AppState.model_validate(data)
+    # Parse outside the lock, in pydantic-core; only legacy files need the dict-level migration
+    try:
+        return AppState.model_validate_json(raw)
+    except ValidationError:
+        data = _migrate_data(json.loads(raw))
+        return AppState.model_validate(data)
 
 
 def save_state(state: AppState, config: ResolvedConfig) -> None:
     _ensure_state_dir()
     state_file = _state_file_for(config)
-    lock_file = state_file.with_suffix(".lock")
+    content = state.model_dump_json(indent=2).encode()
+    digest = hashlib.blake2b(content, digest_size=16).digest()
+    with _written_guard:
+        last = _written.get(state_file)
+    # Skip identical rewrites, unless the file changed on disk since our last write
+    if last is not None and last[0] == digest and last[1] == _stat_signature(state_file):
+        return
     tmp = state_file.with_suffix(".tmp")
-    with open(lock_file, "a") as lf:
-        fcntl.flock(lf, fcntl.LOCK_EX)
-        try:
-            tmp.write_text(state.model_dump_json(indent=2))
-            tmp.rename(state_file)
-        finally:
-            fcntl.flock(lf, fcntl.LOCK_UN)
+    with _file_lock(state_file.with_suffix(".lock"), fcntl.LOCK_EX):
+        tmp.write_bytes(content)
+        tmp.replace(state_file)
+        signature = _stat_signature(state_file)
+    if signature is not None:
+        with _written_guard:
+            _written[state_file] = (digest, signature)
 
 
 def remove_worktree_from_state(state: AppState, name: str) -> AppState:
@@ -87,6 +135,28 @@ def remove_session_from_state(state: AppState, worktree_name: str, session_id: s
     return state
 
 
+def _existing_dirs(paths: list[str]) -> set[str]:
+    """Return which of `paths` are existing directories, with one scandir per parent.
+
+    A parent that can't be listed (EACCES, EMFILE, an execute-only dir, ...) falls
+    back to checking its children one by one, so they are never assumed gone.
+    """
+    by_parent: dict[str, list[str]] = {}
+    for path in paths:
+        by_parent.setdefault(os.path.dirname(os.path.normpath(path)), []).append(path)
+    existing: set[str] = set()
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                dirs = {e.name for e in entries if e.is_dir()}
+        except OSError:
+            # Path.is_dir only swallows "not found"-style errors; anything else propagates
+            existing.update(p for p in children if Path(p).is_dir())
+            continue
+        existing.update(p for p in children if os.path.basename(os.path.normpath(p)) in dirs)
+    return existing
+
+
 def recover_dead_sessions(state: AppState) -> bool:
     """Recover dead sessions by recreating them with `claude --continue`.
 
@@ -97,13 +167,15 @@ def recover_dead_sessions(state: AppState) -> bool:
     Returns True if any sessions were recovered.
     """
     changed = False
+    existing = _existing_dirs([wt.path for wt in state.worktrees])
+    live = get_live_session_names()
     for wt in state.worktrees:
-        if not Path(wt.path).exists():
+        if wt.path not in existing:
             continue
         alive = []
         dead = []
         for s in wt.sessions:
-            if is_session_alive(s.tmux_session_name):
+            if s.tmux_session_name in live:
                 alive.append(s)
             else:
                 dead.append(s)
@@ -124,13 +196,14 @@ def reconcile_state(state: AppState, config: ResolvedConfig | None = None) -> bo
     """Prune worktrees whose paths no longer exist, discover new ones. Returns True if changed."""
     changed = False
 
-    valid_worktrees = []
-    for wt in state.worktrees:
-        if not Path(wt.path).exists():
-            changed = True
-            continue
-        valid_worktrees.append(wt)
-    state.worktrees = valid_worktrees
+    existing = _existing_dirs([wt.path for wt in state.worktrees])
+    valid_worktrees = [wt for wt in state.worktrees if wt.path in existing]
+    if len(valid_worktrees) != len(state.worktrees):
+        # Swap in a new list rather than deleting in place: AppState.get_worktree's
+        # index is keyed on the list's identity, and keeping the list when nothing
+        # was pruned keeps that index warm
+        state.worktrees = valid_worktrees
+        changed = True
     prune_git_cache({wt.path for wt in valid_worktrees})
 
     # Discover worktrees on disk that aren't in state
@@ -149,22 +222,17 @@ def update_projects_registry(config: ResolvedConfig) -> None:
     """Track this repo in the global projects registry."""
     _ensure_state_dir()
     registry_path = STATE_DIR / "projects.json"
-    lock_file = registry_path.with_suffix(".lock")
-    with open(lock_file, "a") as lf:
-        fcntl.flock(lf, fcntl.LOCK_EX)
-        try:
-            projects: list[str] = []
-            if registry_path.exists():
-                try:
-                    projects = json.loads(registry_path.read_text())
-                except (json.JSONDecodeError, TypeError):
-                    projects = []
-            repo_str = str(config.repo_root)
-            if repo_str not in projects:
-                projects.append(repo_str)
-                registry_path.write_text(json.dumps(projects, indent=2))
-        finally:
-            fcntl.flock(lf, fcntl.LOCK_UN)
+    with _file_lock(registry_path.with_suffix(".lock"), fcntl.LOCK_EX):
+        projects: list[str] = []
+        if registry_path.exists():
+            try:
+                projects = json.loads(registry_path.read_text())
+            except (json.JSONDecodeError, TypeError):
+                projects = []
+        repo_str = str(config.repo_root)
+        if repo_str not in projects:
+            projects.append(repo_str)
+            registry_path.write_text(json.dumps(projects, indent=2))
 
 
 def load_projects_registry() -> list[str]:
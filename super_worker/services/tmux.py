@@ -1,5 +1,10 @@
+import functools
 import logging
 import shlex
+import shutil
+import subprocess
+import threading
+import time
 from enum import Enum
 
 import libtmux
@@ -23,15 +28,30 @@ _STATE_MAP = {
     "running": SessionState.RUNNING,
 }
 
+_STATE_FORMAT = "#{session_name}\t#{SW_CC_STATE}"
+
+# TTL cache for detected session states (session name -> (timestamp, state))
+_STATE_CACHE_TTL = 1.0  # seconds
+_state_cache_lock = threading.Lock()
+_state_cache: dict[str, tuple[float, SessionState]] = {}
+
 
 def tmux_session_name(worktree_name: str, index: int) -> str:
     return f"{TMUX_SESSION_PREFIX}-{worktree_name}-{index}"
 
 
+def _live_session_names(server: libtmux.Server) -> set[str]:
+    """Names of all live sessions, without building libtmux Session objects."""
+    result = server.cmd("list-sessions", "-F", "#{session_name}")
+    if result.stderr:
+        # "no server running" just means there are no sessions yet
+        logger.debug("tmux list-sessions failed", extra={"stderr": result.stderr})
+    return set(result.stdout)
+
+
 def _find_available_session_name(worktree: Worktree) -> str:
     """Find next available tmux session name, avoiding collisions."""
-    server = libtmux.Server()
-    existing = {s.session_name for s in server.sessions}
+    existing = _live_session_names(libtmux.Server())
     index = len(worktree.sessions)
     for _ in range(1000):
         name = tmux_session_name(worktree.name, index)
@@ -74,34 +94,51 @@ def create_session(
         initial_prompt=prompt,
         skip_permissions=skip_permissions,
     )
+    invalidate_session_states([sess_name])
     return session
 
 
+def _active_pane_target(tmux_session_name: str) -> str:
+    """Target the active pane of a session directly, so no session/pane lookup is needed."""
+    return f"={tmux_session_name}:"
+
+
+@functools.lru_cache(maxsize=1)
+def _tmux_bin() -> str | None:
+    return shutil.which("tmux")
+
+
 def capture_pane(tmux_session_name: str) -> str:
-    """Capture pane content with scrollback history and ANSI escapes."""
-    server = libtmux.Server()
-    try:
-        session = server.sessions.get(session_name=tmux_session_name)
-    except Exception:
+    """Capture pane content with scrollback history and ANSI escapes.
+
+    Runs tmux directly: this is the per-tick hot path, and libtmux would
+    re-resolve the binary on PATH and split the output into lines only for
+    us to join them again.
+    """
+    tmux = _tmux_bin()
+    if tmux is None:
         return f"[Session {tmux_session_name} not found]"
-
-    try:
-        lines = session.active_pane.capture_pane(start=-500, escape_sequences=True)
-        return "\n".join(lines)
-    except Exception:
+    proc = subprocess.run(
+        [tmux, "capture-pane", "-p", "-S", "-500", "-e", "-t", _active_pane_target(tmux_session_name)],
+        capture_output=True,
+        check=False,
+    )
+    if proc.returncode != 0:
         return f"[Session {tmux_session_name} not found]"
+    return proc.stdout.decode("utf-8", "backslashreplace").rstrip("\n")
 
 
 def send_keys(tmux_session_name: str, *keys: str, literal: bool = False) -> None:
     """Send keystrokes to a tmux session."""
+    flags = ("-l",) if literal else ()
     server = libtmux.Server()
     try:
-        session = server.sessions.get(session_name=tmux_session_name)
-        pane = session.active_pane
-        for key in keys:
-            pane.send_keys(key, enter=False, literal=literal)
+        result = server.cmd("send-keys", *flags, "-t", _active_pane_target(tmux_session_name), "--", *keys)
     except Exception:
         logger.debug("Failed to send keys to tmux session", extra={"session": tmux_session_name})
+        return
+    if result.stderr:
+        logger.debug("Failed to send keys to tmux session", extra={"session": tmux_session_name})
 
 
 def is_session_alive(tmux_session_name: str) -> bool:
@@ -114,34 +151,69 @@ def is_session_alive(tmux_session_name: str) -> bool:
         return False
 
 
+def get_live_session_names() -> set[str]:
+    """Names of all live tmux sessions, for membership tests over many sessions."""
+    try:
+        return _live_session_names(libtmux.Server())
+    except Exception:
+        logger.debug("Failed to list tmux sessions")
+        return set()
+
+
 def batch_detect_session_states(session_names: list[str]) -> dict[str, SessionState]:
-    """Detect states for multiple sessions using the libtmux API directly."""
+    """Detect states for multiple sessions with a single tmux call.
+
+    Results are cached per session with a short TTL, so the periodic refresh
+    and per-tab loads within the same second share one tmux round-trip.
+    """
     if not session_names:
         return {}
 
+    now = time.monotonic()
+    results: dict[str, SessionState] = {}
+    with _state_cache_lock:
+        for name in session_names:
+            cached = _state_cache.get(name)
+            if cached and (now - cached[0]) < _STATE_CACHE_TTL:
+                results[name] = cached[1]
+    missing = [name for name in session_names if name not in results]
+    if not missing:
+        return results
+
+    # One list-sessions call reports every live session with its SW_CC_STATE:
+    # tmux resolves unknown format variables from the session environment.
     server = libtmux.Server()
+    live_states: dict[str, str] = {}
     try:
-        live_sessions = {s.session_name: s for s in server.sessions}
+        output = server.cmd("list-sessions", "-F", _STATE_FORMAT).stdout
+        for line in output:
+            name, _, value = line.partition("\t")
+            live_states[name] = value
     except Exception:
         logger.debug("Failed to list tmux sessions for batch state detection", exc_info=True)
-        live_sessions = {}
 
-    results: dict[str, SessionState] = {}
-    for name in session_names:
-        if name not in live_sessions:
+    for name in missing:
+        if name not in live_states:
             results[name] = SessionState.DEAD
-            continue
-
-        try:
-            env = live_sessions[name].show_environment()
-            value = env.get("SW_CC_STATE", "")
-            results[name] = _STATE_MAP.get(value, SessionState.RUNNING)
-        except Exception:
-            results[name] = SessionState.RUNNING
+        else:
+            results[name] = _STATE_MAP.get(live_states[name], SessionState.RUNNING)
 
+    with _state_cache_lock:
+        for name in missing:
+            _state_cache[name] = (now, results[name])
     return results
 
 
+def invalidate_session_states(session_names: list[str] | None = None) -> None:
+    """Drop cached session states for the given sessions, or all of them."""
+    with _state_cache_lock:
+        if session_names is None:
+            _state_cache.clear()
+            return
+        for name in session_names:
+            _state_cache.pop(name, None)
+
+
 def enable_mouse(tmux_session_name: str) -> None:
     """Enable mouse support on a tmux session."""
     server = libtmux.Server()
@@ -160,9 +232,36 @@ def kill_session(tmux_session_name: str) -> None:
         session.kill()
     except Exception:
         logger.debug("Failed to kill tmux session", extra={"session": tmux_session_name})
+    invalidate_session_states([tmux_session_name])
+
+
+def kill_sessions_batch(tmux_session_names: list[str]) -> None:
+    """Kill several tmux sessions with one chained tmux command.
+
+    tmux abandons a `;` chain at the first failing command, so only sessions
+    that currently exist are targeted; if the chain still fails (a session
+    exited in between), the rest are killed one by one.
+    """
+    if not tmux_session_names:
+        return
+    server = libtmux.Server()
+    try:
+        existing = _live_session_names(server)
+    except Exception:
+        existing = set()
+    targets = [name for name in tmux_session_names if name in existing]
+    if targets:
+        args: list[str] = []
+        for name in targets:
+            args += [";", "kill-session", "-t", f"={name}"]
+        result = server.cmd(*args[1:])
+        if result.stderr:
+            logger.debug("Batched kill failed, retrying per session", extra={"stderr": result.stderr})
+            for name in targets:
+                kill_session(name)
+    invalidate_session_states(tmux_session_names)
 
 
 def kill_all_sessions(worktree: Worktree) -> None:
     """Kill all tmux sessions for a worktree."""
-    for session in worktree.sessions:
-        kill_session(session.tmux_session_name)
+    kill_sessions_batch([session.tmux_session_name for session in worktree.sessions])
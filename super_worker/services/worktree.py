@@ -1,5 +1,7 @@
 import logging
+import os
 import shutil
+import signal
 import subprocess
 import threading
 import time
@@ -8,6 +10,7 @@ from pathlib import Path
 import git as gitpython
 
 from super_worker.config import ResolvedConfig
+from super_worker.gitdir import read_head_ref, resolve_common_dir, resolve_git_dir
 from super_worker.models import AppState, Worktree
 
 logger = logging.getLogger(__name__)
@@ -17,15 +20,18 @@ _GIT_CACHE_TTL = 5.0  # seconds
 _cache_lock = threading.Lock()
 _branch_status_cache: dict[str, tuple[float, dict]] = {}
 _dirty_cache: dict[str, tuple[float, bool]] = {}
+# Stat fingerprint of the refs behind each cached branch status (path -> fingerprint)
+_branch_status_fp: dict[str, tuple] = {}
 
+_HOOK_TIMEOUT_S = 30
 
-def _branch_exists(repo: Path, branch: str) -> bool:
-    """Check if a local branch exists."""
+
+def _branch_exists(git_repo: gitpython.Repo, branch: str) -> bool:
+    """Check if a local branch exists (reads loose and packed refs, no git subprocess)."""
     try:
-        git_repo = gitpython.Repo(repo)
-        git_repo.git.rev_parse("--verify", f"refs/heads/{branch}")
+        git_repo.heads[branch]
         return True
-    except gitpython.GitCommandError:
+    except IndexError:
         return False
 
 
@@ -44,11 +50,14 @@ def create_worktree(
     use_existing_branch: bool = False,
     detach: bool = False,
     worktree_index: int = 0,
+    background_hook: bool = False,
 ) -> Worktree:
     """Create a git worktree with environment setup.
 
     Raises BranchExistsError if branch exists and use_existing_branch is False.
     If detach is True, creates a detached HEAD worktree (no new branch).
+    If background_hook is True, returns without waiting for the post-create
+    hook; a failing or timed-out hook is then only logged, not rolled back.
     """
     repo = config.repo_root
     wt_path = config.base_dir / f"{config.worktree_prefix}-{name}"
@@ -66,7 +75,7 @@ def create_worktree(
             raise RuntimeError(f"Failed to create worktree: {e.stderr or e}") from e
     else:
         target_branch = branch or f"{config.branch_prefix}{name}"
-        if _branch_exists(repo, target_branch):
+        if _branch_exists(git_repo, target_branch):
             if not use_existing_branch:
                 raise BranchExistsError(target_branch)
             try:
@@ -81,7 +90,7 @@ def create_worktree(
 
     try:
         _setup_env(repo, wt_path, config)
-        _run_post_create_hook(config.post_create_hook, wt_path, worktree_index)
+        _run_post_create_hook(config.post_create_hook, wt_path, worktree_index, background=background_hook)
     except Exception:
         try:
             git_repo.git.worktree("remove", "--force", str(wt_path))
@@ -98,9 +107,13 @@ def _setup_env(repo: Path, wt_path: Path, config: ResolvedConfig) -> None:
     for link_name in config.symlinks:
         src = repo / link_name
         dst = wt_path / link_name
-        if src.exists() and not dst.exists():
+        if not src.exists():
+            continue
+        try:
             dst.symlink_to(src)
-            created_symlinks.append(link_name)
+        except FileExistsError:
+            continue
+        created_symlinks.append(link_name)
 
     if created_symlinks:
         _add_git_excludes(wt_path, created_symlinks)
@@ -108,60 +121,88 @@ def _setup_env(repo: Path, wt_path: Path, config: ResolvedConfig) -> None:
     for copy_name in config.copies:
         src = repo / copy_name
         dst = wt_path / copy_name
-        if src.exists():
-            shutil.copy2(str(src), str(dst))
+        # copy2 already copies via sendfile on Linux; only stat src if the copy fails
+        try:
+            shutil.copy2(src, dst)
+        except FileNotFoundError:
+            if src.exists():
+                raise
 
 
-def _run_post_create_hook(hook: str, wt_path: Path, index: int) -> None:
-    """Run post-create hook script if configured."""
+def _run_post_create_hook(hook: str, wt_path: Path, index: int, background: bool = False) -> threading.Thread | None:
+    """Run post-create hook script if configured.
+
+    With background=True the hook is started and left running; a daemon thread
+    waits for it and logs failures. Returns that thread, or None if nothing runs
+    in the background.
+    """
     if not hook:
-        return
+        return None
     hook_path = (wt_path / hook).resolve()
     if not hook_path.is_relative_to(wt_path):
         logger.warning("Post-create hook escapes worktree directory", extra={"hook": hook, "resolved": str(hook_path)})
-        return
+        return None
     if not hook_path.exists():
         logger.warning("Post-create hook not found", extra={"hook": hook, "path": str(hook_path)})
-        return
-    result = subprocess.run(
-        [str(hook_path), str(wt_path), str(index)],
-        cwd=wt_path,
-        capture_output=True,
-        text=True,
-        timeout=30,
+        return None
+    args = [str(hook_path), str(wt_path), str(index)]
+    if not background:
+        result = subprocess.run(args, cwd=wt_path, capture_output=True, text=True, timeout=_HOOK_TIMEOUT_S)
+        _log_hook_result(hook, result.returncode, result.stderr)
+        return None
+    # Own process group, so a timeout can kill whatever the hook spawned (which would hold its pipes open)
+    proc = subprocess.Popen(
+        args, cwd=wt_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, start_new_session=True,
     )
-    if result.returncode != 0:
+    waiter = threading.Thread(target=_wait_for_hook, args=(hook, proc), name="post-create-hook", daemon=True)
+    waiter.start()
+    return waiter
+
+
+def _wait_for_hook(hook: str, proc: subprocess.Popen) -> None:
+    try:
+        _, stderr = proc.communicate(timeout=_HOOK_TIMEOUT_S)
+    except subprocess.TimeoutExpired:
+        os.killpg(proc.pid, signal.SIGKILL)
+        proc.communicate()
+        logger.warning("Post-create hook timed out", extra={"hook": hook, "timeout": _HOOK_TIMEOUT_S})
+        return
+    _log_hook_result(hook, proc.returncode, stderr)
+
+
+def _log_hook_result(hook: str, returncode: int, stderr: str) -> None:
+    if returncode != 0:
         logger.warning(
             "Post-create hook failed",
-            extra={"hook": hook, "returncode": result.returncode, "stderr": result.stderr},
+            extra={"hook": hook, "returncode": returncode, "stderr": stderr},
         )
 
 
 def _add_git_excludes(wt_path: Path, names: list[str]) -> None:
     """Add entries to the shared git exclude file (works for worktrees)."""
-    try:
-        git_repo = gitpython.Repo(wt_path)
-        common_dir = git_repo.git.rev_parse("--git-common-dir")
-    except gitpython.GitCommandError:
+    git_dir = resolve_git_dir(wt_path)
+    if git_dir is None or not names:
         return
 
-    git_common = Path(common_dir)
-    if not git_common.is_absolute():
-        git_common = (wt_path / git_common).resolve()
-
-    exclude_dir = git_common / "info"
+    exclude_dir = resolve_common_dir(git_dir) / "info"
     exclude_dir.mkdir(parents=True, exist_ok=True)
     exclude_file = exclude_dir / "exclude"
 
-    existing = set()
-    if exclude_file.exists():
-        existing = set(exclude_file.read_text().splitlines())
+    # Stream the file, stopping as soon as every name is known to be present
+    missing = dict.fromkeys(names)
+    needs_newline = False
+    try:
+        with open(exclude_file) as f:
+            for line in f:
+                missing.pop(line.rstrip("\n"), None)
+                if not missing:
+                    return
+                needs_newline = not line.endswith("\n")
+    except FileNotFoundError:
+        pass
 
-    new_entries = [n for n in names if n not in existing]
-    if new_entries:
-        with open(exclude_file, "a") as f:
-            for entry in new_entries:
-                f.write(f"{entry}\n")
+    with open(exclude_file, "a") as f:
+        f.write(("\n" if needs_newline else "") + "".join(f"{entry}\n" for entry in missing))
 
 
 def remove_worktree(state: AppState, name: str, force: bool = False) -> None:
@@ -188,18 +229,26 @@ def remove_worktree(state: AppState, name: str, force: bool = False) -> None:
             ) from e
         if not force:
             raise RuntimeError(f"Failed to remove worktree: {stderr}") from e
-        # force=True: git failed, clean up directory manually
+        # force=True: git failed, clean up directory manually and prune the
+        # admin entry `git worktree remove` would otherwise have dropped itself
         if wt_path.exists():
             shutil.rmtree(wt_path)
-
-    try:
-        git_repo.git.worktree("prune")
-    except gitpython.GitCommandError:
-        pass
+        try:
+            git_repo.git.worktree("prune")
+        except gitpython.GitCommandError:
+            pass
 
 
 def get_current_branch(repo_path: str) -> str:
-    """Get the current branch name of a git repo or worktree."""
+    """Get the current branch name of a git repo or worktree.
+
+    Reads HEAD straight from the git dir; gitpython is only the fallback
+    (detached HEAD, unusual layouts).
+    """
+    git_dir = resolve_git_dir(repo_path)
+    head_ref = read_head_ref(git_dir) if git_dir else None
+    if head_ref and head_ref.startswith("refs/heads/"):
+        return head_ref[len("refs/heads/"):]
     try:
         repo = gitpython.Repo(repo_path)
         return repo.active_branch.name
@@ -207,28 +256,90 @@ def get_current_branch(repo_path: str) -> str:
         return "(unknown)"
 
 
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    # git rewrites refs via rename, so the inode moves even when size and a coarse mtime don't
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _branch_status_fingerprint(wt_path: str, remote: str, main_branch: str) -> tuple | None:
+    """Stat fingerprint of every ref that can move the ahead/behind counts.
+
+    Returns None when the git dir can't be resolved, in which case only the TTL applies.
+    """
+    git_dir = resolve_git_dir(wt_path)
+    if git_dir is None:
+        return None
+    common_dir = resolve_common_dir(git_dir)
+    files = [
+        git_dir / "HEAD",
+        common_dir / "packed-refs",
+        common_dir / "refs" / "remotes" / remote / main_branch,
+    ]
+    head_ref = read_head_ref(git_dir)
+    if head_ref:
+        files.append(common_dir / head_ref)
+    return (remote, main_branch, *(_stat_key(f) for f in files))
+
+
+def _is_missing_revision(error: gitpython.GitCommandError) -> bool:
+    stderr = str(error.stderr or "")
+    return "unknown revision" in stderr or "bad revision" in stderr
+
+
 def get_branch_status(wt_path: str, remote: str = "origin", main_branch: str = "main") -> dict:
-    """Get ahead/behind counts relative to remote/main_branch. Cached with TTL."""
+    """Get ahead/behind counts relative to remote/main_branch.
+
+    Cached with TTL; past the TTL the cached value is still reused while the
+    refs fingerprint is unchanged, so idle worktrees never spawn git.
+    """
     now = time.monotonic()
     with _cache_lock:
         cached = _branch_status_cache.get(wt_path)
         if cached and (now - cached[0]) < _GIT_CACHE_TTL:
             return cached[1]
+    # Stat the refs only once the TTL has run out, before running git so a ref
+    # moving mid-call invalidates the stored fingerprint rather than hiding behind it
+    fingerprint = _branch_status_fingerprint(wt_path, remote, main_branch)
+    if cached and fingerprint is not None:
+        with _cache_lock:
+            if _branch_status_fp.get(wt_path) == fingerprint:
+                return cached[1]
 
     try:
         repo = gitpython.Repo(wt_path)
         output = repo.git.rev_list("--left-right", "--count", f"{remote}/{main_branch}...HEAD")
         parts = output.strip().split("\t")
         value = {"behind": int(parts[0]), "ahead": int(parts[1])}
-    except (gitpython.GitCommandError, gitpython.InvalidGitRepositoryError, IndexError, ValueError):
-        value = {"behind": 0, "ahead": 0}
+    except gitpython.GitCommandError as e:
+        if _is_missing_revision(e):
+            # No <remote>/<main_branch> ref yet: a settled answer, cached until the refs fingerprint moves
+            value = {"behind": 0, "ahead": 0}
+        else:
+            # A transient failure (e.g. index.lock held) keeps the last good value, retried after the TTL
+            value = cached[1] if cached else {"behind": 0, "ahead": 0}
+            fingerprint = None
+    except (gitpython.InvalidGitRepositoryError, IndexError, ValueError):
+        value = cached[1] if cached else {"behind": 0, "ahead": 0}
+        fingerprint = None
     with _cache_lock:
         _branch_status_cache[wt_path] = (now, value)
+        if fingerprint is None:
+            _branch_status_fp.pop(wt_path, None)
+        else:
+            _branch_status_fp[wt_path] = fingerprint
     return value
 
 
 def get_worktree_dirty(wt_path: str) -> bool:
-    """Check if worktree has uncommitted changes. Cached with TTL."""
+    """Check if worktree has uncommitted changes. Cached with TTL.
+
+    One `git status --porcelain` covers staged, unstaged and untracked
+    changes; gitpython's is_dirty(untracked_files=True) runs three git commands.
+    """
     now = time.monotonic()
     with _cache_lock:
         cached = _dirty_cache.get(wt_path)
@@ -237,54 +348,69 @@ def get_worktree_dirty(wt_path: str) -> bool:
 
     try:
         repo = gitpython.Repo(wt_path)
-        value = repo.is_dirty(untracked_files=True)
+        value = bool(repo.git.status("--porcelain", "--untracked-files=normal"))
     except (gitpython.InvalidGitRepositoryError, gitpython.GitCommandError):
-        value = False
+        value = cached[1] if cached else False
     with _cache_lock:
         _dirty_cache[wt_path] = (now, value)
     return value
 
 
+def get_git_status(
+    wt_path: str, remote: str = "origin", main_branch: str = "main", include_dirty: bool = True,
+) -> tuple[dict, bool]:
+    """Get (branch status, dirty) for a worktree in one call.
+
+    Lets a periodic refresh run both checks in a single thread-pool job per worktree.
+    With include_dirty=False the `git status` scan is skipped and dirty is always False.
+    """
+    return get_branch_status(wt_path, remote, main_branch), include_dirty and get_worktree_dirty(wt_path)
+
+
 def invalidate_git_cache(wt_path: str) -> None:
     """Invalidate git caches for a worktree path after git operations."""
     with _cache_lock:
         _branch_status_cache.pop(wt_path, None)
+        _branch_status_fp.pop(wt_path, None)
         _dirty_cache.pop(wt_path, None)
 
 
 def discover_worktrees(config: ResolvedConfig) -> list[Worktree]:
     """Discover git worktrees from .git that match the configured prefix.
 
-    Uses `git worktree list` as the source of truth. Returns Worktree objects
-    for sw-managed worktrees (matching the configured prefix) that aren't in state.
-    The main repo checkout is excluded.
+    Reads the linked-worktree admin dirs (`<common dir>/worktrees/*`) directly,
+    the same records `git worktree list` reports, without spawning git.
+    Returns Worktree objects for sw-managed worktrees (matching the configured
+    prefix). The main repo checkout is excluded.
     """
     repo_root = str(config.repo_root)
     prefix = f"{config.worktree_prefix}-"
+    git_dir = resolve_git_dir(repo_root)
+    if git_dir is None:
+        return []
     try:
-        repo = gitpython.Repo(repo_root)
-        output = repo.git.worktree("list", "--porcelain")
-    except gitpython.GitCommandError:
+        admin_dirs = sorted(
+            (entry for entry in os.scandir(resolve_common_dir(git_dir) / "worktrees") if entry.is_dir()),
+            key=lambda entry: entry.name,
+        )
+    except OSError:
         return []
 
     discovered: list[Worktree] = []
-    current_path = ""
-    current_branch = ""
-    for line in output.splitlines():
-        if line.startswith("worktree "):
-            current_path = line[len("worktree "):]
-            current_branch = ""
-        elif line.startswith("branch "):
-            current_branch = line[len("branch refs/heads/"):]
-        elif line == "detached":
-            current_branch = "(detached)"
-        elif line == "" and current_path:
-            _process_worktree_entry(current_path, current_branch, repo_root, prefix, discovered)
-            current_path = ""
-
-    # Handle last entry if output doesn't end with blank line
-    if current_path:
-        _process_worktree_entry(current_path, current_branch, repo_root, prefix, discovered)
+    for entry in admin_dirs:
+        admin = Path(entry.path)
+        try:
+            dot_git = Path((admin / "gitdir").read_text().strip())
+        except OSError:
+            continue
+        if not dot_git.is_absolute():
+            dot_git = (admin / dot_git).resolve()
+        head_ref = read_head_ref(admin)
+        if head_ref is None:
+            branch = "(detached)"
+        else:
+            branch = head_ref.removeprefix("refs/heads/")
+        _process_worktree_entry(str(dot_git.parent), branch, repo_root, prefix, discovered)
 
     return discovered
 
@@ -304,7 +430,7 @@ def _process_worktree_entry(
 def prune_git_cache(valid_paths: set[str]) -> None:
     """Remove cache entries for worktree paths that no longer exist."""
     with _cache_lock:
-        for stale in set(_branch_status_cache) - valid_paths:
-            del _branch_status_cache[stale]
-        for stale in set(_dirty_cache) - valid_paths:
-            del _dirty_cache[stale]
+        for cache in (_branch_status_cache, _branch_status_fp, _dirty_cache):
+            # Key-view difference builds only the (usually empty) stale set, not a copy of every key
+            for stale in cache.keys() - valid_paths:
+                del cache[stale]
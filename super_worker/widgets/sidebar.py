@@ -6,7 +6,14 @@ from textual.widgets import Button, Label, ListItem, ListView, Static
 
 from super_worker.models import Session, Worktree
 from super_worker.services.tmux import SessionState, batch_detect_session_states
-from super_worker.services.worktree import get_branch_status, get_worktree_dirty
+
+_RUNNING_DOT = "[green]●[/]"
+_STATE_DOTS = {
+    SessionState.DEAD: "[red]●[/]",
+    SessionState.WAITING_APPROVAL: "[magenta]●[/]",
+    SessionState.WAITING_INPUT: "[yellow]●[/]",
+    SessionState.RUNNING: _RUNNING_DOT,
+}
 
 
 class SessionSelected(Message):
@@ -89,21 +96,28 @@ class SessionSidebar(Vertical):
         Binding("x", "delete_session", "Delete Session", show=True),
     ]
 
-    def __init__(self, remote: str = "origin", main_branch: str = "main") -> None:
+    def __init__(self, remote: str = "origin", main_branch: str = "main", show_dirty: bool = True) -> None:
         super().__init__()
         self._worktree: Worktree | None = None
         self._session_map: dict[int, Session] = {}
         self._prev_session_snapshot: str = ""
+        # Label text currently shown per list index, so only changed rows are re-rendered
+        self._prev_label_texts: list[str] = []
         self._prev_git_snapshot: str = ""
         self._remote = remote
         self._main_branch = main_branch
+        self._show_dirty = show_dirty
+        # Widgets updated on every refresh, held directly instead of re-queried each time
+        self._info = Static("", id="sidebar-info")
+        self._session_list = ListView(id="session-list")
+        self._git_status = Static("", id="git-status", markup=True)
 
     def compose(self) -> ComposeResult:
         yield Static("Sessions", classes="sidebar-section")
-        yield Static("", id="sidebar-info")
-        yield ListView(id="session-list")
+        yield self._info
+        yield self._session_list
         yield Static("Git", classes="sidebar-section")
-        yield Static("", id="git-status")
+        yield self._git_status
         with Vertical(id="git-actions"):
             yield Button("Commit", id="btn-git-commit", variant="default")
             yield Button("Push", id="btn-git-push", variant="default")
@@ -117,13 +131,7 @@ class SessionSidebar(Vertical):
 
     @staticmethod
     def _state_dot(state: SessionState) -> str:
-        if state == SessionState.DEAD:
-            return "[red]●[/]"
-        if state == SessionState.WAITING_APPROVAL:
-            return "[magenta]●[/]"
-        if state == SessionState.WAITING_INPUT:
-            return "[yellow]●[/]"
-        return "[green]●[/]"
+        return _STATE_DOTS.get(state, _RUNNING_DOT)
 
     def show_worktree(
         self,
@@ -136,8 +144,7 @@ class SessionSidebar(Vertical):
         self._worktree = worktree
 
         if is_new_worktree:
-            info = self.query_one("#sidebar-info", Static)
-            info.update(f" path: {worktree.path}")
+            self._info.update(f" path: {worktree.path}")
 
         # Use pre-fetched states or fetch inline
         if states is None:
@@ -159,20 +166,25 @@ class SessionSidebar(Vertical):
         self._prev_session_snapshot = snapshot
         self._session_map.clear()
 
-        sess_list = self.query_one("#session-list", ListView)
+        sess_list = self._session_list
         prev_index = sess_list.index
         current_count = len(sess_list.children)
         new_count = len(worktree.sessions)
 
         # Update existing items in-place, add/remove only as needed
+        prev_texts = self._prev_label_texts
+        label_texts: list[str] = []
         for i, s in enumerate(worktree.sessions):
             state = states.get(s.tmux_session_name, SessionState.RUNNING)
             dot = self._state_dot(state)
             label_text = f"{dot} {s.label}"
+            label_texts.append(label_text)
             self._session_map[i] = s
 
             if i < current_count:
-                # Update existing ListItem's label in-place
+                # Update existing ListItem's label in-place, only if its text changed
+                if i < len(prev_texts) and prev_texts[i] == label_text:
+                    continue
                 item = sess_list.children[i]
                 lbl = item.query_one(Label)
                 lbl.update(label_text)
@@ -186,6 +198,7 @@ class SessionSidebar(Vertical):
         # issues with async removal not shrinking children immediately)
         for child in list(sess_list.children[new_count:]):
             child.remove()
+        self._prev_label_texts = label_texts
 
         if prev_index is not None and prev_index < new_count:
             sess_list.index = prev_index
@@ -193,10 +206,10 @@ class SessionSidebar(Vertical):
         self._refresh_git_status(worktree, status=git_status, dirty=git_dirty)
 
     def _refresh_git_status(self, worktree: Worktree, status: dict | None = None, dirty: bool | None = None) -> None:
+        # Git data is fetched off the event loop by the app; until it arrives, keep what's shown
         if status is None:
-            status = get_branch_status(worktree.path, self._remote, self._main_branch)
-        if dirty is None:
-            dirty = get_worktree_dirty(worktree.path)
+            return
+        dirty = bool(dirty) and self._show_dirty
 
         git_snapshot = f"{worktree.branch}:{status['ahead']}:{status['behind']}:{dirty}"
         if git_snapshot == self._prev_git_snapshot:
@@ -205,14 +218,13 @@ class SessionSidebar(Vertical):
 
         parts = [f" branch: {worktree.branch}"]
         parts.append(f" ↑ {status['ahead']} ahead  ↓ {status['behind']} behind")
-        if dirty:
-            parts.append(" [yellow]● uncommitted changes[/]")
-        else:
-            parts.append(" [green]● clean[/]")
+        if self._show_dirty:
+            if dirty:
+                parts.append(" [yellow]● uncommitted changes[/]")
+            else:
+                parts.append(" [green]● clean[/]")
 
-        git_status = self.query_one("#git-status", Static)
-        git_status.markup = True
-        git_status.update("\n".join(parts))
+        self._git_status.update("\n".join(parts))
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         if event.list_view.id != "session-list":
@@ -235,8 +247,7 @@ class SessionSidebar(Vertical):
             self.post_message(GitAction(self._worktree, "pr"))
 
     def action_delete_session(self) -> None:
-        sess_list = self.query_one("#session-list", ListView)
-        idx = sess_list.index
+        idx = self._session_list.index
         if idx is not None and idx in self._session_map and self._worktree:
             session = self._session_map[idx]
             self.post_message(SessionDeleted(self._worktree, session))
@@ -1,5 +1,7 @@
 import logging
 import re
+import threading
+from collections import OrderedDict
 
 from rich.text import Text
 from textual.events import Key, Paste
@@ -9,13 +11,15 @@ from textual.widget import Widget
 from textual.widgets import Static
 from textual.worker import Worker, WorkerState
 
-from super_worker.constants import POLL_INTERVAL_MS, RESERVED_KEYS
+from super_worker.constants import POLL_INTERVAL_MS, RESERVED_KEYS, UNFOCUSED_POLL_EVERY
 from super_worker.services.tmux import capture_pane, send_keys
 
 logger = logging.getLogger(__name__)
 
 # Strip ANSI background color sequences to avoid theme bleed
 _BG_ANSI_RE = re.compile(r"\x1b\[(?:4[0-9]|10[0-7]|48;[0-9;]*)m")
+# Recent frames kept rendered, so a pane cycling through a few frames (spinners) skips re-parsing
+_FRAME_CACHE_SIZE = 8
 
 
 class TerminalPane(Widget, can_focus=True):
@@ -45,8 +49,13 @@ class TerminalPane(Widget, can_focus=True):
 
     def __init__(self) -> None:
         super().__init__()
-        self._last_hash: int = 0
+        # Last capture shown; compared whole, which is a memcmp and can't collide like a hash
+        self._last_raw: str | None = None
         self._timer = None
+        self._poll_tick = 0
+        # Raw capture -> rendered Text; capture workers run in threads and can overlap
+        self._frame_cache: OrderedDict[str, Text] = OrderedDict()
+        self._frame_lock = threading.Lock()
 
     def compose(self) -> ComposeResult:
         yield Static("Select a session · Ctrl+A to attach", id="terminal-content")
@@ -55,7 +64,9 @@ class TerminalPane(Widget, can_focus=True):
         if self._timer is not None:
             self._timer.stop()
             self._timer = None
-        self._last_hash = 0
+        self._last_raw = None
+        with self._frame_lock:
+            self._frame_cache.clear()
         try:
             content = self.query_one("#terminal-content", Static)
             if session_name:
@@ -65,27 +76,48 @@ class TerminalPane(Widget, can_focus=True):
         except Exception:
             logger.debug("terminal-content widget not available during session switch", exc_info=True)
         if session_name:
-            self._poll_pane()
+            self._request_capture()
             self._timer = self.set_interval(POLL_INTERVAL_MS / 1000, self._poll_pane)
 
     def _poll_pane(self) -> None:
+        # Panes in background tabs aren't drawn; unfocused ones are watched, not typed into
+        if not self.is_on_screen:
+            return
+        self._poll_tick += 1
+        if not self.has_focus and self._poll_tick % UNFOCUSED_POLL_EVERY:
+            return
+        self._request_capture()
+
+    def on_focus(self) -> None:
+        # Don't wait out the slower unfocused cadence once the user starts typing here
+        self._request_capture()
+
+    def _request_capture(self) -> None:
         session = self.active_session
         if not session:
             return
         self.run_worker(lambda: self._capture(session), thread=True, exclusive=True)
 
-    def _capture(self, session_name: str) -> tuple[int, Text] | None:
+    def _capture(self, session_name: str) -> tuple[str, Text] | None:
         raw = capture_pane(session_name)
-        content_hash = hash(raw)
-        if content_hash == self._last_hash:
+        if raw == self._last_raw:
             return None
-        clean = _BG_ANSI_RE.sub("", raw)
-        return content_hash, Text.from_ansi(clean)
+        with self._frame_lock:
+            text = self._frame_cache.get(raw)
+            if text is not None:
+                self._frame_cache.move_to_end(raw)
+                return raw, text
+        text = Text.from_ansi(_BG_ANSI_RE.sub("", raw))
+        with self._frame_lock:
+            self._frame_cache[raw] = text
+            if len(self._frame_cache) > _FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+        return raw, text
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         if event.state != WorkerState.SUCCESS or event.worker.result is None:
             return
-        self._last_hash = event.worker.result[0]
+        self._last_raw = event.worker.result[0]
         try:
             self.query_one("#terminal-content", Static).update(event.worker.result[1])
         except Exception:
@@ -11,19 +11,23 @@ import git as gitpython
 import pytest
 from unittest.mock import MagicMock
 
-from textual.widgets import Input
+from textual.widgets import Checkbox, Input
 
-from super_worker.app import SuperWorkerApp, WorktreeTabContent
+from super_worker.app import SuperWorkerApp, WorktreeTabContent, _is_gh_auth_error
+from super_worker.constants import REFRESH_MAX_FAILURES
 from super_worker.screens import (
     CommitMessageScreen,
     ConfigScreen,
     ConfirmDeleteScreen,
     NewSessionScreen,
     NewWorktreeScreen,
+    ProjectSelectorScreen,
     RenameSessionScreen,
 )
 from super_worker.models import Worktree
-from super_worker.widgets.sidebar import SessionDeleted
+from super_worker.services.state import load_state
+from super_worker.services.tmux import SessionState, invalidate_session_states
+from super_worker.widgets.sidebar import SessionDeleted, SessionSidebar
 from super_worker.widgets.terminal_pane import TerminalPane
 
 
@@ -32,12 +36,13 @@ def _make_mock_server():
     mock_session = MagicMock()
     mock_session.session_name = "sw-test-0"
     mock_session.active_pane = MagicMock()
-    mock_session.active_pane.capture_pane.return_value = ["test output"]
     mock_session.show_environment.return_value = {}
 
     mock_server = MagicMock()
     mock_server.sessions = [mock_session]
     mock_server.new_session.return_value = mock_session
+    # `tmux list-sessions -F` output used for batched state detection
+    mock_server.cmd.return_value = MagicMock(stdout=["sw-test-0\t"], stderr=[])
     return mock_server
 
 
@@ -52,6 +57,9 @@ def isolate_externals(tmp_path, monkeypatch):
     # Mock only the tmux daemon boundary
     mock_server = _make_mock_server()
     monkeypatch.setattr("super_worker.services.tmux.libtmux.Server", lambda: mock_server)
+    # capture_pane runs tmux directly rather than through the server object
+    monkeypatch.setattr("super_worker.widgets.terminal_pane.capture_pane", lambda name: "test output")
+    invalidate_session_states()
 
 
 @pytest.mark.asyncio
@@ -86,6 +94,20 @@ async def test_new_worktree_modal_cancel():
         assert not isinstance(app.screen, NewWorktreeScreen)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", ["bad name", "feat/x", "naïve"])
+async def test_new_worktree_rejects_invalid_name(name):
+    """Names outside [A-Za-z0-9_-] keep the dialog open instead of submitting."""
+    app = SuperWorkerApp()
+    async with app.run_test() as pilot:
+        await pilot.press("ctrl+n")
+        await pilot.pause()
+        app.screen.query_one("#wt-name", Input).value = name
+        await pilot.press("enter")
+        await pilot.pause()
+        assert isinstance(app.screen, NewWorktreeScreen)
+
+
 @pytest.mark.asyncio
 async def test_new_worktree_creates_tab(monkeypatch):
     """Submitting NewWorktreeScreen creates a worktree and adds a tab."""
@@ -101,7 +123,7 @@ async def test_new_worktree_creates_tab(monkeypatch):
                 wt_dir.mkdir(parents=True, exist_ok=True)
 
         mock_repo = MagicMock()
-        mock_repo.git.rev_parse.side_effect = gitpython.GitCommandError("rev-parse", 1)
+        mock_repo.heads.__getitem__.side_effect = IndexError
         mock_repo.git.worktree.side_effect = fake_worktree_cmd
         monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
 
@@ -225,6 +247,7 @@ async def test_delete_worktree_opens_confirm():
     """Ctrl+D opens ConfirmDeleteScreen for non-main worktrees."""
     app = SuperWorkerApp()
     async with app.run_test() as pilot:
+        await pilot.pause()  # let startup tab activation settle before overriding
         wt = Worktree(name="feature", path=str(app._config.repo_root), branch="sw-feature")
         app._state.worktrees.append(wt)
         app._active_worktree = wt
@@ -256,11 +279,33 @@ async def test_settings_modal_opens():
         assert isinstance(app.screen, ConfigScreen)
 
 
+@pytest.mark.asyncio
+async def test_settings_collect_reads_form():
+    """ConfigScreen turns its inputs and checkboxes into an SWConfig."""
+    app = SuperWorkerApp()
+    async with app.run_test() as pilot:
+        await pilot.press("ctrl+e")
+        await pilot.pause()
+        screen = app.screen
+        screen.query_one("#cfg-prefix", Input).value = "  proj "
+        screen.query_one("#cfg-symlinks", Input).value = ".venv, .env,"
+        screen.query_one("#cfg-show-dirty", Checkbox).value = False
+        cfg = screen._collect()
+        assert cfg.worktree.prefix == "proj"
+        assert cfg.env.symlinks == [".venv", ".env"]
+        assert cfg.ui.show_dirty is False
+
+        # An untouched toggle stays unset, so a global value still applies
+        screen.query_one("#cfg-show-dirty", Checkbox).value = app._config.show_dirty
+        assert screen._collect().ui.show_dirty is None
+
+
 @pytest.mark.asyncio
 async def test_no_active_session_warns_on_rename():
     """Ctrl+R with no active session does not crash."""
     app = SuperWorkerApp()
     async with app.run_test() as pilot:
+        await pilot.pause()  # let startup tab activation settle before overriding
         app._active_session_name = None
         await pilot.press("ctrl+r")
         await pilot.pause()
@@ -272,6 +317,7 @@ async def test_no_active_session_warns_on_attach():
     """Ctrl+A with no active session does not crash."""
     app = SuperWorkerApp()
     async with app.run_test() as pilot:
+        await pilot.pause()  # let startup tab activation settle before overriding
         app._active_worktree = None
         app._active_session_name = None
         await pilot.press("ctrl+a")
@@ -316,3 +362,197 @@ async def test_delete_active_session_clears_terminal():
 
         assert terminal.active_session is None
         assert app._active_session_name is None
+
+
+@pytest.mark.asyncio
+async def test_periodic_refresh_skips_background_worktrees(monkeypatch):
+    """Between full refreshes only the active worktree's git status is fetched."""
+    app = SuperWorkerApp()
+    async with app.run_test() as pilot:
+        active = app._state.worktrees[0]
+        background = Worktree(name="bg", path="/tmp/bg", branch="sw-bg")
+        app._state.worktrees.append(background)
+        app._active_worktree = active
+
+        requested: list[str] = []
+
+        def fake_status(path, *args):
+            requested.append(path)
+            return {"ahead": 0, "behind": 0}, False
+
+        monkeypatch.setattr("super_worker.app.get_git_status", fake_status)
+        app._refresh_tick = 0
+        await app._do_periodic_refresh()
+        assert sorted(requested) == sorted([active.path, background.path])
+
+        requested.clear()
+        await app._do_periodic_refresh()
+        assert requested == [active.path]
+
+
+@pytest.mark.asyncio
+async def test_periodic_refresh_pauses_after_repeated_failures(monkeypatch):
+    """Three failed refreshes in a row stop polling until the breaker is reset."""
+    app = SuperWorkerApp()
+    async with app.run_test() as pilot:
+        def failing_batch(*args, **kwargs):
+            raise RuntimeError("tmux unavailable")
+
+        monkeypatch.setattr("super_worker.app.batch_detect_session_states", failing_batch)
+        for _ in range(3):
+            await app._do_periodic_refresh()
+
+        assert app._refresh_failures == 3
+        assert app._refresh_timer is None
+
+        app._reset_circuit_breaker()
+        assert app._refresh_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_repo_handles_are_cached_per_worktree():
+    """Git actions reuse one Repo per worktree until it is dropped."""
+    app = SuperWorkerApp()
+    async with app.run_test() as pilot:
+        wt = app._state.worktrees[0]
+        repo = app._repo(wt)
+        assert app._repo(wt) is repo
+
+        app._close_repos([wt.path])
+        assert wt.path not in app._repo_cache
+
+
+@pytest.mark.asyncio
+async def test_periodic_refresh_skipped_while_unfocused(monkeypatch):
+    """No git/tmux polling happens while the app is blurred."""
+    app = SuperWorkerApp()
+    async with app.run_test() as pilot:
+        calls: list[list[str]] = []
+
+        def fake_detect(names):
+            calls.append(names)
+            return {}
+
+        monkeypatch.setattr("super_worker.app.batch_detect_session_states", fake_detect)
+        app.on_app_blur()
+        app._periodic_refresh()
+        await pilot.pause()
+        assert calls == []
+
+        app.on_app_focus()
+        await pilot.pause()
+        assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_focus_does_not_resume_tripped_refresh(monkeypatch):
+    """Regaining focus leaves polling paused after repeated failures."""
+    app = SuperWorkerApp()
+    async with app.run_test() as pilot:
+        calls: list[list[str]] = []
+
+        def fake_detect(names):
+            calls.append(names)
+            return {}
+
+        monkeypatch.setattr("super_worker.app.batch_detect_session_states", fake_detect)
+        app.on_app_blur()
+        app._refresh_failures = REFRESH_MAX_FAILURES
+        app.on_app_focus()
+        await pilot.pause()
+        assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_unchanged_refresh_skips_sidebar_render(monkeypatch):
+    """A refresh with identical inputs doesn't re-render the sidebar."""
+    app = SuperWorkerApp()
+    async with app.run_test() as pilot:
+        wt = app._state.worktrees[0]
+        app._active_worktree = wt
+        app._git_data[wt.name] = ({"ahead": 0, "behind": 0}, False)
+        sidebar = app.query_one(f"#wtc-{wt.name}", WorktreeTabContent).query_one(SessionSidebar)
+        calls = []
+        monkeypatch.setattr(sidebar, "show_worktree", lambda *a, **kw: calls.append(a))
+
+        app._update_refreshed_ui()
+        app._update_refreshed_ui()
+        assert len(calls) == 1
+
+        app._git_data[wt.name] = ({"ahead": 1, "behind": 0}, False)
+        app._update_refreshed_ui()
+        assert len(calls) == 2
+
+
+@pytest.mark.parametrize("stderr,expected", [
+    ("To get started with GitHub CLI, please run:  gh auth login", True),
+    ("HTTP 401: Bad credentials. Authentication required", True),
+    ("a pull request for branch \"sw-feat\" already exists", False),
+    ("", False),
+])
+def test_is_gh_auth_error(stderr, expected):
+    assert _is_gh_auth_error(stderr) is expected
+
+
+@pytest.mark.asyncio
+async def test_default_session_created_after_mount_and_saved():
+    """The main worktree's first session is created by its tab and persisted."""
+    app = SuperWorkerApp()
+    async with app.run_test() as pilot:
+        await pilot.pause(delay=0.5)
+        wt = app._state.get_worktree("main")
+        assert wt.sessions
+        assert app._active_session_name == wt.sessions[0].tmux_session_name
+        saved = load_state(app._config)
+        assert saved.get_worktree("main").sessions
+
+
+@pytest.mark.asyncio
+async def test_tab_label_shows_attention_from_refresh(monkeypatch):
+    """A session waiting for input marks its worktree's tab after a refresh."""
+    app = SuperWorkerApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        wt = app._state.worktrees[0]
+        git_data = ({"ahead": 0, "behind": 0}, False)
+        assert "🔔" not in app._tab_label(wt, git_data=git_data)
+
+        monkeypatch.setattr(
+            "super_worker.app.batch_detect_session_states",
+            lambda names: {n: SessionState.WAITING_INPUT for n in names},
+        )
+        await app._fetch_refresh_data()
+        assert app._tab_label(wt, git_data=git_data).endswith(" 🔔")
+
+
+@pytest.mark.asyncio
+async def test_removing_last_tab_swaps_in_empty_state():
+    """The cached tab strip / empty-state refs follow the widgets actually mounted."""
+    app = SuperWorkerApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        assert app._tabs is app.query_one("#tabs")
+        wt = app._state.worktrees.pop(0)
+
+        await app._remove_worktree_tab(wt.name)
+        assert app._tabs is None
+        assert app._empty is app.query_one("#empty-state")
+
+        app._state.worktrees.append(wt)
+        await app._add_worktree_tab(wt)
+        assert app._empty is None
+        assert not app.query("#empty-state")
+        assert app._tabs is app.query_one("#tabs")
+
+
+@pytest.mark.asyncio
+async def test_project_selector_returns_clicked_path():
+    """Clicking a project button dismisses the selector with that project's path."""
+    app = SuperWorkerApp()
+    async with app.run_test() as pilot:
+        chosen = []
+        app.push_screen(ProjectSelectorScreen(["/repos/a", "/repos/b"], "/repos/a"), callback=chosen.append)
+        await pilot.pause()
+        await pilot.click("#proj-1")
+        await pilot.pause()
+        assert chosen == ["/repos/b"]
@@ -1,7 +1,7 @@
 import pytest
 from click.testing import CliRunner
 
-from super_worker.cli import cli
+from super_worker.cli import _missing_tools, cli
 from super_worker.config import ResolvedConfig
 from super_worker.models import AppState, Session, Worktree
 
@@ -38,18 +38,18 @@ def mock_env(tmp_path, monkeypatch):
     wt.sessions.append(Session(tmux_session_name="sw-main-0", label="session 0"))
     state = AppState(repo_root=str(repo_root), worktree_base=str(base_dir), worktrees=[wt])
 
-    monkeypatch.setattr("super_worker.cli.load_config", lambda *a, **kw: config)
-    monkeypatch.setattr("super_worker.cli.load_state", lambda *a, **kw: state)
-    monkeypatch.setattr("super_worker.cli.update_projects_registry", lambda *a, **kw: None)
-    monkeypatch.setattr("super_worker.cli.save_state", lambda *a, **kw: None)
+    monkeypatch.setattr("super_worker.config.load_config", lambda *a, **kw: config)
+    monkeypatch.setattr("super_worker.services.state.load_state", lambda *a, **kw: state)
+    monkeypatch.setattr("super_worker.services.state.update_projects_registry", lambda *a, **kw: None)
+    monkeypatch.setattr("super_worker.services.state.save_state", lambda *a, **kw: None)
 
     return config, state
 
 
 def test_list_shows_worktrees(runner, mock_env, monkeypatch):
-    monkeypatch.setattr("super_worker.cli.is_session_alive", lambda *a, **kw: True)
-    monkeypatch.setattr("super_worker.cli.get_branch_status", lambda *a, **kw: {"ahead": 1, "behind": 0})
-    monkeypatch.setattr("super_worker.cli.get_worktree_dirty", lambda *a, **kw: False)
+    monkeypatch.setattr("super_worker.services.tmux.get_live_session_names", lambda: {"sw-main-0"})
+    monkeypatch.setattr("super_worker.services.worktree.get_branch_status", lambda *a, **kw: {"ahead": 1, "behind": 0})
+    monkeypatch.setattr("super_worker.services.worktree.get_worktree_dirty", lambda *a, **kw: False)
 
     result = runner.invoke(cli, ["list"])
 
@@ -61,6 +61,28 @@ def test_list_shows_worktrees(runner, mock_env, monkeypatch):
     assert "↑1 ↓0" in result.output
 
 
+def test_list_keeps_results_with_their_worktree(runner, mock_env, monkeypatch):
+    _, state = mock_env
+    feat = Worktree(name="feat", path="/tmp/feat", branch="sw-feat")
+    feat.sessions.append(Session(tmux_session_name="sw-feat-0", label="feat session"))
+    state.worktrees.append(feat)
+    monkeypatch.setattr("super_worker.services.tmux.get_live_session_names", lambda: {"sw-feat-0"})
+    monkeypatch.setattr(
+        "super_worker.services.worktree.get_branch_status",
+        lambda path, *a, **kw: {"ahead": 2 if path == "/tmp/feat" else 0, "behind": 0},
+    )
+    monkeypatch.setattr("super_worker.services.worktree.get_worktree_dirty", lambda path: path == "/tmp/feat")
+
+    result = runner.invoke(cli, ["list"])
+
+    assert result.exit_code == 0
+    main_block, feat_block = result.output.split("\nfeat ")
+    assert "[↑0 ↓0]\n" in main_block
+    assert "session 0 [exited]" in main_block
+    assert "[↑2 ↓0] *" in feat_block
+    assert "feat session [alive]" in feat_block
+
+
 def test_list_empty(runner, mock_env, monkeypatch):
     _, state = mock_env
     state.worktrees.clear()
@@ -74,7 +96,7 @@ def test_list_empty(runner, mock_env, monkeypatch):
 def test_new_creates_worktree(runner, mock_env, monkeypatch):
     _, state = mock_env
     created = Worktree(name="feat", path="/tmp/feat", branch="sw-feat")
-    monkeypatch.setattr("super_worker.cli.create_worktree", lambda *a, **kw: created)
+    monkeypatch.setattr("super_worker.services.worktree.create_worktree", lambda *a, **kw: created)
 
     result = runner.invoke(cli, ["new", "feat"])
 
@@ -92,7 +114,7 @@ def test_new_duplicate_name_fails(runner, mock_env):
 
 def test_add_session_to_worktree(runner, mock_env, monkeypatch):
     new_session = Session(tmux_session_name="sw-main-1", label="/plan")
-    monkeypatch.setattr("super_worker.cli.create_session", lambda *a, **kw: new_session)
+    monkeypatch.setattr("super_worker.services.tmux.create_session", lambda *a, **kw: new_session)
 
     result = runner.invoke(cli, ["add", "main", "--prompt", "/plan"])
 
@@ -114,9 +136,9 @@ def test_cleanup_kills_and_removes(runner, mock_env, monkeypatch):
     feat_wt.sessions.append(Session(tmux_session_name="sw-feat-0", label="session 0"))
     state.worktrees.append(feat_wt)
 
-    monkeypatch.setattr("super_worker.cli.kill_all_sessions", lambda *a, **kw: None)
-    monkeypatch.setattr("super_worker.cli.remove_worktree", lambda *a, **kw: None)
-    monkeypatch.setattr("super_worker.cli.remove_worktree_from_state", lambda s, *a, **kw: s)
+    monkeypatch.setattr("super_worker.services.tmux.kill_all_sessions", lambda *a, **kw: None)
+    monkeypatch.setattr("super_worker.services.worktree.remove_worktree", lambda *a, **kw: None)
+    monkeypatch.setattr("super_worker.services.state.remove_worktree_from_state", lambda s, *a, **kw: s)
 
     result = runner.invoke(cli, ["cleanup", "feat"])
 
@@ -135,3 +157,78 @@ def test_config_show(runner, mock_env):
     assert config.branch_prefix in result.output
     assert config.main_branch in result.output
     assert config.remote in result.output
+
+
+def test_config_set_list_field(runner, mock_env):
+    config, _ = mock_env
+
+    result = runner.invoke(cli, ["config", "env.symlinks", ".venv, .env"])
+
+    assert result.exit_code == 0
+    assert 'symlinks = [".venv", ".env"]' in (config.repo_root / ".sw.toml").read_text()
+
+
+def test_config_set_unchanged_value_skips_write(runner, mock_env):
+    config, _ = mock_env
+    (config.repo_root / ".sw.toml").write_text('[worktree]\nbranch_prefix = "feat-"\n')
+
+    result = runner.invoke(cli, ["config", "worktree.branch_prefix", "feat-"])
+
+    assert result.exit_code == 0
+    assert "already" in result.output
+    assert "Saved" not in result.output
+
+
+def test_config_set_bool_field(runner, mock_env):
+    config, _ = mock_env
+    toml_path = config.repo_root / ".sw.toml"
+
+    result = runner.invoke(cli, ["config", "ui.show_dirty", "false"])
+    assert result.exit_code == 0
+    assert "show_dirty = false" in toml_path.read_text()
+
+    result = runner.invoke(cli, ["config", "ui.show_dirty", "false"])
+    assert result.exit_code == 0
+    assert "already" in result.output
+
+    # An explicit true is kept, so it can override a global false
+    result = runner.invoke(cli, ["config", "ui.show_dirty", "true"])
+    assert result.exit_code == 0
+    assert "show_dirty = true" in toml_path.read_text()
+
+
+def test_config_set_invalid_value_writes_nothing(runner, mock_env):
+    config, _ = mock_env
+    toml_path = config.repo_root / ".sw.toml"
+    toml_path.write_text("[ui]\nshow_dirty = true\n")
+
+    result = runner.invoke(cli, ["config", "ui.show_dirty", "maybe"])
+
+    assert result.exit_code == 1
+    assert "Invalid value" in result.output
+    assert toml_path.read_text() == "[ui]\nshow_dirty = true\n"
+
+
+def test_prerequisites_skipped_for_read_only_commands(runner, mock_env, monkeypatch):
+    monkeypatch.setattr("super_worker.cli._missing_tools", lambda path: ("tmux", "claude"))
+    _, state = mock_env
+    state.worktrees.clear()
+
+    assert runner.invoke(cli, ["list"]).exit_code == 0
+    result = runner.invoke(cli, ["add", "main"])
+    assert result.exit_code == 1
+    assert "Missing required tools" in result.output
+
+
+def test_missing_tools_cached_per_path(monkeypatch):
+    lookups = []
+    monkeypatch.setattr("super_worker.cli.shutil.which", lambda name, path=None: lookups.append(name) or None)
+    _missing_tools.cache_clear()
+    try:
+        assert len(_missing_tools("/a")) == 2
+        _missing_tools("/a")
+        assert lookups == ["tmux", "claude"]
+        _missing_tools("/b")
+        assert len(lookups) == 4
+    finally:
+        _missing_tools.cache_clear()
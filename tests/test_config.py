@@ -1,8 +1,7 @@
 import hashlib
+import tomllib
 from pathlib import Path
-from unittest.mock import MagicMock, PropertyMock, patch
 
-import git as gitpython
 import pytest
 
 from super_worker.config import (
@@ -21,6 +20,7 @@ from super_worker.config import (
     detect_repo_root,
     load_config,
     save_project_config,
+    split_csv,
 )
 
 
@@ -41,84 +41,122 @@ def test_toml_value(value, expected):
     ('say "hi"', 'say \\"hi\\"'),
     ('a\\b "c"', 'a\\\\b \\"c\\"'),
     ("simple", "simple"),
+    ("line1\nline2\tx", "line1\\nline2\\tx"),
 ])
 def test_escape_toml_str(value, expected):
     assert _escape_toml_str(value) == expected
+    assert tomllib.loads(f'k = "{_escape_toml_str(value)}"')["k"] == value
+
+
+@pytest.mark.parametrize("raw,expected", [
+    (".venv, .env", [".venv", ".env"]),
+    (" a ,, b ,", ["a", "b"]),
+    ("", []),
+    (" , ", []),
+])
+def test_split_csv(raw, expected):
+    assert split_csv(raw) == expected
+
+
+def _make_repo(
+    root: Path,
+    remotes: tuple[str, ...] = (),
+    remote_head: str | None = None,
+    loose_refs: tuple[str, ...] = (),
+    packed_refs: tuple[str, ...] = (),
+) -> Path:
+    """Lay out a minimal `.git` directory with the given remotes and refs."""
+    git_dir = root / ".git"
+    git_dir.mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    config = "[core]\n\tbare = false\n"
+    for name in remotes:
+        config += f'[remote "{name}"]\n\turl = git@example.com:{name}/repo.git\n'
+    (git_dir / "config").write_text(config)
+    for ref in loose_refs:
+        (git_dir / ref).parent.mkdir(parents=True, exist_ok=True)
+        (git_dir / ref).write_text("0" * 40 + "\n")
+    if remote_head:
+        remote, _, _ = remote_head.removeprefix("refs/remotes/").partition("/")
+        head = git_dir / "refs" / "remotes" / remote / "HEAD"
+        head.parent.mkdir(parents=True, exist_ok=True)
+        head.write_text(f"ref: {remote_head}\n")
+    if packed_refs:
+        lines = ["# pack-refs with: peeled fully-peeled sorted"]
+        lines += [f"{'0' * 40} {ref}" for ref in packed_refs]
+        (git_dir / "packed-refs").write_text("\n".join(lines) + "\n")
+    return root
 
 
 class TestDetectRepoRoot:
-    def test_success(self, monkeypatch):
-        mock_repo = MagicMock()
-        mock_repo.working_dir = "/home/user/myrepo"
-        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
-        result = detect_repo_root()
-        assert result == Path("/home/user/myrepo")
-
-    def test_not_a_repo(self, monkeypatch):
-        monkeypatch.setattr(
-            gitpython, "Repo",
-            MagicMock(side_effect=gitpython.InvalidGitRepositoryError("not a repo")),
-        )
+    def test_success(self, tmp_path):
+        root = _make_repo(tmp_path / "myrepo")
+        assert detect_repo_root(root) == root
+
+    def test_from_subdirectory(self, tmp_path):
+        root = _make_repo(tmp_path / "myrepo")
+        (root / "src" / "pkg").mkdir(parents=True)
+        assert detect_repo_root(root / "src" / "pkg") == root
+
+    def test_linked_worktree(self, tmp_path):
+        main = _make_repo(tmp_path / "main")
+        linked = tmp_path / "linked"
+        linked.mkdir()
+        (linked / ".git").write_text(f"gitdir: {main / '.git' / 'worktrees' / 'linked'}\n")
+        assert detect_repo_root(linked) == linked
+
+    def test_not_a_repo(self, tmp_path):
         with pytest.raises(RuntimeError, match="Not inside a git repository"):
-            detect_repo_root()
+            detect_repo_root(tmp_path)
 
 
 class TestDetectRemote:
-    def test_returns_origin_when_present(self, monkeypatch):
-        mock_repo = MagicMock()
-        upstream = MagicMock()
-        upstream.name = "upstream"
-        origin = MagicMock()
-        origin.name = "origin"
-        mock_repo.remotes = [upstream, origin]
-        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
-        assert detect_remote() == "origin"
-
-    def test_returns_first_remote_when_no_origin(self, monkeypatch):
-        mock_repo = MagicMock()
-        upstream = MagicMock()
-        upstream.name = "upstream"
-        fork = MagicMock()
-        fork.name = "fork"
-        mock_repo.remotes = [upstream, fork]
-        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
-        assert detect_remote() == "upstream"
-
-    def test_returns_origin_on_no_remotes(self, monkeypatch):
-        mock_repo = MagicMock()
-        mock_repo.remotes = []
-        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
-        assert detect_remote() == "origin"
+    def test_returns_origin_when_present(self, tmp_path):
+        root = _make_repo(tmp_path, remotes=("upstream", "origin"))
+        assert detect_remote(root) == "origin"
+
+    def test_returns_first_remote_when_no_origin(self, tmp_path):
+        root = _make_repo(tmp_path, remotes=("upstream", "fork"))
+        assert detect_remote(root) == "upstream"
+
+    def test_returns_origin_on_no_remotes(self, tmp_path):
+        root = _make_repo(tmp_path)
+        assert detect_remote(root) == "origin"
+
+    def test_returns_origin_outside_repo(self, tmp_path):
+        assert detect_remote(tmp_path) == "origin"
+
+    def test_linked_worktree_reads_common_config(self, tmp_path):
+        main = _make_repo(tmp_path / "main", remotes=("upstream",))
+        wt_git_dir = main / ".git" / "worktrees" / "linked"
+        wt_git_dir.mkdir(parents=True)
+        (wt_git_dir / "commondir").write_text("../..\n")
+        linked = tmp_path / "linked"
+        linked.mkdir()
+        (linked / ".git").write_text(f"gitdir: {wt_git_dir}\n")
+        assert detect_remote(linked) == "upstream"
 
 
 class TestDetectMainBranch:
-    def test_from_symbolic_ref(self, monkeypatch):
-        mock_repo = MagicMock()
-        mock_repo.git.symbolic_ref.return_value = "refs/remotes/origin/develop"
-        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
-        assert detect_main_branch("origin") == "develop"
-
-    def test_fallback_to_main(self, monkeypatch):
-        mock_repo = MagicMock()
-        mock_repo.git.symbolic_ref.side_effect = gitpython.GitCommandError("symbolic-ref", 1)
-        # rev_parse succeeds for "main"
-        mock_repo.git.rev_parse.return_value = ""
-        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
-        assert detect_main_branch("origin") == "main"
-
-    def test_fallback_to_master(self, monkeypatch):
-        mock_repo = MagicMock()
-        mock_repo.git.symbolic_ref.side_effect = gitpython.GitCommandError("symbolic-ref", 1)
-
-        def fake_rev_parse(*args):
-            ref = args[-1]
-            if "main" in ref:
-                raise gitpython.GitCommandError("rev-parse", 1)
-            return ""
-
-        mock_repo.git.rev_parse.side_effect = fake_rev_parse
-        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
-        assert detect_main_branch("origin") == "master"
+    def test_from_symbolic_ref(self, tmp_path):
+        root = _make_repo(tmp_path, remote_head="refs/remotes/origin/develop")
+        assert detect_main_branch("origin", root) == "develop"
+
+    def test_fallback_to_main(self, tmp_path):
+        root = _make_repo(tmp_path, loose_refs=("refs/remotes/origin/main", "refs/remotes/origin/master"))
+        assert detect_main_branch("origin", root) == "main"
+
+    def test_fallback_to_master(self, tmp_path):
+        root = _make_repo(tmp_path, loose_refs=("refs/remotes/origin/master",))
+        assert detect_main_branch("origin", root) == "master"
+
+    def test_fallback_to_packed_master(self, tmp_path):
+        root = _make_repo(tmp_path, packed_refs=("refs/remotes/origin/master",))
+        assert detect_main_branch("origin", root) == "master"
+
+    def test_defaults_to_main(self, tmp_path):
+        root = _make_repo(tmp_path)
+        assert detect_main_branch("origin", root) == "main"
 
 
 class TestMergeConfigs:
@@ -154,6 +192,19 @@ class TestMergeConfigs:
         assert merged.git.main_branch == "develop"
         assert merged.ui.name_placeholder == "my-feature"
 
+    def test_project_bool_overrides_global_either_way(self):
+        enabled = SWConfig(ui=UIConfig(show_dirty=True))
+        disabled = SWConfig(ui=UIConfig(show_dirty=False))
+        assert _merge_configs(enabled, disabled).ui.show_dirty is True
+        assert _merge_configs(disabled, enabled).ui.show_dirty is False
+        assert _merge_configs(SWConfig(), disabled).ui.show_dirty is False
+        assert _merge_configs(SWConfig(), SWConfig()).ui.show_dirty is None
+
+        hidden_on = SWConfig(ui=UIConfig(refresh_if_hidden=True))
+        hidden_off = SWConfig(ui=UIConfig(refresh_if_hidden=False))
+        assert _merge_configs(hidden_off, hidden_on).ui.refresh_if_hidden is False
+        assert _merge_configs(hidden_on, hidden_off).ui.refresh_if_hidden is True
+
 
 class TestLoadToml:
     def test_missing_file_returns_default(self, tmp_path):
@@ -166,6 +217,28 @@ class TestLoadToml:
         result = load_toml(toml_file)
         assert result.worktree.prefix == "my-proj"
 
+    def test_reuses_parse_until_file_changes(self, tmp_path, monkeypatch):
+        toml_file = tmp_path / "config.toml"
+        toml_file.write_text('[worktree]\nprefix = "my-proj"\n')
+        load_toml(toml_file)
+
+        parses = []
+        real_load = tomllib.load
+        monkeypatch.setattr(tomllib, "load", lambda f: parses.append(f) or real_load(f))
+        assert load_toml(toml_file).worktree.prefix == "my-proj"
+        assert parses == []
+
+        toml_file.write_text('[worktree]\nprefix = "renamed-proj"\n')
+        assert load_toml(toml_file).worktree.prefix == "renamed-proj"
+        assert len(parses) == 1
+
+    def test_returns_independent_copies(self, tmp_path):
+        toml_file = tmp_path / "config.toml"
+        toml_file.write_text('[env]\nsymlinks = [".venv"]\n')
+        first = load_toml(toml_file)
+        first.env.symlinks.append(".claude")
+        assert load_toml(toml_file).env.symlinks == [".venv"]
+
 
 class TestSaveProjectConfig:
     def test_round_trip(self, tmp_path):
@@ -186,6 +259,14 @@ class TestSaveProjectConfig:
         # Default values are not written
         assert content.strip() == ""
 
+    def test_layout_skips_default_sections(self, tmp_path):
+        config = SWConfig(
+            worktree=WorktreeConfig(prefix="proj"),
+            ui=UIConfig(show_dirty=False),
+        )
+        path = save_project_config(tmp_path, config)
+        assert path.read_text() == '[worktree]\nprefix = "proj"\n\n[ui]\nshow_dirty = false\n\n'
+
 
 class TestResolvedConfig:
     def test_state_hash_deterministic(self, tmp_path):
@@ -249,38 +330,47 @@ class TestResolvedConfig:
 
 
 class TestLoadConfig:
-    def test_auto_detection(self, tmp_path, monkeypatch):
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-
-        mock_repo = MagicMock()
-        mock_repo.working_dir = str(repo_root)
-        origin = MagicMock()
-        origin.name = "origin"
-        mock_repo.remotes = [origin]
-        mock_repo.git.symbolic_ref.return_value = "refs/remotes/origin/main"
-
-        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
+    def test_auto_detection(self, tmp_path):
+        repo_root = _make_repo(tmp_path / "repo", remotes=("origin",), remote_head="refs/remotes/origin/main")
         cfg = load_config(str(repo_root))
         assert cfg.repo_root == repo_root
         assert cfg.main_branch == "main"
         assert cfg.remote == "origin"
 
-    def test_project_toml_overrides(self, tmp_path, monkeypatch):
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
+    def test_project_toml_overrides(self, tmp_path):
+        repo_root = _make_repo(tmp_path / "repo", remotes=("origin",), remote_head="refs/remotes/origin/main")
         (repo_root / ".sw.toml").write_text(
             '[worktree]\nprefix = "custom"\n[git]\nmain_branch = "develop"\n'
         )
-
-        mock_repo = MagicMock()
-        mock_repo.working_dir = str(repo_root)
-        origin = MagicMock()
-        origin.name = "origin"
-        mock_repo.remotes = [origin]
-        mock_repo.git.symbolic_ref.return_value = "refs/remotes/origin/main"
-
-        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
         cfg = load_config(str(repo_root))
         assert cfg.worktree_prefix == "custom"
         assert cfg.main_branch == "develop"
+        assert cfg.show_dirty is True
+
+    def test_project_show_dirty_overrides_global(self, tmp_path, monkeypatch):
+        home = tmp_path / "home"
+        (home / ".config" / "sw").mkdir(parents=True)
+        (home / ".config" / "sw" / "config.toml").write_text("[ui]\nshow_dirty = false\n")
+        monkeypatch.setattr(Path, "home", lambda: home)
+        repo_root = _make_repo(tmp_path / "repo")
+        assert load_config(str(repo_root)).show_dirty is False
+
+        (repo_root / ".sw.toml").write_text("[ui]\nshow_dirty = true\n")
+        assert load_config(str(repo_root)).show_dirty is True
+
+    def test_project_refresh_if_hidden_overrides_global(self, tmp_path, monkeypatch):
+        home = tmp_path / "home"
+        (home / ".config" / "sw").mkdir(parents=True)
+        (home / ".config" / "sw" / "config.toml").write_text("[ui]\nrefresh_if_hidden = true\n")
+        monkeypatch.setattr(Path, "home", lambda: home)
+        repo_root = _make_repo(tmp_path / "repo")
+        assert load_config(str(repo_root)).refresh_if_hidden is True
+
+        (repo_root / ".sw.toml").write_text("[ui]\nrefresh_if_hidden = false\n")
+        assert load_config(str(repo_root)).refresh_if_hidden is False
+
+    def test_show_dirty_can_be_disabled(self, tmp_path):
+        repo_root = _make_repo(tmp_path / "repo")
+        (repo_root / ".sw.toml").write_text("[ui]\nshow_dirty = false\n")
+        cfg = load_config(str(repo_root))
+        assert cfg.show_dirty is False
@@ -0,0 +1,50 @@
+from super_worker.gitdir import read_head_ref, resolve_common_dir, resolve_git_dir
+
+
+class TestResolveGitDir:
+    def test_main_checkout(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        assert resolve_git_dir(tmp_path) == tmp_path / ".git"
+
+    def test_linked_worktree(self, tmp_path):
+        git_dir = tmp_path / "repo" / ".git" / "worktrees" / "wt"
+        git_dir.mkdir(parents=True)
+        wt = tmp_path / "wt"
+        wt.mkdir()
+        (wt / ".git").write_text(f"gitdir: {git_dir}\n")
+        assert resolve_git_dir(wt) == git_dir
+
+    def test_relative_gitdir(self, tmp_path):
+        git_dir = tmp_path / "repo" / ".git" / "worktrees" / "wt"
+        git_dir.mkdir(parents=True)
+        wt = tmp_path / "wt"
+        wt.mkdir()
+        (wt / ".git").write_text("gitdir: ../repo/.git/worktrees/wt\n")
+        assert resolve_git_dir(wt) == git_dir.resolve()
+
+    def test_not_a_repo(self, tmp_path):
+        assert resolve_git_dir(tmp_path) is None
+
+
+class TestResolveCommonDir:
+    def test_main_checkout_is_its_own_common_dir(self, tmp_path):
+        assert resolve_common_dir(tmp_path) == tmp_path
+
+    def test_linked_worktree_follows_commondir(self, tmp_path):
+        git_dir = tmp_path / ".git" / "worktrees" / "wt"
+        git_dir.mkdir(parents=True)
+        (git_dir / "commondir").write_text("../..\n")
+        assert resolve_common_dir(git_dir) == (tmp_path / ".git").resolve()
+
+
+class TestReadHeadRef:
+    def test_symbolic_ref(self, tmp_path):
+        (tmp_path / "HEAD").write_text("ref: refs/heads/feat\n")
+        assert read_head_ref(tmp_path) == "refs/heads/feat"
+
+    def test_detached_head(self, tmp_path):
+        (tmp_path / "HEAD").write_text("a" * 40 + "\n")
+        assert read_head_ref(tmp_path) is None
+
+    def test_missing_head(self, tmp_path):
+        assert read_head_ref(tmp_path) is None
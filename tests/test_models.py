@@ -11,6 +11,29 @@ class TestSession:
         assert len(s1.id) == 8
 
 
+class TestWorktreeGetSession:
+    def test_finds_by_tmux_name(self):
+        s0 = Session(tmux_session_name="sw-feat-0", label="s0")
+        s1 = Session(tmux_session_name="sw-feat-1", label="s1")
+        wt = Worktree(name="feat", path="/tmp/feat", branch="sw-feat", sessions=[s0, s1])
+        assert wt.get_session("sw-feat-1") is s1
+        assert wt.get_session("sw-feat-9") is None
+
+    def test_sees_appended_sessions(self):
+        wt = Worktree(name="feat", path="/tmp/feat", branch="sw-feat")
+        assert wt.get_session("sw-feat-0") is None
+        s0 = Session(tmux_session_name="sw-feat-0", label="s0")
+        wt.sessions.append(s0)
+        assert wt.get_session("sw-feat-0") is s0
+
+    def test_sees_reassigned_sessions(self):
+        s0 = Session(tmux_session_name="sw-feat-0", label="s0")
+        wt = Worktree(name="feat", path="/tmp/feat", branch="sw-feat", sessions=[s0])
+        assert wt.get_session("sw-feat-0") is s0
+        wt.sessions = [Session(tmux_session_name="sw-feat-1", label="s1")]
+        assert wt.get_session("sw-feat-0") is None
+
+
 class TestAppState:
     @pytest.mark.parametrize("name,expected_found", [
         ("feat", True),
@@ -22,3 +45,12 @@ class TestAppState:
         state = AppState(repo_root="/repo", worktree_base="/wt", worktrees=[wt])
         result = state.get_worktree(name)
         assert (result is wt) == expected_found
+
+    def test_get_worktree_tracks_list_changes(self):
+        state = AppState(repo_root="/repo", worktree_base="/wt")
+        assert state.get_worktree("feat") is None
+        wt = Worktree(name="feat", path="/tmp/feat", branch="sw-feat")
+        state.worktrees.append(wt)
+        assert state.get_worktree("feat") is wt
+        state.worktrees = [w for w in state.worktrees if w.name != "feat"]
+        assert state.get_worktree("feat") is None
@@ -2,7 +2,7 @@
 
 import pytest
 from textual.app import App, ComposeResult
-from textual.widgets import ListView
+from textual.widgets import Label, ListView
 
 from super_worker.models import Session, Worktree
 from super_worker.services.tmux import SessionState
@@ -122,6 +122,32 @@ async def test_show_worktree_skips_rebuild_when_unchanged():
         assert list(list_view.children) == items_before
 
 
+@pytest.mark.asyncio
+async def test_show_worktree_updates_only_changed_labels(monkeypatch):
+    """When one session's state flips, only that row's label is re-rendered."""
+    wt = _make_worktree(["alpha", "beta", "gamma"])
+    app = SidebarTestApp()
+    async with app.run_test() as pilot:
+        sidebar = app.query_one(SessionSidebar)
+        sidebar.show_worktree(wt, states=_states(wt), git_status={"ahead": 0, "behind": 0}, git_dirty=False)
+        await pilot.pause()
+
+        updated: list[str] = []
+        original_update = Label.update
+
+        def spy(label, content="", *args, **kwargs):
+            updated.append(str(content))
+            return original_update(label, content, *args, **kwargs)
+
+        monkeypatch.setattr(Label, "update", spy)
+        states = _states(wt)
+        states["sw-test-1"] = SessionState.WAITING_INPUT
+        sidebar.show_worktree(wt, states=states, git_status={"ahead": 0, "behind": 0}, git_dirty=False)
+        await pilot.pause()
+
+        assert updated == ["[yellow]●[/] beta"]
+
+
 @pytest.mark.asyncio
 async def test_session_map_tracks_indices():
     """_session_map maps each index to the corresponding Session object."""
@@ -135,3 +161,21 @@ async def test_session_map_tracks_indices():
         assert len(sidebar._session_map) == 3
         for i, session in enumerate(wt.sessions):
             assert sidebar._session_map[i] is session
+
+
+@pytest.mark.asyncio
+async def test_show_worktree_without_git_data_keeps_git_panel(monkeypatch):
+    """Without pre-fetched git data the sidebar keeps its panel instead of running git inline."""
+    monkeypatch.setattr(
+        "super_worker.services.worktree.gitpython.Repo",
+        lambda *a, **kw: pytest.fail("git must not run on the event loop"),
+    )
+    wt = _make_worktree(["alpha"])
+    app = SidebarTestApp()
+    async with app.run_test() as pilot:
+        sidebar = app.query_one(SessionSidebar)
+        sidebar.show_worktree(wt, states=_states(wt), git_status={"ahead": 2, "behind": 0}, git_dirty=False)
+        sidebar.show_worktree(wt, states=_states(wt))
+        await pilot.pause()
+
+        assert sidebar._prev_git_snapshot == "main:2:0:False"
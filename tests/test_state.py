@@ -1,10 +1,13 @@
 import json
+import os
 from pathlib import Path
 
 import pytest
 
 from super_worker.models import AppState, Session, Worktree
 from super_worker.services.state import (
+    _ensure_state_dir,
+    _existing_dirs,
     _migrate_data,
     _state_file_for,
     load_projects_registry,
@@ -27,6 +30,15 @@ def _redirect_state_dir(tmp_path, monkeypatch):
     return state_dir
 
 
+def test_ensure_state_dir_follows_state_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("super_worker.services.state.STATE_DIR", tmp_path / "a")
+    _ensure_state_dir()
+    monkeypatch.setattr("super_worker.services.state.STATE_DIR", tmp_path / "b")
+    _ensure_state_dir()
+    assert (tmp_path / "a").is_dir()
+    assert (tmp_path / "b").is_dir()
+
+
 class TestMigrateData:
     def test_renames_repo_path_to_repo_root(self):
         data = {"repo_path": "/old/path", "worktree_base": "/wt"}
@@ -72,6 +84,38 @@ class TestLoadAndSaveState:
         assert len(loaded.worktrees[0].sessions) == 1
         assert loaded.worktrees[0].sessions[0].label == "test"
 
+    @pytest.mark.usefixtures("_redirect_state_dir")
+    def test_save_skips_unchanged_state(self, fake_config):
+        state = AppState(repo_root=str(fake_config.repo_root), worktree_base="/wt")
+        save_state(state, fake_config)
+        path = _state_file_for(fake_config)
+        mtime = path.stat().st_mtime_ns
+
+        save_state(state, fake_config)
+        assert path.stat().st_mtime_ns == mtime
+
+        state.worktrees.append(Worktree(name="feat", path="/tmp/feat", branch="sw-feat"))
+        save_state(state, fake_config)
+        assert load_state(fake_config).worktrees[0].name == "feat"
+
+    @pytest.mark.usefixtures("_redirect_state_dir")
+    def test_save_rewrites_after_external_change(self, fake_config):
+        state = AppState(repo_root=str(fake_config.repo_root), worktree_base="/wt")
+        save_state(state, fake_config)
+        path = _state_file_for(fake_config)
+        path.write_text(json.dumps({"repo_root": "/other", "worktree_base": "/wt"}))
+
+        save_state(state, fake_config)
+        assert load_state(fake_config).repo_root == str(fake_config.repo_root)
+
+    @pytest.mark.usefixtures("_redirect_state_dir")
+    def test_load_migrates_legacy_field_names(self, fake_config):
+        path = _state_file_for(fake_config)
+        path.write_text(json.dumps({"repo_path": str(fake_config.repo_root), "worktree_base": "/wt"}))
+
+        loaded = load_state(fake_config)
+        assert loaded.repo_root == str(fake_config.repo_root)
+
     @pytest.mark.usefixtures("_redirect_state_dir")
     def test_state_file_is_per_repo(self, fake_config):
         path = _state_file_for(fake_config)
@@ -141,9 +185,50 @@ class TestReconcileState:
             worktrees=[wt1, wt2],
         )
         monkeypatch.setattr("super_worker.services.state.prune_git_cache", lambda paths: None)
+        worktrees = state.worktrees
         changed = reconcile_state(state)
         assert changed is False
-        assert len(state.worktrees) == 2
+        assert state.worktrees is worktrees
+
+    def test_unlistable_parent_prunes_nothing(self, tmp_path, monkeypatch):
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+        state = AppState(
+            repo_root=str(tmp_path),
+            worktree_base=str(tmp_path),
+            worktrees=[Worktree(name=n, path=str(tmp_path / n), branch=f"sw-{n}") for n in ("a", "b")],
+        )
+        monkeypatch.setattr("super_worker.services.state.prune_git_cache", lambda paths: None)
+
+        def failing_scandir(path):
+            raise OSError(24, "Too many open files", path)
+
+        monkeypatch.setattr(os, "scandir", failing_scandir)
+        assert reconcile_state(state) is False
+        assert [wt.name for wt in state.worktrees] == ["a", "b"]
+
+
+class TestExistingDirs:
+    def test_checks_each_parent(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "b").mkdir()
+        (tmp_path / "file").write_text("")
+        paths = [str(tmp_path / "a"), str(tmp_path / "nested" / "b"), str(tmp_path / "file"), "/nonexistent/c"]
+        assert _existing_dirs(paths) == {str(tmp_path / "a"), str(tmp_path / "nested" / "b")}
+
+    def test_trailing_slash(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        assert _existing_dirs([f"{tmp_path}/a/"]) == {f"{tmp_path}/a/"}
+
+    def test_unlistable_parent_falls_back_to_per_path_checks(self, tmp_path, monkeypatch):
+        (tmp_path / "a").mkdir()
+
+        def denied(path):
+            raise PermissionError(13, "Permission denied", path)
+
+        monkeypatch.setattr(os, "scandir", denied)
+        assert _existing_dirs([str(tmp_path / "a"), str(tmp_path / "gone")]) == {str(tmp_path / "a")}
 
 
 class TestProjectsRegistry:
@@ -181,7 +266,7 @@ class TestRecoverDeadSessions:
         wt = Worktree(name="feat", path=str(wt_path), branch="sw-feat", sessions=[s])
         state = AppState(repo_root=str(tmp_path), worktree_base=str(tmp_path), worktrees=[wt])
 
-        monkeypatch.setattr("super_worker.services.state.is_session_alive", lambda name: True)
+        monkeypatch.setattr("super_worker.services.state.get_live_session_names", lambda: {"sw-feat-0"})
 
         changed = recover_dead_sessions(state)
         assert changed is False
@@ -195,7 +280,7 @@ class TestRecoverDeadSessions:
         wt = Worktree(name="feat", path=str(wt_path), branch="sw-feat", sessions=[s])
         state = AppState(repo_root=str(tmp_path), worktree_base=str(tmp_path), worktrees=[wt])
 
-        monkeypatch.setattr("super_worker.services.state.is_session_alive", lambda name: False)
+        monkeypatch.setattr("super_worker.services.state.get_live_session_names", set)
         created_sessions = []
 
         def fake_create(worktree, **kwargs):
@@ -230,10 +315,7 @@ class TestRecoverDeadSessions:
         wt = Worktree(name="feat", path=str(wt_path), branch="sw-feat", sessions=[alive_s, dead_s])
         state = AppState(repo_root=str(tmp_path), worktree_base=str(tmp_path), worktrees=[wt])
 
-        monkeypatch.setattr(
-            "super_worker.services.state.is_session_alive",
-            lambda name: name == "sw-feat-0",
-        )
+        monkeypatch.setattr("super_worker.services.state.get_live_session_names", lambda: {"sw-feat-0"})
 
         def fake_create(worktree, **kwargs):
             new_s = Session(tmux_session_name="sw-feat-2", label=kwargs.get("label", "new"))
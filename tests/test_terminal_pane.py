@@ -0,0 +1,67 @@
+"""Tests for TerminalPane's capture rendering."""
+
+from super_worker.constants import UNFOCUSED_POLL_EVERY
+from super_worker.widgets.terminal_pane import _FRAME_CACHE_SIZE, TerminalPane
+
+
+def _capture_frames(monkeypatch, frames: list[str]):
+    pane = TerminalPane()
+    feed = iter(frames)
+    monkeypatch.setattr("super_worker.widgets.terminal_pane.capture_pane", lambda name: next(feed))
+    results = []
+    for _ in frames:
+        result = pane._capture("sw-feat-0")
+        if result is not None:
+            pane._last_raw = result[0]
+        results.append(result)
+    return pane, results
+
+
+def test_alternating_frames_reuse_rendered_text(monkeypatch):
+    _, results = _capture_frames(monkeypatch, ["\x1b[31mA\x1b[0m", "B", "\x1b[31mA\x1b[0m"])
+
+    assert results[2][1] is results[0][1]
+    assert results[0][1].plain == "A"
+
+
+def test_unchanged_frame_is_skipped(monkeypatch):
+    _, results = _capture_frames(monkeypatch, ["A", "A"])
+
+    assert results[1] is None
+
+
+def test_background_colors_are_stripped(monkeypatch):
+    _, results = _capture_frames(monkeypatch, ["\x1b[41mred bg\x1b[0m"])
+
+    assert results[0][1].plain == "red bg"
+    assert not any(span.style.bgcolor for span in results[0][1].spans)
+
+
+def test_frame_cache_is_bounded(monkeypatch):
+    pane, _ = _capture_frames(monkeypatch, [str(i) for i in range(_FRAME_CACHE_SIZE + 3)])
+
+    assert list(pane._frame_cache) == [str(i) for i in range(3, _FRAME_CACHE_SIZE + 3)]
+
+
+def _count_polls(monkeypatch, *, on_screen: bool, focused: bool, ticks: int) -> int:
+    monkeypatch.setattr(TerminalPane, "is_on_screen", property(lambda self: on_screen))
+    monkeypatch.setattr(TerminalPane, "has_focus", focused)
+    pane = TerminalPane()
+    captures = []
+    monkeypatch.setattr(pane, "_request_capture", lambda: captures.append(1))
+    for _ in range(ticks):
+        pane._poll_pane()
+    return len(captures)
+
+
+def test_focused_pane_captures_every_tick(monkeypatch):
+    assert _count_polls(monkeypatch, on_screen=True, focused=True, ticks=8) == 8
+
+
+def test_unfocused_pane_captures_less_often(monkeypatch):
+    ticks = UNFOCUSED_POLL_EVERY * 3
+    assert _count_polls(monkeypatch, on_screen=True, focused=False, ticks=ticks) == 3
+
+
+def test_hidden_pane_does_not_capture(monkeypatch):
+    assert _count_polls(monkeypatch, on_screen=False, focused=True, ticks=8) == 0
@@ -1,4 +1,5 @@
-from unittest.mock import MagicMock, call
+import subprocess
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -7,16 +8,28 @@ from super_worker.services.tmux import (
     SessionState,
     _find_available_session_name,
     batch_detect_session_states,
+    _state_cache,
     capture_pane,
     create_session,
+    get_live_session_names,
     is_session_alive,
     kill_session,
     kill_all_sessions,
+    kill_sessions_batch,
+    invalidate_session_states,
     send_keys,
     tmux_session_name,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_state_cache():
+    """Clear the session state cache before each test."""
+    _state_cache.clear()
+    yield
+    _state_cache.clear()
+
+
 class TestTmuxSessionName:
     def test_format(self):
         name = tmux_session_name("my-feature", 0)
@@ -26,91 +39,103 @@ class TestTmuxSessionName:
         name = tmux_session_name("feat", 3)
         assert name == "sw-feat-3"
 
-def _mock_server(monkeypatch, session=None, pane=None):
-    """Build a mock libtmux server with optional session and pane."""
-    mock_pane = pane or MagicMock()
-    mock_session = session or MagicMock()
-    mock_session.active_pane = mock_pane
+def _mock_server(monkeypatch, stdout=(), stderr=()):
+    """Build a mock libtmux server whose `cmd` returns the given output."""
     mock_server = MagicMock()
-    mock_server.sessions.get.return_value = mock_session
+    mock_server.cmd.return_value = MagicMock(stdout=list(stdout), stderr=list(stderr))
     monkeypatch.setattr("super_worker.services.tmux.libtmux.Server", lambda: mock_server)
-    return mock_server, mock_session, mock_pane
+    return mock_server
 
 
 class TestCapturePane:
+    def _mock_run(self, monkeypatch, stdout=b"", returncode=0):
+        runs = []
+
+        def run(args, **kwargs):
+            runs.append(args)
+            return subprocess.CompletedProcess(args, returncode, stdout=stdout, stderr=b"")
+
+        monkeypatch.setattr("super_worker.services.tmux._tmux_bin", lambda: "tmux")
+        monkeypatch.setattr("super_worker.services.tmux.subprocess.run", run)
+        return runs
+
     def test_success(self, monkeypatch):
-        _, _, mock_pane = _mock_server(monkeypatch)
-        mock_pane.capture_pane.return_value = ["line1", "line2"]
+        runs = self._mock_run(monkeypatch, stdout=b"line1\nline2\n\n")
 
         output = capture_pane("sw-feat-0")
 
         assert output == "line1\nline2"
-        mock_pane.capture_pane.assert_called_once_with(start=-500, escape_sequences=True)
+        assert runs == [["tmux", "capture-pane", "-p", "-S", "-500", "-e", "-t", "=sw-feat-0:"]]
 
     def test_failure_returns_not_found(self, monkeypatch):
-        mock_server = MagicMock()
-        mock_server.sessions.get.side_effect = Exception("no session")
-        monkeypatch.setattr("super_worker.services.tmux.libtmux.Server", lambda: mock_server)
+        self._mock_run(monkeypatch, returncode=1)
 
         output = capture_pane("sw-dead-0")
 
         assert "not found" in output.lower()
 
+    def test_missing_tmux_returns_not_found(self, monkeypatch):
+        monkeypatch.setattr("super_worker.services.tmux._tmux_bin", lambda: None)
+
+        assert "not found" in capture_pane("sw-feat-0").lower()
+
     def test_empty_output(self, monkeypatch):
-        _, _, mock_pane = _mock_server(monkeypatch)
-        mock_pane.capture_pane.return_value = []
+        self._mock_run(monkeypatch)
 
         output = capture_pane("sw-feat-0")
 
         assert output == ""
 
+    def test_invalid_utf8_is_escaped(self, monkeypatch):
+        self._mock_run(monkeypatch, stdout=b"ok \xff")
+
+        assert capture_pane("sw-feat-0") == "ok \\xff"
+
 
 class TestSendKeys:
     def test_sends_key_to_pane(self, monkeypatch):
-        _, _, mock_pane = _mock_server(monkeypatch)
+        mock_server = _mock_server(monkeypatch)
 
         send_keys("sw-feat-0", "Enter")
 
-        mock_pane.send_keys.assert_called_once_with("Enter", enter=False, literal=False)
+        mock_server.cmd.assert_called_once_with("send-keys", "-t", "=sw-feat-0:", "--", "Enter")
 
     def test_literal_flag(self, monkeypatch):
-        _, _, mock_pane = _mock_server(monkeypatch)
+        mock_server = _mock_server(monkeypatch)
 
-        send_keys("sw-feat-0", "hello", literal=True)
+        send_keys("sw-feat-0", "-hello", literal=True)
 
-        mock_pane.send_keys.assert_called_once_with("hello", enter=False, literal=True)
+        mock_server.cmd.assert_called_once_with("send-keys", "-l", "-t", "=sw-feat-0:", "--", "-hello")
 
     def test_multiple_keys_sent_in_order(self, monkeypatch):
-        _, _, mock_pane = _mock_server(monkeypatch)
+        mock_server = _mock_server(monkeypatch)
 
         send_keys("sw-feat-0", "y", "Enter")
 
-        assert mock_pane.send_keys.call_count == 2
-        mock_pane.send_keys.assert_has_calls([
-            call("y", enter=False, literal=False),
-            call("Enter", enter=False, literal=False),
-        ])
+        mock_server.cmd.assert_called_once_with("send-keys", "-t", "=sw-feat-0:", "--", "y", "Enter")
 
     def test_dead_session_does_not_raise(self, monkeypatch):
         mock_server = MagicMock()
-        mock_server.sessions.get.side_effect = Exception("no session")
+        mock_server.cmd.side_effect = Exception("no server")
         monkeypatch.setattr("super_worker.services.tmux.libtmux.Server", lambda: mock_server)
 
         send_keys("sw-dead-0", "Enter")  # Should not raise
 
 
 class TestBatchDetectSessionStates:
-    def _mock_alive(self, monkeypatch, sessions: list):
+    def _mock_alive(self, monkeypatch, states: dict[str, str]) -> MagicMock:
+        """Mock `tmux list-sessions -F` output: session name -> SW_CC_STATE ('' when unset)."""
         mock_server = MagicMock()
-        mock_server.sessions = sessions
+        mock_server.cmd.return_value = MagicMock(stdout=[f"{name}\t{value}" for name, value in states.items()])
         monkeypatch.setattr("super_worker.services.tmux.libtmux.Server", lambda: mock_server)
+        return mock_server
 
     def test_empty_input(self):
         result = batch_detect_session_states([])
         assert result == {}
 
     def test_all_dead(self, monkeypatch):
-        self._mock_alive(monkeypatch, [])
+        self._mock_alive(monkeypatch, {})
 
         result = batch_detect_session_states(["sw-a-0", "sw-b-0"])
 
@@ -118,39 +143,74 @@ class TestBatchDetectSessionStates:
         assert result["sw-b-0"] == SessionState.DEAD
 
     def test_mixed_alive_and_dead(self, monkeypatch):
-        alive_session = MagicMock()
-        alive_session.session_name = "sw-a-0"
-        alive_session.show_environment.return_value = {"SW_CC_STATE": "waiting_input"}
-        self._mock_alive(monkeypatch, [alive_session])
+        self._mock_alive(monkeypatch, {"sw-a-0": "waiting_input"})
 
         result = batch_detect_session_states(["sw-a-0", "sw-b-0"])
 
         assert result["sw-a-0"] == SessionState.WAITING_INPUT
         assert result["sw-b-0"] == SessionState.DEAD
 
-    @pytest.mark.parametrize("env,expected_state", [
-        ({}, SessionState.RUNNING),
-        ({"SW_CC_STATE": "running"}, SessionState.RUNNING),
-        ({"SW_CC_STATE": "waiting_input"}, SessionState.WAITING_INPUT),
-        ({"SW_CC_STATE": "waiting_approval"}, SessionState.WAITING_APPROVAL),
-        ({"SW_CC_STATE": "unknown_value"}, SessionState.RUNNING),
+    @pytest.mark.parametrize("value,expected_state", [
+        ("", SessionState.RUNNING),
+        ("running", SessionState.RUNNING),
+        ("waiting_input", SessionState.WAITING_INPUT),
+        ("waiting_approval", SessionState.WAITING_APPROVAL),
+        ("unknown_value", SessionState.RUNNING),
     ])
-    def test_alive_session_state(self, monkeypatch, env, expected_state):
-        alive_session = MagicMock()
-        alive_session.session_name = "sw-a-0"
-        alive_session.show_environment.return_value = env
-        self._mock_alive(monkeypatch, [alive_session])
+    def test_alive_session_state(self, monkeypatch, value, expected_state):
+        self._mock_alive(monkeypatch, {"sw-a-0": value})
 
         result = batch_detect_session_states(["sw-a-0"])
 
         assert result["sw-a-0"] == expected_state
 
+    def test_single_tmux_call_for_all_sessions(self, monkeypatch):
+        server = self._mock_alive(monkeypatch, {"sw-a-0": "", "sw-b-0": "waiting_input", "sw-c-0": ""})
+
+        batch_detect_session_states(["sw-a-0", "sw-b-0", "sw-c-0"])
+
+        server.cmd.assert_called_once_with("list-sessions", "-F", "#{session_name}\t#{SW_CC_STATE}")
+
+    def test_tmux_failure_reports_dead(self, monkeypatch):
+        server = self._mock_alive(monkeypatch, {})
+        server.cmd.side_effect = Exception("no server running")
+
+        assert batch_detect_session_states(["sw-a-0"]) == {"sw-a-0": SessionState.DEAD}
+
+    def test_uses_cache_within_ttl(self, monkeypatch):
+        server = self._mock_alive(monkeypatch, {"sw-a-0": "waiting_input"})
+
+        batch_detect_session_states(["sw-a-0"])
+        result = batch_detect_session_states(["sw-a-0"])
+
+        assert result["sw-a-0"] == SessionState.WAITING_INPUT
+        server.cmd.assert_called_once()
+
+    def test_only_fetches_uncached_sessions(self, monkeypatch):
+        server = self._mock_alive(monkeypatch, {"sw-a-0": "", "sw-b-0": ""})
+
+        batch_detect_session_states(["sw-a-0"])
+        batch_detect_session_states(["sw-a-0", "sw-b-0"])
+        batch_detect_session_states(["sw-a-0", "sw-b-0"])
+
+        assert server.cmd.call_count == 2
+
+    def test_invalidate_forces_refetch(self, monkeypatch):
+        server = self._mock_alive(monkeypatch, {"sw-a-0": ""})
+
+        batch_detect_session_states(["sw-a-0"])
+        invalidate_session_states(["sw-a-0"])
+        batch_detect_session_states(["sw-a-0"])
+
+        assert server.cmd.call_count == 2
+
 
 class TestCreateSession:
     def _mock_server(self, monkeypatch, existing_sessions=None):
         mock_tmux_session = MagicMock()
         mock_server = MagicMock()
-        mock_server.sessions = existing_sessions or []
+        names = existing_sessions or []
+        mock_server.cmd.return_value = MagicMock(stdout=list(names), stderr=[])
         mock_server.new_session.return_value = mock_tmux_session
         monkeypatch.setattr("super_worker.services.tmux.libtmux.Server", lambda: mock_server)
         return mock_server
@@ -204,9 +264,7 @@ class TestCreateSession:
         assert "--continue" in cmd
 
     def test_avoids_name_collision(self, monkeypatch):
-        existing = MagicMock()
-        existing.session_name = "sw-feat-0"
-        self._mock_server(monkeypatch, existing_sessions=[existing])
+        self._mock_server(monkeypatch, existing_sessions=["sw-feat-0"])
         wt = Worktree(name="feat", path="/tmp/feat", branch="main")
 
         session = create_session(wt)
@@ -226,6 +284,21 @@ def test_is_session_alive(monkeypatch, found, expected):
     assert is_session_alive("sw-feat-0") is expected
 
 
+def test_get_live_session_names(monkeypatch):
+    server = _server_with_sessions("sw-feat-0", "sw-feat-1")
+    monkeypatch.setattr("super_worker.services.tmux.libtmux.Server", lambda: server)
+
+    assert get_live_session_names() == {"sw-feat-0", "sw-feat-1"}
+
+
+def test_get_live_session_names_on_error(monkeypatch):
+    server = MagicMock()
+    server.cmd.side_effect = Exception("tmux not found")
+    monkeypatch.setattr("super_worker.services.tmux.libtmux.Server", lambda: server)
+
+    assert get_live_session_names() == set()
+
+
 class TestKillSession:
     def test_kills_existing_session(self, monkeypatch):
         mock_session = MagicMock()
@@ -245,14 +318,55 @@ class TestKillSession:
         kill_session("sw-dead-0")  # Should not raise
 
 
-class TestKillAllSessions:
-    def test_kills_all_worktree_sessions(self, monkeypatch):
+def _server_with_sessions(*names, kill_stderr=()):
+    """Mock server whose list-sessions reports `names`; records kill-session chains."""
+    server = MagicMock()
+    server.kill_calls = []
+
+    def cmd(*args):
+        if args[0] == "list-sessions":
+            return MagicMock(stdout=list(names), stderr=[])
+        server.kill_calls.append(args)
+        return MagicMock(stdout=[], stderr=list(kill_stderr))
+
+    server.cmd.side_effect = cmd
+    return server
+
+
+class TestKillSessionsBatch:
+    def test_kills_live_sessions_in_one_command(self, monkeypatch):
+        server = _server_with_sessions("sw-feat-0", "sw-feat-1", "sw-other-0")
+        monkeypatch.setattr("super_worker.services.tmux.libtmux.Server", lambda: server)
+
+        kill_sessions_batch(["sw-feat-0", "sw-gone-0", "sw-feat-1"])
+
+        assert server.kill_calls == [
+            ("kill-session", "-t", "=sw-feat-0", ";", "kill-session", "-t", "=sw-feat-1"),
+        ]
+
+    def test_skips_command_when_nothing_is_alive(self, monkeypatch):
+        server = _server_with_sessions()
+        monkeypatch.setattr("super_worker.services.tmux.libtmux.Server", lambda: server)
+
+        kill_sessions_batch(["sw-gone-0"])
+
+        assert server.kill_calls == []
+
+    def test_falls_back_to_single_kills_on_error(self, monkeypatch):
+        server = _server_with_sessions("sw-feat-0", "sw-feat-1", kill_stderr=["can't find session: =sw-feat-0"])
+        monkeypatch.setattr("super_worker.services.tmux.libtmux.Server", lambda: server)
         killed = []
+        monkeypatch.setattr("super_worker.services.tmux.kill_session", killed.append)
 
-        def fake_kill(name):
-            killed.append(name)
+        kill_sessions_batch(["sw-feat-0", "sw-feat-1"])
 
-        monkeypatch.setattr("super_worker.services.tmux.kill_session", fake_kill)
+        assert killed == ["sw-feat-0", "sw-feat-1"]
+
+
+class TestKillAllSessions:
+    def test_kills_all_worktree_sessions(self, monkeypatch):
+        killed = []
+        monkeypatch.setattr("super_worker.services.tmux.kill_sessions_batch", killed.extend)
         wt = Worktree(name="feat", path="/tmp/feat", branch="main")
         wt.sessions = [
             Session(tmux_session_name="sw-feat-0", label="s0"),
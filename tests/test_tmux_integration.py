@@ -11,6 +11,7 @@ from super_worker.services.tmux import (
     SessionState,
     batch_detect_session_states,
     capture_pane,
+    invalidate_session_states,
 )
 
 
@@ -20,8 +21,10 @@ def real_tmux_session():
     server = libtmux.Server()
     session = server.new_session(session_name="test-integration-session")
 
+    invalidate_session_states()
     yield session
 
+    invalidate_session_states()
     try:
         session.kill()
     except Exception:
@@ -1,3 +1,4 @@
+import os
 import time
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -10,12 +11,18 @@ from super_worker.models import AppState, Worktree
 from super_worker.services.worktree import (
     BranchExistsError,
     _GIT_CACHE_TTL,
+    _add_git_excludes,
+    _branch_exists,
+    _setup_env,
+    _run_post_create_hook,
     _branch_status_cache,
+    _branch_status_fp,
     _dirty_cache,
     create_worktree,
     discover_worktrees,
     get_branch_status,
     get_current_branch,
+    get_git_status,
     get_worktree_dirty,
     invalidate_git_cache,
     prune_git_cache,
@@ -27,9 +34,11 @@ from super_worker.services.worktree import (
 def _clear_caches():
     """Clear module-level caches before each test."""
     _branch_status_cache.clear()
+    _branch_status_fp.clear()
     _dirty_cache.clear()
     yield
     _branch_status_cache.clear()
+    _branch_status_fp.clear()
     _dirty_cache.clear()
 
 
@@ -67,6 +76,24 @@ class TestGetBranchStatus:
         status = get_branch_status("/tmp/wt")
         assert status == {"behind": 0, "ahead": 0}
 
+    def test_failure_keeps_last_good_value(self, monkeypatch):
+        _branch_status_cache["/tmp/wt"] = (time.monotonic() - _GIT_CACHE_TTL - 1, {"behind": 1, "ahead": 4})
+        monkeypatch.setattr(
+            gitpython, "Repo",
+            MagicMock(side_effect=gitpython.GitCommandError("rev-list", 1)),
+        )
+        assert get_branch_status("/tmp/wt") == {"behind": 1, "ahead": 4}
+        assert "/tmp/wt" not in _branch_status_fp
+
+    def test_missing_remote_ref_is_cached_past_ttl(self, tmp_path, monkeypatch):
+        repo = gitpython.Repo.init(tmp_path, initial_branch="main")
+        repo.git.commit("--allow-empty", "-m", "init", author="t <t@t>", env={"GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@t"})
+        assert get_branch_status(str(tmp_path)) == {"behind": 0, "ahead": 0}
+
+        _branch_status_cache[str(tmp_path)] = (time.monotonic() - _GIT_CACHE_TTL - 1, {"behind": 0, "ahead": 0})
+        monkeypatch.setattr(gitpython, "Repo", MagicMock(side_effect=AssertionError("git should not run")))
+        assert get_branch_status(str(tmp_path)) == {"behind": 0, "ahead": 0}
+
     def test_uses_cache_within_ttl(self, monkeypatch):
         call_count = 0
         original_repo = gitpython.Repo
@@ -104,6 +131,70 @@ class TestGetBranchStatus:
         get_branch_status("/tmp/wt")
         assert call_count == 2
 
+    def test_reuses_cache_past_ttl_when_refs_unchanged(self, monkeypatch, tmp_path):
+        git_dir = tmp_path / ".git"
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/feat\n")
+        ref = git_dir / "refs" / "heads" / "feat"
+        ref.write_text("a" * 40 + "\n")
+        call_count = 0
+
+        def counting_repo(*a, **kw):
+            nonlocal call_count
+            call_count += 1
+            mock = MagicMock()
+            mock.git.rev_list.return_value = "1\t2"
+            return mock
+
+        monkeypatch.setattr(gitpython, "Repo", counting_repo)
+        path = str(tmp_path)
+        get_branch_status(path)
+        ts, val = _branch_status_cache[path]
+        _branch_status_cache[path] = (ts - _GIT_CACHE_TTL - 1, val)
+
+        get_branch_status(path)
+        assert call_count == 1
+
+        # A new commit rewrites the branch ref and invalidates the fingerprint
+        ref.write_text("b" * 40 + "\n\n")
+        get_branch_status(path)
+        assert call_count == 2
+
+    def test_ref_replaced_within_same_mtime_invalidates(self, monkeypatch, tmp_path):
+        git_dir = tmp_path / ".git"
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/feat\n")
+        ref = git_dir / "refs" / "heads" / "feat"
+        ref.write_text("a" * 40 + "\n")
+        mock_repo = MagicMock()
+        mock_repo.git.rev_list.return_value = "1\t2"
+        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
+        path = str(tmp_path)
+        get_branch_status(path)
+        ts, val = _branch_status_cache[path]
+        _branch_status_cache[path] = (ts - _GIT_CACHE_TTL - 1, val)
+
+        # Same size and mtime, but a new inode, as git's lock-file rename produces
+        st = ref.stat()
+        new_ref = ref.with_name("feat.lock")
+        new_ref.write_text("b" * 40 + "\n")
+        os.utime(new_ref, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(new_ref, ref)
+        mock_repo.git.rev_list.return_value = "0\t3"
+
+        assert get_branch_status(path) == {"behind": 0, "ahead": 3}
+
+    def test_skips_ref_stat_within_ttl(self, monkeypatch):
+        mock_repo = MagicMock()
+        mock_repo.git.rev_list.return_value = "1\t2"
+        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
+        get_branch_status("/tmp/wt")
+
+        fingerprint = MagicMock()
+        monkeypatch.setattr("super_worker.services.worktree._branch_status_fingerprint", fingerprint)
+        get_branch_status("/tmp/wt")
+        fingerprint.assert_not_called()
+
     def test_uses_custom_remote_and_branch(self, monkeypatch):
         mock_repo = MagicMock()
         mock_repo.git.rev_list.return_value = "0\t0"
@@ -117,16 +208,32 @@ class TestGetBranchStatus:
 class TestGetWorktreeDirty:
     def test_dirty_when_repo_is_dirty(self, monkeypatch):
         mock_repo = MagicMock()
-        mock_repo.is_dirty.return_value = True
+        mock_repo.git.status.return_value = " M file.py"
         monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
         assert get_worktree_dirty("/tmp/wt") is True
 
     def test_clean_when_repo_is_clean(self, monkeypatch):
         mock_repo = MagicMock()
-        mock_repo.is_dirty.return_value = False
+        mock_repo.git.status.return_value = ""
         monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
         assert get_worktree_dirty("/tmp/wt") is False
 
+    def test_failure_keeps_last_good_value(self, monkeypatch):
+        _dirty_cache["/tmp/wt"] = (time.monotonic() - _GIT_CACHE_TTL - 1, True)
+        monkeypatch.setattr(
+            gitpython, "Repo",
+            MagicMock(side_effect=gitpython.GitCommandError("status", 128)),
+        )
+        assert get_worktree_dirty("/tmp/wt") is True
+
+    def test_untracked_file_counts_as_dirty(self, tmp_path):
+        gitpython.Repo.init(tmp_path)
+        assert get_worktree_dirty(str(tmp_path)) is False
+
+        invalidate_git_cache(str(tmp_path))
+        (tmp_path / "new.txt").write_text("x")
+        assert get_worktree_dirty(str(tmp_path)) is True
+
     def test_uses_cache(self, monkeypatch):
         call_count = 0
 
@@ -134,7 +241,7 @@ class TestGetWorktreeDirty:
             nonlocal call_count
             call_count += 1
             mock = MagicMock()
-            mock.is_dirty.return_value = True
+            mock.git.status.return_value = " M file.py"
             return mock
 
         monkeypatch.setattr(gitpython, "Repo", counting_repo)
@@ -143,11 +250,29 @@ class TestGetWorktreeDirty:
         assert call_count == 1
 
 
+class TestGetGitStatus:
+    def test_returns_status_and_dirty(self, monkeypatch):
+        mock_repo = MagicMock()
+        mock_repo.git.rev_list.return_value = "1\t2"
+        mock_repo.git.status.return_value = " M file.py"
+        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
+
+        assert get_git_status("/tmp/a") == ({"behind": 1, "ahead": 2}, True)
+
+    def test_skips_dirty_check_when_excluded(self, monkeypatch):
+        mock_repo = MagicMock()
+        mock_repo.git.rev_list.return_value = "0\t0"
+        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
+
+        assert get_git_status("/tmp/a", include_dirty=False) == ({"behind": 0, "ahead": 0}, False)
+        mock_repo.git.status.assert_not_called()
+
+
 class TestInvalidateGitCache:
     def test_clears_both_caches(self, monkeypatch):
         mock_repo = MagicMock()
         mock_repo.git.rev_list.return_value = "1\t2"
-        mock_repo.is_dirty.return_value = True
+        mock_repo.git.status.return_value = " M file.py"
         monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
 
         get_branch_status("/tmp/wt")
@@ -203,6 +328,25 @@ class TestGetCurrentBranch:
         )
         assert get_current_branch("/tmp/repo") == "(unknown)"
 
+    def test_reads_head_without_gitpython(self, monkeypatch, tmp_path):
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/sw-feat/sub\n")
+        monkeypatch.setattr(gitpython, "Repo", MagicMock(side_effect=AssertionError("spawned git")))
+        assert get_current_branch(str(tmp_path)) == "sw-feat/sub"
+
+
+class TestBranchExists:
+    def test_reads_loose_and_packed_refs(self, tmp_path):
+        repo = gitpython.Repo.init(tmp_path, initial_branch="main")
+        repo.git.commit("--allow-empty", "-m", "init", author="t <t@t>", env={"GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@t"})
+        repo.git.branch("sw-packed/feat")
+        repo.git.pack_refs("--all")
+        repo.git.branch("sw-loose")
+
+        assert _branch_exists(repo, "sw-packed/feat")
+        assert _branch_exists(repo, "sw-loose")
+        assert not _branch_exists(repo, "sw-missing")
+
 
 class TestCreateWorktree:
     def _make_config(self, tmp_path):
@@ -229,7 +373,7 @@ class TestCreateWorktree:
         config = self._make_config(tmp_path)
 
         mock_repo = MagicMock()
-        mock_repo.git.rev_parse.side_effect = gitpython.GitCommandError("rev-parse", 1)
+        mock_repo.heads.__getitem__.side_effect = IndexError
         monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
 
         wt = create_worktree(config, "feat")
@@ -249,7 +393,7 @@ class TestCreateWorktree:
         config = self._make_config(tmp_path)
 
         mock_repo = MagicMock()
-        mock_repo.git.rev_parse.return_value = ""
+        mock_repo.heads.__getitem__.return_value = MagicMock()
         monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
 
         with pytest.raises(BranchExistsError) as exc_info:
@@ -260,7 +404,7 @@ class TestCreateWorktree:
         config = self._make_config(tmp_path)
 
         mock_repo = MagicMock()
-        mock_repo.git.rev_parse.return_value = ""
+        mock_repo.heads.__getitem__.return_value = MagicMock()
         monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
 
         wt = create_worktree(config, "feat", use_existing_branch=True)
@@ -285,7 +429,7 @@ class TestCreateWorktree:
         config = self._make_config(tmp_path)
 
         mock_repo = MagicMock()
-        mock_repo.git.rev_parse.side_effect = gitpython.GitCommandError("rev-parse", 1)
+        mock_repo.heads.__getitem__.side_effect = IndexError
         mock_repo.git.worktree.side_effect = gitpython.GitCommandError("worktree", 1, stderr="fatal: error")
         monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
 
@@ -293,6 +437,120 @@ class TestCreateWorktree:
             create_worktree(config, "feat")
 
 
+class TestRunPostCreateHook:
+    def _write_hook(self, wt_path: Path, body: str) -> str:
+        hook = wt_path / "hook.sh"
+        hook.write_text(f"#!/bin/sh\n{body}\n")
+        hook.chmod(0o755)
+        return "hook.sh"
+
+    def test_runs_in_foreground_by_default(self, tmp_path):
+        hook = self._write_hook(tmp_path, 'echo "$2" > ran')
+
+        assert _run_post_create_hook(hook, tmp_path, 3) is None
+        assert (tmp_path / "ran").read_text() == "3\n"
+
+    def test_background_returns_before_hook_finishes(self, tmp_path):
+        hook = self._write_hook(tmp_path, "sleep 0.3; touch ran")
+
+        waiter = _run_post_create_hook(hook, tmp_path, 0, background=True)
+
+        assert not (tmp_path / "ran").exists()
+        waiter.join(timeout=5)
+        assert (tmp_path / "ran").exists()
+
+    def test_background_failure_is_logged(self, tmp_path, caplog):
+        hook = self._write_hook(tmp_path, "echo boom >&2; exit 2")
+
+        _run_post_create_hook(hook, tmp_path, 0, background=True).join(timeout=5)
+
+        record = next(r for r in caplog.records if r.message == "Post-create hook failed")
+        assert record.returncode == 2
+        assert "boom" in record.stderr
+
+    def test_background_timeout_kills_hook(self, tmp_path, monkeypatch, caplog):
+        monkeypatch.setattr("super_worker.services.worktree._HOOK_TIMEOUT_S", 0.2)
+        hook = self._write_hook(tmp_path, "sleep 5")
+
+        _run_post_create_hook(hook, tmp_path, 0, background=True).join(timeout=5)
+
+        assert any(r.message == "Post-create hook timed out" for r in caplog.records)
+
+
+class TestAddGitExcludes:
+    def test_linked_worktree_writes_shared_exclude(self, tmp_path):
+        common = tmp_path / "repo" / ".git"
+        git_dir = common / "worktrees" / "wt"
+        git_dir.mkdir(parents=True)
+        (git_dir / "commondir").write_text("../..\n")
+        wt = tmp_path / "wt"
+        wt.mkdir()
+        (wt / ".git").write_text(f"gitdir: {git_dir}\n")
+
+        _add_git_excludes(wt, [".venv", ".env"])
+        _add_git_excludes(wt, [".venv"])
+
+        assert (common / "info" / "exclude").read_text() == ".venv\n.env\n"
+
+    def test_appends_after_unterminated_last_line(self, tmp_path):
+        (tmp_path / ".git" / "info").mkdir(parents=True)
+        exclude = tmp_path / ".git" / "info" / "exclude"
+        exclude.write_text("*.log")
+
+        _add_git_excludes(tmp_path, [".venv", "*.log"])
+
+        assert exclude.read_text() == "*.log\n.venv\n"
+
+    def test_not_a_repo_is_ignored(self, tmp_path):
+        _add_git_excludes(tmp_path, [".venv"])
+        assert not (tmp_path / "info").exists()
+
+
+class TestSetupEnv:
+    def _config(self, tmp_path, symlinks, copies):
+        return ResolvedConfig(
+            repo_root=tmp_path / "repo",
+            base_dir=tmp_path,
+            worktree_prefix="sw",
+            branch_prefix="sw-",
+            main_branch="main",
+            remote="origin",
+            symlinks=symlinks,
+            copies=copies,
+            post_create_hook="",
+            commit_placeholder="",
+            name_placeholder="",
+            branch_placeholder="",
+        )
+
+    def test_links_and_copies_existing_paths_only(self, tmp_path):
+        repo = tmp_path / "repo"
+        (repo / ".venv").mkdir(parents=True)
+        (repo / ".env").write_text("KEY=1\n")
+        wt = tmp_path / "wt"
+        (wt / ".git" / "info").mkdir(parents=True)
+        (wt / "node_modules").mkdir()
+
+        _setup_env(repo, wt, self._config(tmp_path, [".venv", "node_modules", "missing"], [".env", "missing.env"]))
+
+        assert (wt / ".venv").resolve() == (repo / ".venv").resolve()
+        assert not (wt / "node_modules").is_symlink()
+        assert not (wt / "missing").exists()
+        assert (wt / ".env").read_text() == "KEY=1\n"
+        assert not (wt / "missing.env").exists()
+        assert (wt / ".git" / "info" / "exclude").read_text() == ".venv\n"
+
+    def test_copy_into_missing_directory_still_raises(self, tmp_path):
+        repo = tmp_path / "repo"
+        (repo / "conf").mkdir(parents=True)
+        (repo / "conf" / "local.toml").write_text("")
+        wt = tmp_path / "wt"
+        wt.mkdir()
+
+        with pytest.raises(FileNotFoundError):
+            _setup_env(repo, wt, self._config(tmp_path, [], ["conf/local.toml"]))
+
+
 class TestRemoveWorktree:
     def test_removes_successfully(self, tmp_path, monkeypatch):
         wt_path = tmp_path / "wt"
@@ -306,7 +564,7 @@ class TestRemoveWorktree:
         monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
 
         remove_worktree(state, "feat")
-        mock_repo.git.worktree.assert_any_call("remove", str(wt_path))
+        mock_repo.git.worktree.assert_called_once_with("remove", str(wt_path))
 
     def test_raises_for_unknown_worktree(self, tmp_path):
         state = AppState(repo_root=str(tmp_path), worktree_base=str(tmp_path))
@@ -344,6 +602,23 @@ class TestRemoveWorktree:
         remove_worktree(state, "feat", force=True)
         mock_repo.git.worktree.assert_any_call("remove", "--force", str(wt_path))
 
+    def test_force_cleanup_prunes_after_git_failure(self, tmp_path, monkeypatch):
+        wt_path = tmp_path / "wt"
+        wt_path.mkdir()
+        state = AppState(
+            repo_root=str(tmp_path),
+            worktree_base=str(tmp_path),
+            worktrees=[Worktree(name="feat", path=str(wt_path), branch="sw-feat")],
+        )
+        mock_repo = MagicMock()
+        mock_repo.git.worktree.side_effect = [gitpython.GitCommandError("worktree", 128), ""]
+        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
+
+        remove_worktree(state, "feat", force=True)
+
+        assert not wt_path.exists()
+        mock_repo.git.worktree.assert_called_with("prune")
+
 
 class TestDiscoverWorktrees:
     def _make_config(self, tmp_path):
@@ -366,105 +641,76 @@ class TestDiscoverWorktrees:
             branch_placeholder="",
         )
 
-    def _porcelain(self, entries: list[tuple[str, str]]) -> str:
-        """Build porcelain output from (path, branch_or_special) pairs."""
-        blocks = []
-        for path, ref in entries:
-            if ref == "detached":
-                blocks.append(f"worktree {path}\nHEAD abc123\ndetached\n")
-            else:
-                blocks.append(f"worktree {path}\nHEAD abc123\nbranch refs/heads/{ref}\n")
-        return "\n".join(blocks)
-
-    def test_discovers_matching_worktrees(self, tmp_path, monkeypatch):
+    def _add_linked(self, config, name: str, head: str, relative: bool = False) -> str:
+        """Register a linked worktree the way `git worktree add` lays it out on disk."""
+        admin = config.repo_root / ".git" / "worktrees" / name
+        admin.mkdir(parents=True)
+        wt_path = config.base_dir / name
+        gitdir = Path("../../../..") / config.base_dir.name / name / ".git" if relative else wt_path / ".git"
+        (admin / "gitdir").write_text(f"{gitdir}\n")
+        (admin / "HEAD").write_text(f"{head}\n")
+        return str(wt_path)
+
+    def test_discovers_matching_worktrees(self, tmp_path):
         config = self._make_config(tmp_path)
-        repo_root = str(config.repo_root)
-        output = self._porcelain([
-            (repo_root, "main"),
-            (str(tmp_path / "worktrees" / "sw-alpha"), "sw-alpha"),
-            (str(tmp_path / "worktrees" / "sw-beta"), "sw-beta"),
-        ])
-        mock_repo = MagicMock()
-        mock_repo.git.worktree.return_value = output
-        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
+        self._add_linked(config, "sw-alpha", "ref: refs/heads/sw-alpha")
+        self._add_linked(config, "sw-beta", "ref: refs/heads/sw-beta")
 
         result = discover_worktrees(config)
 
-        assert len(result) == 2
-        names = {wt.name for wt in result}
-        assert names == {"alpha", "beta"}
+        assert [(wt.name, wt.branch) for wt in result] == [("alpha", "sw-alpha"), ("beta", "sw-beta")]
+        assert result[0].path == str(config.base_dir / "sw-alpha")
 
-    def test_skips_main_repo(self, tmp_path, monkeypatch):
+    def test_skips_main_repo(self, tmp_path):
         config = self._make_config(tmp_path)
-        repo_root = str(config.repo_root)
-        output = self._porcelain([
-            (repo_root, "main"),
-        ])
-        mock_repo = MagicMock()
-        mock_repo.git.worktree.return_value = output
-        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
+        (config.repo_root / ".git").mkdir()
 
         result = discover_worktrees(config)
 
         assert result == []
 
-    def test_skips_non_matching_prefix(self, tmp_path, monkeypatch):
+    def test_skips_non_matching_prefix(self, tmp_path):
         config = self._make_config(tmp_path)
-        repo_root = str(config.repo_root)
-        output = self._porcelain([
-            (repo_root, "main"),
-            (str(tmp_path / "worktrees" / "other-feat"), "other-feat"),
-            (str(tmp_path / "worktrees" / "sw-match"), "sw-match"),
-        ])
-        mock_repo = MagicMock()
-        mock_repo.git.worktree.return_value = output
-        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
+        self._add_linked(config, "other-feat", "ref: refs/heads/other-feat")
+        self._add_linked(config, "sw-match", "ref: refs/heads/sw-match")
 
         result = discover_worktrees(config)
 
         assert len(result) == 1
         assert result[0].name == "match"
 
-    def test_handles_detached_head(self, tmp_path, monkeypatch):
+    def test_handles_detached_head(self, tmp_path):
         config = self._make_config(tmp_path)
-        repo_root = str(config.repo_root)
-        output = self._porcelain([
-            (repo_root, "main"),
-            (str(tmp_path / "worktrees" / "sw-detached"), "detached"),
-        ])
-        mock_repo = MagicMock()
-        mock_repo.git.worktree.return_value = output
-        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
+        self._add_linked(config, "sw-detached", "a" * 40)
 
         result = discover_worktrees(config)
 
         assert len(result) == 1
         assert result[0].branch == "(detached)"
 
-    def test_returns_empty_on_git_error(self, tmp_path, monkeypatch):
+    def test_relative_gitdir(self, tmp_path):
+        config = self._make_config(tmp_path)
+        path = self._add_linked(config, "sw-rel", "ref: refs/heads/sw-rel", relative=True)
+
+        result = discover_worktrees(config)
+
+        assert [wt.path for wt in result] == [path]
+
+    def test_returns_empty_when_not_a_repo(self, tmp_path):
         config = self._make_config(tmp_path)
-        monkeypatch.setattr(
-            gitpython, "Repo",
-            MagicMock(side_effect=gitpython.GitCommandError("worktree", 1)),
-        )
 
         result = discover_worktrees(config)
 
         assert result == []
 
-    def test_handles_no_trailing_blank_line(self, tmp_path, monkeypatch):
+    def test_matches_git_worktree_list(self, tmp_path):
         config = self._make_config(tmp_path)
-        repo_root = str(config.repo_root)
-        # Build output that doesn't end with a blank line
-        output = (
-            f"worktree {repo_root}\nHEAD abc123\nbranch refs/heads/main\n\n"
-            f"worktree {tmp_path / 'worktrees' / 'sw-last'}\nHEAD abc123\nbranch refs/heads/sw-last"
-        )
-        mock_repo = MagicMock()
-        mock_repo.git.worktree.return_value = output
-        monkeypatch.setattr(gitpython, "Repo", lambda *a, **kw: mock_repo)
+        repo = gitpython.Repo.init(config.repo_root, initial_branch="main")
+        repo.git.commit("--allow-empty", "-m", "init", author="t <t@t>", env={"GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@t"})
+        repo.git.worktree("add", str(config.base_dir / "sw-feat"), "-b", "sw-feat")
 
         result = discover_worktrees(config)
 
-        assert len(result) == 1
-        assert result[0].name == "last"
+        assert [(wt.name, wt.path, wt.branch) for wt in result] == [
+            ("feat", str(config.base_dir / "sw-feat"), "sw-feat"),
+        ]